@@ -1,3 +1,6 @@
+import hashlib
+import os
+import tempfile
 from enum import Enum
 from typing import (
     Any,
@@ -11,9 +14,11 @@ from typing import (
     Type,
     TypeVar,
     Union,
+    cast,
 )
 
 from fastapi import routing
+from fastapi.concurrency import ThreadpoolLimiter
 from fastapi.datastructures import Default, DefaultPlaceholder
 from fastapi.exception_handlers import (
     http_exception_handler,
@@ -27,7 +32,7 @@ from fastapi.openapi.docs import (
     get_swagger_ui_html,
     get_swagger_ui_oauth2_redirect_html,
 )
-from fastapi.openapi.utils import get_openapi
+from fastapi.openapi.utils import get_openapi, get_openapi_cache_key
 from fastapi.params import Depends
 from fastapi.types import DecoratedCallable, IncEx
 from fastapi.utils import generate_unique_id
@@ -40,7 +45,7 @@ from starlette.requests import Request
 from starlette.responses import HTMLResponse, JSONResponse, Response
 from starlette.routing import BaseRoute
 from starlette.types import ASGIApp, Lifespan, Receive, Scope, Send
-from typing_extensions import Annotated, Doc, deprecated
+from typing_extensions import Annotated, Doc, Literal, deprecated
 
 AppType = TypeVar("AppType", bound="FastAPI")
 
@@ -810,6 +815,45 @@ class FastAPI(Starlette):
                 """
             ),
         ] = True,
+        compiled_dispatch: Annotated[
+            bool,
+            Doc(
+                """
+                Dispatch requests through a radix tree of the routes' static path
+                segments instead of trying every route in order.
+
+                Matching behaves the same, it only skips routes that can't match,
+                which makes a difference for apps with many routes. The index is
+                rebuilt automatically when routes are added.
+                """
+            ),
+        ] = False,
+        openapi_cache_dir: Annotated[
+            Optional[Union[str, "os.PathLike[str]"]],
+            Doc(
+                """
+                A directory to cache the generated OpenAPI schema in, as the JSON
+                served at `openapi_url`.
+
+                The file name has a hash of everything the schema is generated from:
+                the routes, the OpenAPI settings, the parameters and models with the
+                values of their fields (like defaults, even if they are read from the
+                environment), the security schemes, and the source of the modules
+                that define them. So each worker process (and each deploy with the
+                same code and settings) loads the schema generated by the first one
+                instead of generating it again.
+
+                It can be precomputed at build time by calling `app.openapi_json()`.
+
+                Files in the directory are never removed, as other deploys sharing it
+                may still use them, clean it up as part of the deployment if needed.
+
+                It's not used if `app.openapi()` is overridden or `app.openapi_schema`
+                was already set, as the cache key can't take those customizations
+                into account.
+                """
+            ),
+        ] = None,
         **extra: Annotated[
             Any,
             Doc(
@@ -871,6 +915,10 @@ class FastAPI(Starlette):
             ),
         ] = "3.1.0"
         self.openapi_schema: Optional[Dict[str, Any]] = None
+        self.openapi_cache_dir = openapi_cache_dir
+        # The OpenAPI schema encoded as served, and its ETag
+        self._openapi_json: Optional[bytes] = None
+        self._openapi_etag: Optional[str] = None
         if self.openapi_url:
             assert self.title, "A title must be provided for OpenAPI, e.g.: 'My API'"
             assert self.version, "A version must be provided for OpenAPI, e.g.: '2.1.0'"
@@ -943,6 +991,7 @@ class FastAPI(Starlette):
             include_in_schema=include_in_schema,
             responses=responses,
             generate_unique_id_function=generate_unique_id_function,
+            compiled_dispatch=compiled_dispatch,
         )
         self.exception_handlers: Dict[
             Any, Callable[[Request, Any], Union[Response, Awaitable[Response]]]
@@ -995,18 +1044,96 @@ class FastAPI(Starlette):
             )
         return self.openapi_schema
 
+    def _get_openapi_cache_path(self) -> Optional[str]:
+        if self.openapi_cache_dir is None:
+            return None
+        if (
+            "openapi" in self.__dict__
+            or type(self).openapi is not FastAPI.openapi
+            or self.openapi_schema
+        ):
+            # The schema is customized, the cache key can't account for it
+            return None
+        key = get_openapi_cache_key(
+            routes=self.routes,
+            webhooks=self.webhooks.routes,
+            title=self.title,
+            version=self.version,
+            openapi_version=self.openapi_version,
+            summary=self.summary,
+            description=self.description,
+            terms_of_service=self.terms_of_service,
+            contact=self.contact,
+            license_info=self.license_info,
+            tags=self.openapi_tags,
+            servers=self.servers,
+            separate_input_output_schemas=self.separate_input_output_schemas,
+        )
+        return os.path.join(self.openapi_cache_dir, f"openapi-{key}.json")
+
+    def openapi_json(self) -> bytes:
+        """
+        The OpenAPI schema of the application encoded as JSON, as served at
+        `openapi_url`. It is encoded only once.
+
+        With `openapi_cache_dir`, it's loaded from the cache when the routes
+        haven't changed, and written to it otherwise, calling this at build time
+        precomputes the schema for all the workers.
+        """
+        if self._openapi_json is None:
+            cache_path = self._get_openapi_cache_path()
+            content: Optional[bytes] = None
+            if cache_path is not None:
+                try:
+                    with open(cache_path, "rb") as cache_file:
+                        content = cache_file.read()
+                except OSError:
+                    pass
+            if content is None:
+                content = JSONResponse(self.openapi()).body
+                if cache_path is not None:
+                    self._write_openapi_cache(cache_path, content)
+            self._openapi_etag = f'"{hashlib.sha256(content).hexdigest()[:32]}"'
+            self._openapi_json = content
+        return self._openapi_json
+
+    def _write_openapi_cache(self, cache_path: str, content: bytes) -> None:
+        # Written to a temporary file first, so that other workers never load a
+        # partially written schema
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path))
+            try:
+                with os.fdopen(fd, "wb") as tmp_file:
+                    tmp_file.write(content)
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Could not write the OpenAPI cache {cache_path}: {e}")
+
     def setup(self) -> None:
         if self.openapi_url:
             urls = (server_data.get("url") for server_data in self.servers)
             server_urls = {url for url in urls if url}
 
-            async def openapi(req: Request) -> JSONResponse:
+            async def openapi(req: Request) -> Response:
                 root_path = req.scope.get("root_path", "").rstrip("/")
                 if root_path not in server_urls:
                     if root_path and self.root_path_in_servers:
                         self.servers.insert(0, {"url": root_path})
                         server_urls.add(root_path)
-                return JSONResponse(self.openapi())
+                content = self.openapi_json()
+                headers = {"ETag": cast(str, self._openapi_etag)}
+                if_none_match = req.headers.get("if-none-match")
+                if if_none_match is not None:
+                    # A list of entity tags, compared weakly, or "*"
+                    tags = [tag.strip() for tag in if_none_match.split(",")]
+                    tags = [tag[2:] if tag.startswith("W/") else tag for tag in tags]
+                    if "*" in tags or self._openapi_etag in tags:
+                        return Response(status_code=304, headers=headers)
+                return Response(content, media_type="application/json", headers=headers)
 
             self.add_route(self.openapi_url, openapi, include_in_schema=False)
         if self.openapi_url and self.docs_url:
@@ -1084,6 +1211,9 @@ class FastAPI(Starlette):
         generate_unique_id_function: Callable[[routing.APIRoute], str] = Default(
             generate_unique_id
         ),
+        concurrent_dependencies: bool = False,
+        response_model_validate: Literal["full", "serialize_only"] = "full",
+        threadpool_limiter: Optional[ThreadpoolLimiter] = None,
     ) -> None:
         self.router.add_api_route(
             path,
@@ -1110,6 +1240,9 @@ class FastAPI(Starlette):
             name=name,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            concurrent_dependencies=concurrent_dependencies,
+            response_model_validate=response_model_validate,
+            threadpool_limiter=threadpool_limiter,
         )
 
     def api_route(
@@ -1140,6 +1273,9 @@ class FastAPI(Starlette):
         generate_unique_id_function: Callable[[routing.APIRoute], str] = Default(
             generate_unique_id
         ),
+        concurrent_dependencies: bool = False,
+        response_model_validate: Literal["full", "serialize_only"] = "full",
+        threadpool_limiter: Optional[ThreadpoolLimiter] = None,
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         def decorator(func: DecoratedCallable) -> DecoratedCallable:
             self.router.add_api_route(
@@ -1167,6 +1303,9 @@ class FastAPI(Starlette):
                 name=name,
                 openapi_extra=openapi_extra,
                 generate_unique_id_function=generate_unique_id_function,
+                concurrent_dependencies=concurrent_dependencies,
+                response_model_validate=response_model_validate,
+                threadpool_limiter=threadpool_limiter,
             )
             return func
 
@@ -1425,6 +1564,17 @@ class FastAPI(Starlette):
                 """
             ),
         ] = Default(generate_unique_id),
+        threadpool_limiter: Annotated[
+            Optional[ThreadpoolLimiter],
+            Doc(
+                """
+                A `ThreadpoolLimiter` to run the *path operation functions* in this
+                router and their dependencies in, when they are not `async`, for
+                the *path operations* that don't already have one of their own or
+                of the included router.
+                """
+            ),
+        ] = None,
     ) -> None:
         """
         Include an `APIRouter` in the same app.
@@ -1455,6 +1605,7 @@ class FastAPI(Starlette):
             default_response_class=default_response_class,
             callbacks=callbacks,
             generate_unique_id_function=generate_unique_id_function,
+            threadpool_limiter=threadpool_limiter,
         )
 
     def get(
@@ -1788,6 +1939,53 @@ class FastAPI(Starlette):
                 """
             ),
         ] = Default(generate_unique_id),
+        concurrent_dependencies: Annotated[
+            bool,
+            Doc(
+                """
+                Resolve the independent async dependencies of this *path
+                operation* concurrently instead of one after another.
+
+                Sibling dependencies that are `async def` functions (or async
+                generators) and don't share any sub-dependencies are run together
+                in an AnyIO task group. Cached values, the exit order of
+                dependencies with `yield`, and validation errors are the same as
+                when they run sequentially.
+
+                To opt in a single dependency instead, use
+                `Depends(..., concurrent=True)`.
+                """
+            ),
+        ] = False,
+        response_model_validate: Annotated[
+            Literal["full", "serialize_only"],
+            Doc(
+                """
+                How the returned value is checked against the response model.
+
+                By default (`"full"`), the returned data is validated with the response
+                model before it's serialized, for `def` functions in a threadpool.
+
+                With `"serialize_only"`, a returned value that is already an instance of
+                the response model (or a list of them), for example a Pydantic model built
+                by the *path operation function*, is serialized directly, skipping the
+                validation pass and the threadpool hop. Any other value is validated as
+                with `"full"`.
+                """
+            ),
+        ] = "full",
+        threadpool_limiter: Annotated[
+            Optional[ThreadpoolLimiter],
+            Doc(
+                """
+                A `ThreadpoolLimiter` to run the *path operation function* and its
+                dependencies in, when they are not `async`, instead of the threadpool
+                shared with the rest of the app.
+
+                By default, the one of the router, if any.
+                """
+            ),
+        ] = None,
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP GET operation.
@@ -1828,6 +2026,9 @@ class FastAPI(Starlette):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            concurrent_dependencies=concurrent_dependencies,
+            response_model_validate=response_model_validate,
+            threadpool_limiter=threadpool_limiter,
         )
 
     def put(
@@ -2161,6 +2362,53 @@ class FastAPI(Starlette):
                 """
             ),
         ] = Default(generate_unique_id),
+        concurrent_dependencies: Annotated[
+            bool,
+            Doc(
+                """
+                Resolve the independent async dependencies of this *path
+                operation* concurrently instead of one after another.
+
+                Sibling dependencies that are `async def` functions (or async
+                generators) and don't share any sub-dependencies are run together
+                in an AnyIO task group. Cached values, the exit order of
+                dependencies with `yield`, and validation errors are the same as
+                when they run sequentially.
+
+                To opt in a single dependency instead, use
+                `Depends(..., concurrent=True)`.
+                """
+            ),
+        ] = False,
+        response_model_validate: Annotated[
+            Literal["full", "serialize_only"],
+            Doc(
+                """
+                How the returned value is checked against the response model.
+
+                By default (`"full"`), the returned data is validated with the response
+                model before it's serialized, for `def` functions in a threadpool.
+
+                With `"serialize_only"`, a returned value that is already an instance of
+                the response model (or a list of them), for example a Pydantic model built
+                by the *path operation function*, is serialized directly, skipping the
+                validation pass and the threadpool hop. Any other value is validated as
+                with `"full"`.
+                """
+            ),
+        ] = "full",
+        threadpool_limiter: Annotated[
+            Optional[ThreadpoolLimiter],
+            Doc(
+                """
+                A `ThreadpoolLimiter` to run the *path operation function* and its
+                dependencies in, when they are not `async`, instead of the threadpool
+                shared with the rest of the app.
+
+                By default, the one of the router, if any.
+                """
+            ),
+        ] = None,
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP PUT operation.
@@ -2206,6 +2454,9 @@ class FastAPI(Starlette):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            concurrent_dependencies=concurrent_dependencies,
+            response_model_validate=response_model_validate,
+            threadpool_limiter=threadpool_limiter,
         )
 
     def post(
@@ -2539,6 +2790,53 @@ class FastAPI(Starlette):
                 """
             ),
         ] = Default(generate_unique_id),
+        concurrent_dependencies: Annotated[
+            bool,
+            Doc(
+                """
+                Resolve the independent async dependencies of this *path
+                operation* concurrently instead of one after another.
+
+                Sibling dependencies that are `async def` functions (or async
+                generators) and don't share any sub-dependencies are run together
+                in an AnyIO task group. Cached values, the exit order of
+                dependencies with `yield`, and validation errors are the same as
+                when they run sequentially.
+
+                To opt in a single dependency instead, use
+                `Depends(..., concurrent=True)`.
+                """
+            ),
+        ] = False,
+        response_model_validate: Annotated[
+            Literal["full", "serialize_only"],
+            Doc(
+                """
+                How the returned value is checked against the response model.
+
+                By default (`"full"`), the returned data is validated with the response
+                model before it's serialized, for `def` functions in a threadpool.
+
+                With `"serialize_only"`, a returned value that is already an instance of
+                the response model (or a list of them), for example a Pydantic model built
+                by the *path operation function*, is serialized directly, skipping the
+                validation pass and the threadpool hop. Any other value is validated as
+                with `"full"`.
+                """
+            ),
+        ] = "full",
+        threadpool_limiter: Annotated[
+            Optional[ThreadpoolLimiter],
+            Doc(
+                """
+                A `ThreadpoolLimiter` to run the *path operation function* and its
+                dependencies in, when they are not `async`, instead of the threadpool
+                shared with the rest of the app.
+
+                By default, the one of the router, if any.
+                """
+            ),
+        ] = None,
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP POST operation.
@@ -2584,6 +2882,9 @@ class FastAPI(Starlette):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            concurrent_dependencies=concurrent_dependencies,
+            response_model_validate=response_model_validate,
+            threadpool_limiter=threadpool_limiter,
         )
 
     def delete(
@@ -2917,6 +3218,53 @@ class FastAPI(Starlette):
                 """
             ),
         ] = Default(generate_unique_id),
+        concurrent_dependencies: Annotated[
+            bool,
+            Doc(
+                """
+                Resolve the independent async dependencies of this *path
+                operation* concurrently instead of one after another.
+
+                Sibling dependencies that are `async def` functions (or async
+                generators) and don't share any sub-dependencies are run together
+                in an AnyIO task group. Cached values, the exit order of
+                dependencies with `yield`, and validation errors are the same as
+                when they run sequentially.
+
+                To opt in a single dependency instead, use
+                `Depends(..., concurrent=True)`.
+                """
+            ),
+        ] = False,
+        response_model_validate: Annotated[
+            Literal["full", "serialize_only"],
+            Doc(
+                """
+                How the returned value is checked against the response model.
+
+                By default (`"full"`), the returned data is validated with the response
+                model before it's serialized, for `def` functions in a threadpool.
+
+                With `"serialize_only"`, a returned value that is already an instance of
+                the response model (or a list of them), for example a Pydantic model built
+                by the *path operation function*, is serialized directly, skipping the
+                validation pass and the threadpool hop. Any other value is validated as
+                with `"full"`.
+                """
+            ),
+        ] = "full",
+        threadpool_limiter: Annotated[
+            Optional[ThreadpoolLimiter],
+            Doc(
+                """
+                A `ThreadpoolLimiter` to run the *path operation function* and its
+                dependencies in, when they are not `async`, instead of the threadpool
+                shared with the rest of the app.
+
+                By default, the one of the router, if any.
+                """
+            ),
+        ] = None,
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP DELETE operation.
@@ -2957,6 +3305,9 @@ class FastAPI(Starlette):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            concurrent_dependencies=concurrent_dependencies,
+            response_model_validate=response_model_validate,
+            threadpool_limiter=threadpool_limiter,
         )
 
     def options(
@@ -3290,6 +3641,53 @@ class FastAPI(Starlette):
                 """
             ),
         ] = Default(generate_unique_id),
+        concurrent_dependencies: Annotated[
+            bool,
+            Doc(
+                """
+                Resolve the independent async dependencies of this *path
+                operation* concurrently instead of one after another.
+
+                Sibling dependencies that are `async def` functions (or async
+                generators) and don't share any sub-dependencies are run together
+                in an AnyIO task group. Cached values, the exit order of
+                dependencies with `yield`, and validation errors are the same as
+                when they run sequentially.
+
+                To opt in a single dependency instead, use
+                `Depends(..., concurrent=True)`.
+                """
+            ),
+        ] = False,
+        response_model_validate: Annotated[
+            Literal["full", "serialize_only"],
+            Doc(
+                """
+                How the returned value is checked against the response model.
+
+                By default (`"full"`), the returned data is validated with the response
+                model before it's serialized, for `def` functions in a threadpool.
+
+                With `"serialize_only"`, a returned value that is already an instance of
+                the response model (or a list of them), for example a Pydantic model built
+                by the *path operation function*, is serialized directly, skipping the
+                validation pass and the threadpool hop. Any other value is validated as
+                with `"full"`.
+                """
+            ),
+        ] = "full",
+        threadpool_limiter: Annotated[
+            Optional[ThreadpoolLimiter],
+            Doc(
+                """
+                A `ThreadpoolLimiter` to run the *path operation function* and its
+                dependencies in, when they are not `async`, instead of the threadpool
+                shared with the rest of the app.
+
+                By default, the one of the router, if any.
+                """
+            ),
+        ] = None,
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP OPTIONS operation.
@@ -3330,6 +3728,9 @@ class FastAPI(Starlette):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            concurrent_dependencies=concurrent_dependencies,
+            response_model_validate=response_model_validate,
+            threadpool_limiter=threadpool_limiter,
         )
 
     def head(
@@ -3663,6 +4064,53 @@ class FastAPI(Starlette):
                 """
             ),
         ] = Default(generate_unique_id),
+        concurrent_dependencies: Annotated[
+            bool,
+            Doc(
+                """
+                Resolve the independent async dependencies of this *path
+                operation* concurrently instead of one after another.
+
+                Sibling dependencies that are `async def` functions (or async
+                generators) and don't share any sub-dependencies are run together
+                in an AnyIO task group. Cached values, the exit order of
+                dependencies with `yield`, and validation errors are the same as
+                when they run sequentially.
+
+                To opt in a single dependency instead, use
+                `Depends(..., concurrent=True)`.
+                """
+            ),
+        ] = False,
+        response_model_validate: Annotated[
+            Literal["full", "serialize_only"],
+            Doc(
+                """
+                How the returned value is checked against the response model.
+
+                By default (`"full"`), the returned data is validated with the response
+                model before it's serialized, for `def` functions in a threadpool.
+
+                With `"serialize_only"`, a returned value that is already an instance of
+                the response model (or a list of them), for example a Pydantic model built
+                by the *path operation function*, is serialized directly, skipping the
+                validation pass and the threadpool hop. Any other value is validated as
+                with `"full"`.
+                """
+            ),
+        ] = "full",
+        threadpool_limiter: Annotated[
+            Optional[ThreadpoolLimiter],
+            Doc(
+                """
+                A `ThreadpoolLimiter` to run the *path operation function* and its
+                dependencies in, when they are not `async`, instead of the threadpool
+                shared with the rest of the app.
+
+                By default, the one of the router, if any.
+                """
+            ),
+        ] = None,
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP HEAD operation.
@@ -3703,6 +4151,9 @@ class FastAPI(Starlette):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            concurrent_dependencies=concurrent_dependencies,
+            response_model_validate=response_model_validate,
+            threadpool_limiter=threadpool_limiter,
         )
 
     def patch(
@@ -4036,6 +4487,53 @@ class FastAPI(Starlette):
                 """
             ),
         ] = Default(generate_unique_id),
+        concurrent_dependencies: Annotated[
+            bool,
+            Doc(
+                """
+                Resolve the independent async dependencies of this *path
+                operation* concurrently instead of one after another.
+
+                Sibling dependencies that are `async def` functions (or async
+                generators) and don't share any sub-dependencies are run together
+                in an AnyIO task group. Cached values, the exit order of
+                dependencies with `yield`, and validation errors are the same as
+                when they run sequentially.
+
+                To opt in a single dependency instead, use
+                `Depends(..., concurrent=True)`.
+                """
+            ),
+        ] = False,
+        response_model_validate: Annotated[
+            Literal["full", "serialize_only"],
+            Doc(
+                """
+                How the returned value is checked against the response model.
+
+                By default (`"full"`), the returned data is validated with the response
+                model before it's serialized, for `def` functions in a threadpool.
+
+                With `"serialize_only"`, a returned value that is already an instance of
+                the response model (or a list of them), for example a Pydantic model built
+                by the *path operation function*, is serialized directly, skipping the
+                validation pass and the threadpool hop. Any other value is validated as
+                with `"full"`.
+                """
+            ),
+        ] = "full",
+        threadpool_limiter: Annotated[
+            Optional[ThreadpoolLimiter],
+            Doc(
+                """
+                A `ThreadpoolLimiter` to run the *path operation function* and its
+                dependencies in, when they are not `async`, instead of the threadpool
+                shared with the rest of the app.
+
+                By default, the one of the router, if any.
+                """
+            ),
+        ] = None,
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP PATCH operation.
@@ -4081,6 +4579,9 @@ class FastAPI(Starlette):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            concurrent_dependencies=concurrent_dependencies,
+            response_model_validate=response_model_validate,
+            threadpool_limiter=threadpool_limiter,
         )
 
     def trace(
@@ -4414,6 +4915,53 @@ class FastAPI(Starlette):
                 """
             ),
         ] = Default(generate_unique_id),
+        concurrent_dependencies: Annotated[
+            bool,
+            Doc(
+                """
+                Resolve the independent async dependencies of this *path
+                operation* concurrently instead of one after another.
+
+                Sibling dependencies that are `async def` functions (or async
+                generators) and don't share any sub-dependencies are run together
+                in an AnyIO task group. Cached values, the exit order of
+                dependencies with `yield`, and validation errors are the same as
+                when they run sequentially.
+
+                To opt in a single dependency instead, use
+                `Depends(..., concurrent=True)`.
+                """
+            ),
+        ] = False,
+        response_model_validate: Annotated[
+            Literal["full", "serialize_only"],
+            Doc(
+                """
+                How the returned value is checked against the response model.
+
+                By default (`"full"`), the returned data is validated with the response
+                model before it's serialized, for `def` functions in a threadpool.
+
+                With `"serialize_only"`, a returned value that is already an instance of
+                the response model (or a list of them), for example a Pydantic model built
+                by the *path operation function*, is serialized directly, skipping the
+                validation pass and the threadpool hop. Any other value is validated as
+                with `"full"`.
+                """
+            ),
+        ] = "full",
+        threadpool_limiter: Annotated[
+            Optional[ThreadpoolLimiter],
+            Doc(
+                """
+                A `ThreadpoolLimiter` to run the *path operation function* and its
+                dependencies in, when they are not `async`, instead of the threadpool
+                shared with the rest of the app.
+
+                By default, the one of the router, if any.
+                """
+            ),
+        ] = None,
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP TRACE operation.
@@ -4454,6 +5002,9 @@ class FastAPI(Starlette):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            concurrent_dependencies=concurrent_dependencies,
+            response_model_validate=response_model_validate,
+            threadpool_limiter=threadpool_limiter,
         )
 
     def websocket_route(
@@ -1,8 +1,13 @@
+import functools
+import math
+import time
 from contextlib import asynccontextmanager as asynccontextmanager
-from typing import AsyncGenerator, ContextManager, TypeVar
+from dataclasses import dataclass
+from typing import Any, AsyncGenerator, Callable, ContextManager, Optional, TypeVar
 
 import anyio.to_thread
 from anyio import CapacityLimiter
+from fastapi.exceptions import HTTPException
 from starlette.concurrency import iterate_in_threadpool as iterate_in_threadpool  # noqa
 from starlette.concurrency import run_in_threadpool as run_in_threadpool  # noqa
 from starlette.concurrency import (  # noqa
@@ -12,9 +17,105 @@ from starlette.concurrency import (  # noqa
 _T = TypeVar("_T")
 
 
+@dataclass
+class ThreadpoolLimiterStatistics:
+    total_tokens: float
+    borrowed_tokens: int
+    # Calls currently waiting for a thread, and the most seen at once
+    waiting: int
+    max_waiting_seen: int
+    # Calls that got a thread, and how long they waited for it, in seconds
+    calls: int
+    total_wait_time: float
+    max_wait_time: float
+    # Calls rejected with a 503 because the queue was full
+    rejected: int
+
+
+class ThreadpoolLimiter:
+    """
+    Limit how many sync path operation functions and sync dependencies of the
+    routes that use it run in threads at the same time, separately from the
+    global threadpool limiter shared by the rest of the app, so that slow sync
+    routes can't take all the threads.
+
+    When `max_waiting` calls are already waiting for a thread, new calls fail
+    right away with a `503 Service Unavailable` instead of queueing.
+
+    `total_tokens`, the number of threads, has to be given explicitly and be
+    finite, a limiter is only useful if it's bounded.
+    """
+
+    def __init__(self, total_tokens: int, *, max_waiting: Optional[int] = None):
+        if not isinstance(total_tokens, int) or total_tokens < 1:
+            raise ValueError("total_tokens must be a positive integer")
+        self.limiter = CapacityLimiter(total_tokens)
+        # The threads are limited by `self.limiter`, the limiter passed to anyio
+        # only keeps it from also taking a token of the global one
+        self._thread_limiter = CapacityLimiter(math.inf)
+        self.max_waiting = max_waiting
+        self.waiting = 0
+        self.max_waiting_seen = 0
+        self.calls = 0
+        self.total_wait_time = 0.0
+        self.max_wait_time = 0.0
+        self.rejected = 0
+
+    def statistics(self) -> ThreadpoolLimiterStatistics:
+        return ThreadpoolLimiterStatistics(
+            total_tokens=self.limiter.total_tokens,
+            borrowed_tokens=self.limiter.borrowed_tokens,
+            waiting=self.waiting,
+            max_waiting_seen=self.max_waiting_seen,
+            calls=self.calls,
+            total_wait_time=self.total_wait_time,
+            max_wait_time=self.max_wait_time,
+            rejected=self.rejected,
+        )
+
+    async def run_sync(self, func: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+        if (
+            self.max_waiting is not None
+            and self.limiter.available_tokens < 1
+            and self.waiting >= self.max_waiting
+        ):
+            self.rejected += 1
+            raise HTTPException(status_code=503)
+        self.waiting += 1
+        self.max_waiting_seen = max(self.max_waiting_seen, self.waiting)
+        start = time.perf_counter()
+        try:
+            await self.limiter.acquire()
+        finally:
+            self.waiting -= 1
+        wait_time = time.perf_counter() - start
+        self.calls += 1
+        self.total_wait_time += wait_time
+        self.max_wait_time = max(self.max_wait_time, wait_time)
+        try:
+            return await anyio.to_thread.run_sync(
+                functools.partial(func, *args, **kwargs),
+                limiter=self._thread_limiter,
+            )
+        finally:
+            self.limiter.release()
+
+
+async def run_in_limited_threadpool(
+    limiter: Optional[ThreadpoolLimiter],
+    func: Callable[..., _T],
+    *args: Any,
+    **kwargs: Any,
+) -> _T:
+    if limiter is None:
+        return await run_in_threadpool(func, *args, **kwargs)
+    return await limiter.run_sync(func, *args, **kwargs)
+
+
 @asynccontextmanager
 async def contextmanager_in_threadpool(
     cm: ContextManager[_T],
+    limiter: Optional[ThreadpoolLimiter] = None,
 ) -> AsyncGenerator[_T, None]:
     # blocking __exit__ from running waiting on a free thread
     # can create race conditions/deadlocks if the context manager itself
@@ -24,7 +125,7 @@ async def contextmanager_in_threadpool(
     # works (1 is arbitrary)
     exit_limiter = CapacityLimiter(1)
     try:
-        yield await run_in_threadpool(cm.__enter__)
+        yield await run_in_limited_threadpool(limiter, cm.__enter__)
     except Exception as e:
         ok = bool(
             await anyio.to_thread.run_sync(
@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import Any, Callable, List, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 from fastapi._compat import ModelField
 from fastapi.security.base import SecurityBase
@@ -28,10 +28,52 @@ class Dependant:
     response_param_name: Optional[str] = None
     background_tasks_param_name: Optional[str] = None
     security_scopes_param_name: Optional[str] = None
+    # Parameter annotated as `AsyncIterator[Item]` that receives the JSON array
+    # request body as it's streamed, the field validates each item
+    body_stream_field: Optional[ModelField] = None
     security_scopes: Optional[List[str]] = None
     use_cache: bool = True
+    # For a sub-dependency, whether it may run concurrently with its siblings. For
+    # the dependant of a path operation, whether all of its dependencies may.
+    concurrent: bool = False
     path: Optional[str] = None
     cache_key: Tuple[Optional[Callable[..., Any]], Tuple[str, ...]] = field(init=False)
+    plan: Optional["DependencyPlan"] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         self.cache_key = (self.call, tuple(sorted(set(self.security_scopes or []))))
+
+
+@dataclass
+class DependencyPlanStep:
+    # The dependant whose parameters are extracted for this step, after applying
+    # any dependency override.
+    dependant: Dependant
+    call: Optional[Callable[..., Any]]
+    # One of "generator", "async_generator", "coroutine", "sync", or "root" for
+    # the last step, which is never called.
+    call_kind: str
+    name: Optional[str]
+    use_cache: bool
+    cache_key: Tuple[Optional[Callable[..., Any]], Tuple[str, ...]]
+    # Indexes (into `DependencyPlan.steps`) of the steps whose results are passed
+    # to this one.
+    sub_steps: List[int]
+
+
+@dataclass
+class DependencyPlan:
+    # The dependency tree flattened in post-order: every step comes after the
+    # steps it depends on, and the root dependant is the last step.
+    steps: List[DependencyPlanStep]
+    # The overrides the plan was built with, to detect when it's outdated.
+    dependency_overrides: Dict[Callable[..., Any], Callable[..., Any]]
+    # Sibling subtrees solved concurrently, as (start, stop) step ranges, by the
+    # index of their first step. Groups starting at the same step are nested, the
+    # outermost comes first.
+    concurrent_groups: Dict[int, List[List[Tuple[int, int]]]] = field(
+        default_factory=dict
+    )
+    uses_background_tasks: bool = False
@@ -1,9 +1,13 @@
+import codecs
+import collections.abc
 import inspect
+import json
 from contextlib import AsyncExitStack, contextmanager
 from copy import copy, deepcopy
 from dataclasses import dataclass
 from typing import (
     Any,
+    AsyncIterator,
     Callable,
     Coroutine,
     Dict,
@@ -12,6 +16,7 @@ from typing import (
     Mapping,
     Optional,
     Sequence,
+    Set,
     Tuple,
     Type,
     Union,
@@ -26,6 +31,7 @@ from fastapi._compat import (
     ModelField,
     RequiredParam,
     Undefined,
+    _normalize_errors,
     _regenerate_error_with_loc,
     copy_field_info,
     create_body_model,
@@ -48,10 +54,18 @@ from fastapi._compat import (
 )
 from fastapi.background import BackgroundTasks
 from fastapi.concurrency import (
+    ThreadpoolLimiter,
     asynccontextmanager,
     contextmanager_in_threadpool,
+    run_in_limited_threadpool,
 )
-from fastapi.dependencies.models import Dependant, SecurityRequirement
+from fastapi.dependencies.models import (
+    Dependant,
+    DependencyPlan,
+    DependencyPlanStep,
+    SecurityRequirement,
+)
+from fastapi.exceptions import HTTPException, RequestValidationError
 from fastapi.logger import logger
 from fastapi.security.base import SecurityBase
 from fastapi.security.oauth2 import OAuth2, SecurityScopes
@@ -60,7 +74,6 @@ from fastapi.utils import create_model_field, get_path_param_names
 from pydantic import BaseModel
 from pydantic.fields import FieldInfo
 from starlette.background import BackgroundTasks as StarletteBackgroundTasks
-from starlette.concurrency import run_in_threadpool
 from starlette.datastructures import (
     FormData,
     Headers,
@@ -165,6 +178,7 @@ def get_sub_dependant(
         name=name,
         security_scopes=security_scopes,
         use_cache=depends.use_cache,
+        concurrent=depends.concurrent,
     )
     if security_requirement:
         sub_dependant.security_requirements.append(security_requirement)
@@ -269,6 +283,7 @@ def get_dependant(
     name: Optional[str] = None,
     security_scopes: Optional[List[str]] = None,
     use_cache: bool = True,
+    concurrent: bool = False,
 ) -> Dependant:
     path_param_names = get_path_param_names(path)
     endpoint_signature = get_typed_signature(call)
@@ -279,8 +294,22 @@ def get_dependant(
         path=path,
         security_scopes=security_scopes,
         use_cache=use_cache,
+        concurrent=concurrent,
     )
     for param_name, param in signature_params.items():
+        # Only a body parameter streams, `AsyncIterator[T] = Depends(gen)` stays a
+        # dependency
+        if is_body_stream_annotation(param.annotation) and (
+            param.default is inspect.Signature.empty
+            or isinstance(param.default, params.Body)
+        ):
+            assert dependant.body_stream_field is None, (
+                "Only one parameter can stream the request body"
+            )
+            dependant.body_stream_field = create_body_stream_field(
+                param_name=param_name, annotation=param.annotation
+            )
+            continue
         is_path_param = param_name in path_param_names
         param_details = analyze_param(
             param_name=param_name,
@@ -338,6 +367,44 @@ def add_non_field_param_to_dependency(
     return None
 
 
+def is_body_stream_annotation(annotation: Any) -> bool:
+    return get_origin(annotation) in (
+        collections.abc.AsyncIterator,
+        collections.abc.AsyncIterable,
+    )
+
+
+def create_body_stream_field(*, param_name: str, annotation: Any) -> ModelField:
+    # The field validates each item of the streamed JSON array
+    item_type = next(iter(get_args(annotation)), Any)
+    return create_model_field(
+        name=param_name,
+        type_=item_type,
+        required=True,
+        alias=param_name,
+        field_info=params.Body(annotation=item_type),
+    )
+
+
+def get_body_stream_field(dependant: Dependant) -> Optional[ModelField]:
+    """
+    Get the field of the parameter, in the path operation or any of its
+    dependencies, that receives the request body as an `AsyncIterator` of
+    validated items, if there is one.
+    """
+    fields: Dict[Any, ModelField] = {}
+
+    def collect(sub_dependant: Dependant) -> None:
+        if sub_dependant.body_stream_field is not None:
+            fields.setdefault(sub_dependant.cache_key, sub_dependant.body_stream_field)
+        for sub in sub_dependant.dependencies:
+            collect(sub)
+
+    collect(dependant)
+    assert len(fields) <= 1, "Only one parameter can stream the request body"
+    return next(iter(fields.values()), None)
+
+
 @dataclass
 class ParamDetails:
     type_annotation: Any
@@ -569,79 +636,136 @@ class SolvedDependency:
     dependency_cache: Dict[Tuple[Callable[..., Any], Tuple[str]], Any]
 
 
-async def solve_dependencies(
+def get_call_kind(call: Callable[..., Any]) -> str:
+    if is_gen_callable(call):
+        return "generator"
+    if is_async_gen_callable(call):
+        return "async_generator"
+    if is_coroutine_callable(call):
+        return "coroutine"
+    return "sync"
+
+
+def compile_dependency_plan(
+    dependant: Dependant,
+    dependency_overrides: Dict[Callable[..., Any], Callable[..., Any]],
+) -> DependencyPlan:
+    steps: List[DependencyPlanStep] = []
+    # For each step, the index of the first step of its subtree and the cache keys
+    # used anywhere in it.
+    subtree_starts: List[int] = []
+    subtree_keys: List[Set[Any]] = []
+    concurrent_groups: Dict[int, List[List[Tuple[int, int]]]] = {}
+    all_concurrent = dependant.concurrent
+
+    def add_concurrent_group(group: List[int]) -> None:
+        if len(group) < 2:
+            return
+        ranges = [(subtree_starts[index], index + 1) for index in group]
+        # Groups that start at the same step are nested, the outermost goes first
+        concurrent_groups.setdefault(ranges[0][0], []).insert(0, ranges)
+
+    def add_steps(
+        step_dependant: Dependant, sub_dependant: Optional[Dependant]
+    ) -> int:
+        subtree_start = len(steps)
+        keys: Set[Any] = set()
+        sub_steps: List[int] = []
+        group: List[int] = []
+        group_keys: Set[Any] = set()
+        for sub in step_dependant.dependencies:
+            use_sub = sub
+            if dependency_overrides:
+                original_call = cast(Callable[..., Any], sub.call)
+                call = dependency_overrides.get(original_call, original_call)
+                use_sub = get_dependant(
+                    path=cast(str, sub.path),
+                    call=call,
+                    name=sub.name,
+                    security_scopes=sub.security_scopes,
+                )
+            sub_index = add_steps(use_sub, sub)
+            sub_steps.append(sub_index)
+            keys |= subtree_keys[sub_index]
+            # Consecutive async siblings can run together as long as they don't
+            # share any (possibly cached) sub-dependency.
+            if (all_concurrent or sub.concurrent) and steps[
+                sub_index
+            ].call_kind in ("coroutine", "async_generator"):
+                if group_keys.isdisjoint(subtree_keys[sub_index]):
+                    group.append(sub_index)
+                    group_keys |= subtree_keys[sub_index]
+                    continue
+                add_concurrent_group(group)
+                group = [sub_index]
+                group_keys = set(subtree_keys[sub_index])
+                continue
+            add_concurrent_group(group)
+            group = []
+            group_keys = set()
+        add_concurrent_group(group)
+        # Caching is keyed on the original dependency, even when it's overridden.
+        if sub_dependant is None:
+            call_kind = "root"
+            cache_dependant = step_dependant
+        else:
+            call_kind = get_call_kind(cast(Callable[..., Any], step_dependant.call))
+            cache_dependant = sub_dependant
+        keys.add(cache_dependant.cache_key)
+        steps.append(
+            DependencyPlanStep(
+                dependant=step_dependant,
+                call=step_dependant.call,
+                call_kind=call_kind,
+                name=cache_dependant.name,
+                use_cache=cache_dependant.use_cache,
+                cache_key=cache_dependant.cache_key,
+                sub_steps=sub_steps,
+            )
+        )
+        subtree_starts.append(subtree_start)
+        subtree_keys.append(keys)
+        return len(steps) - 1
+
+    add_steps(dependant, None)
+    return DependencyPlan(
+        steps=steps,
+        dependency_overrides=dict(dependency_overrides),
+        concurrent_groups=concurrent_groups,
+        uses_background_tasks=any(
+            step.dependant.background_tasks_param_name for step in steps
+        ),
+    )
+
+
+def get_dependency_plan(
+    dependant: Dependant, dependency_overrides_provider: Optional[Any] = None
+) -> DependencyPlan:
+    """
+    Return the execution plan for `dependant`, compiling it on first use and
+    again whenever the provider's `dependency_overrides` have changed.
+    """
+    dependency_overrides = (
+        getattr(dependency_overrides_provider, "dependency_overrides", None) or {}
+    )
+    plan = dependant.plan
+    if plan is None or plan.dependency_overrides != dependency_overrides:
+        plan = compile_dependency_plan(dependant, dependency_overrides)
+        dependant.plan = plan
+    return plan
+
+
+async def _solve_dependant_params(
     *,
     request: Union[Request, WebSocket],
     dependant: Dependant,
-    body: Optional[Union[Dict[str, Any], FormData]] = None,
-    background_tasks: Optional[StarletteBackgroundTasks] = None,
-    response: Optional[Response] = None,
-    dependency_overrides_provider: Optional[Any] = None,
-    dependency_cache: Optional[Dict[Tuple[Callable[..., Any], Tuple[str]], Any]] = None,
-    async_exit_stack: AsyncExitStack,
+    body: Optional[Union[Dict[str, Any], FormData]],
+    background_tasks: Optional[StarletteBackgroundTasks],
+    response: Response,
     embed_body_fields: bool,
-) -> SolvedDependency:
-    values: Dict[str, Any] = {}
-    errors: List[Any] = []
-    if response is None:
-        response = Response()
-        del response.headers["content-length"]
-        response.status_code = None  # type: ignore
-    dependency_cache = dependency_cache or {}
-    sub_dependant: Dependant
-    for sub_dependant in dependant.dependencies:
-        sub_dependant.call = cast(Callable[..., Any], sub_dependant.call)
-        sub_dependant.cache_key = cast(
-            Tuple[Callable[..., Any], Tuple[str]], sub_dependant.cache_key
-        )
-        call = sub_dependant.call
-        use_sub_dependant = sub_dependant
-        if (
-            dependency_overrides_provider
-            and dependency_overrides_provider.dependency_overrides
-        ):
-            original_call = sub_dependant.call
-            call = getattr(
-                dependency_overrides_provider, "dependency_overrides", {}
-            ).get(original_call, original_call)
-            use_path: str = sub_dependant.path  # type: ignore
-            use_sub_dependant = get_dependant(
-                path=use_path,
-                call=call,
-                name=sub_dependant.name,
-                security_scopes=sub_dependant.security_scopes,
-            )
-
-        solved_result = await solve_dependencies(
-            request=request,
-            dependant=use_sub_dependant,
-            body=body,
-            background_tasks=background_tasks,
-            response=response,
-            dependency_overrides_provider=dependency_overrides_provider,
-            dependency_cache=dependency_cache,
-            async_exit_stack=async_exit_stack,
-            embed_body_fields=embed_body_fields,
-        )
-        background_tasks = solved_result.background_tasks
-        dependency_cache.update(solved_result.dependency_cache)
-        if solved_result.errors:
-            errors.extend(solved_result.errors)
-            continue
-        if sub_dependant.use_cache and sub_dependant.cache_key in dependency_cache:
-            solved = dependency_cache[sub_dependant.cache_key]
-        elif is_gen_callable(call) or is_async_gen_callable(call):
-            solved = await solve_generator(
-                call=call, stack=async_exit_stack, sub_values=solved_result.values
-            )
-        elif is_coroutine_callable(call):
-            solved = await call(**solved_result.values)
-        else:
-            solved = await run_in_threadpool(call, **solved_result.values)
-        if sub_dependant.name is not None:
-            values[sub_dependant.name] = solved
-        if sub_dependant.cache_key not in dependency_cache:
-            dependency_cache[sub_dependant.cache_key] = solved
+    values: Dict[str, Any],
+    errors: List[Any],
+) -> Optional[StarletteBackgroundTasks]:
     path_values, path_errors = request_params_to_args(
         dependant.path_params, request.path_params
     )
@@ -686,6 +810,202 @@ async def solve_dependencies(
         values[dependant.security_scopes_param_name] = SecurityScopes(
             scopes=dependant.security_scopes
         )
+    if dependant.body_stream_field is not None and isinstance(request, Request):
+        values[dependant.body_stream_field.name] = iter_body_stream(
+            request, dependant.body_stream_field
+        )
+    return background_tasks
+
+
+async def _solve_steps(
+    *,
+    plan: DependencyPlan,
+    start: int,
+    stop: int,
+    skip_groups: int = 0,
+    results: List[Tuple[Any, List[Any]]],
+    request: Union[Request, WebSocket],
+    body: Optional[Union[Dict[str, Any], FormData]],
+    background_tasks: Optional[StarletteBackgroundTasks],
+    response: Response,
+    dependency_cache: Dict[Tuple[Callable[..., Any], Tuple[str]], Any],
+    async_exit_stack: AsyncExitStack,
+    embed_body_fields: bool,
+    threadpool_limiter: Optional[ThreadpoolLimiter] = None,
+) -> Optional[StarletteBackgroundTasks]:
+    index = start
+    while index < stop:
+        groups = plan.concurrent_groups.get(index)
+        if groups is not None and len(groups) > skip_groups:
+            group = groups[skip_groups]
+            await _solve_concurrent_steps(
+                plan=plan,
+                group=group,
+                skip_groups=skip_groups + 1,
+                results=results,
+                request=request,
+                body=body,
+                background_tasks=background_tasks,
+                response=response,
+                dependency_cache=dependency_cache,
+                async_exit_stack=async_exit_stack,
+                embed_body_fields=embed_body_fields,
+                threadpool_limiter=threadpool_limiter,
+            )
+            index = group[-1][1]
+            skip_groups = 0
+            continue
+        skip_groups = 0
+        step = plan.steps[index]
+        values: Dict[str, Any] = {}
+        errors: List[Any] = []
+        for sub_index in step.sub_steps:
+            sub_solved, sub_errors = results[sub_index]
+            if sub_errors:
+                errors.extend(sub_errors)
+                continue
+            sub_name = plan.steps[sub_index].name
+            if sub_name is not None:
+                values[sub_name] = sub_solved
+        background_tasks = await _solve_dependant_params(
+            request=request,
+            dependant=step.dependant,
+            body=body,
+            background_tasks=background_tasks,
+            response=response,
+            embed_body_fields=embed_body_fields,
+            values=values,
+            errors=errors,
+        )
+        solved: Any = None
+        if step.call_kind == "root":
+            # The "solved value" of the root step is the values for the endpoint
+            solved = values
+        elif not errors:
+            call = cast(Callable[..., Any], step.call)
+            cache_key = cast(Tuple[Callable[..., Any], Tuple[str]], step.cache_key)
+            if step.use_cache and cache_key in dependency_cache:
+                solved = dependency_cache[cache_key]
+            elif step.call_kind == "generator":
+                solved = await async_exit_stack.enter_async_context(
+                    contextmanager_in_threadpool(
+                        contextmanager(call)(**values), limiter=threadpool_limiter
+                    )
+                )
+            elif step.call_kind == "async_generator":
+                solved = await async_exit_stack.enter_async_context(
+                    asynccontextmanager(call)(**values)
+                )
+            elif step.call_kind == "coroutine":
+                solved = await call(**values)
+            else:
+                solved = await run_in_limited_threadpool(
+                    threadpool_limiter, call, **values
+                )
+            if cache_key not in dependency_cache:
+                dependency_cache[cache_key] = solved
+        results[index] = (solved, errors)
+        index += 1
+    return background_tasks
+
+
+async def _solve_concurrent_steps(
+    *,
+    plan: DependencyPlan,
+    group: List[Tuple[int, int]],
+    skip_groups: int,
+    results: List[Tuple[Any, List[Any]]],
+    request: Union[Request, WebSocket],
+    body: Optional[Union[Dict[str, Any], FormData]],
+    background_tasks: Optional[StarletteBackgroundTasks],
+    response: Response,
+    dependency_cache: Dict[Tuple[Callable[..., Any], Tuple[str]], Any],
+    async_exit_stack: AsyncExitStack,
+    embed_body_fields: bool,
+    threadpool_limiter: Optional[ThreadpoolLimiter] = None,
+) -> None:
+    # Each sibling enters its dependencies with `yield` in its own exit stack. The
+    # stacks are pushed in declaration order, before the siblings start, so that
+    # they exit in the same order as if the siblings had been solved sequentially,
+    # and the teardown of what was entered still runs if a sibling fails or the
+    # request is cancelled.
+    # The siblings run in their own tasks, so context variables they set don't
+    # reach the path operation function.
+    exit_stacks = [AsyncExitStack() for _ in group]
+    for exit_stack in exit_stacks:
+        await async_exit_stack.enter_async_context(exit_stack)
+    raised: List[Optional[Exception]] = [None] * len(group)
+
+    async def solve_sibling(position: int, start: int, stop: int) -> None:
+        try:
+            await _solve_steps(
+                plan=plan,
+                start=start,
+                stop=stop,
+                skip_groups=skip_groups if position == 0 else 0,
+                results=results,
+                request=request,
+                body=body,
+                background_tasks=background_tasks,
+                response=response,
+                dependency_cache=dependency_cache,
+                async_exit_stack=exit_stacks[position],
+                embed_body_fields=embed_body_fields,
+                threadpool_limiter=threadpool_limiter,
+            )
+        except Exception as e:
+            # Don't let one failing sibling cancel the others, the first error in
+            # declaration order is re-raised below, like the sequential solver would
+            raised[position] = e
+
+    async with anyio.create_task_group() as tg:
+        for position, (start, stop) in enumerate(group):
+            tg.start_soon(solve_sibling, position, start, stop)
+    for e in raised:
+        if e is not None:
+            raise e
+
+
+async def solve_dependencies(
+    *,
+    request: Union[Request, WebSocket],
+    dependant: Dependant,
+    body: Optional[Union[Dict[str, Any], FormData]] = None,
+    background_tasks: Optional[StarletteBackgroundTasks] = None,
+    response: Optional[Response] = None,
+    dependency_overrides_provider: Optional[Any] = None,
+    dependency_cache: Optional[Dict[Tuple[Callable[..., Any], Tuple[str]], Any]] = None,
+    async_exit_stack: AsyncExitStack,
+    embed_body_fields: bool,
+    threadpool_limiter: Optional[ThreadpoolLimiter] = None,
+) -> SolvedDependency:
+    if response is None:
+        response = Response()
+        del response.headers["content-length"]
+        response.status_code = None  # type: ignore
+    dependency_cache = dependency_cache or {}
+    plan = get_dependency_plan(dependant, dependency_overrides_provider)
+    if background_tasks is None and plan.uses_background_tasks:
+        # Created up front so that concurrently solved dependencies share it
+        background_tasks = BackgroundTasks()
+    # The solved value and the errors of each step, by step index.
+    results: List[Tuple[Any, List[Any]]] = [(None, [])] * len(plan.steps)
+    background_tasks = await _solve_steps(
+        plan=plan,
+        start=0,
+        stop=len(plan.steps),
+        results=results,
+        request=request,
+        body=body,
+        background_tasks=background_tasks,
+        response=response,
+        dependency_cache=dependency_cache,
+        async_exit_stack=async_exit_stack,
+        embed_body_fields=embed_body_fields,
+        threadpool_limiter=threadpool_limiter,
+    )
+    # The root dependant is the last step of the plan
+    values, errors = results[-1]
     return SolvedDependency(
         values=values,
         errors=errors,
@@ -927,6 +1247,122 @@ async def request_body_to_args(
     return values, errors
 
 
+async def _iter_request_text(request: Request) -> AsyncIterator[Tuple[str, bool]]:
+    # Chunks of the body decoded as UTF-8, even when a character is split between
+    # two chunks, and whether it's the last one
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    try:
+        async for chunk in request.stream():
+            yield decoder.decode(chunk), False
+        yield decoder.decode(b"", final=True), True
+    except UnicodeDecodeError as e:
+        raise HTTPException(
+            status_code=400, detail="There was an error parsing the body"
+        ) from e
+
+
+def _json_stream_error(pos: int, msg: str) -> RequestValidationError:
+    return RequestValidationError(
+        [
+            {
+                "type": "json_invalid",
+                "loc": ("body", pos),
+                "msg": "JSON decode error",
+                "input": {},
+                "ctx": {"error": msg},
+            }
+        ]
+    )
+
+
+_JSON_WHITESPACE = " \t\n\r"
+
+# The largest item, in characters, buffered while it's received
+BODY_STREAM_MAX_ITEM_SIZE = 1024 * 1024
+
+
+async def iter_body_stream(
+    request: Request,
+    field: ModelField,
+    *,
+    max_item_size: int = BODY_STREAM_MAX_ITEM_SIZE,
+) -> AsyncIterator[Any]:
+    """
+    Parse a JSON array request body as it's received and yield each of its items
+    validated with `field`, without buffering the whole body.
+
+    Invalid JSON and invalid items raise `RequestValidationError` while iterating,
+    after the previous items have been yielded. An item longer than
+    `max_item_size` characters raises a 413 `HTTPException`.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pos = 0
+    # Characters of the body before `buffer`, to report absolute error positions
+    offset = 0
+    # Don't try to decode an incomplete item again until the buffer is this long
+    retry_at = 0
+    index = 0
+    expect = "["
+    async for text, final in _iter_request_text(request):
+        buffer = buffer[pos:] + text
+        offset += pos
+        retry_at -= pos
+        pos = 0
+        while True:
+            while pos < len(buffer) and buffer[pos] in _JSON_WHITESPACE:
+                pos += 1
+            if pos == len(buffer):
+                break
+            char = buffer[pos]
+            if expect == "[":
+                if char != "[":
+                    raise _json_stream_error(offset + pos, "Expecting '['")
+                expect = "item or ]"
+                pos += 1
+                continue
+            if expect == "end":
+                raise _json_stream_error(offset + pos, "Extra data")
+            if char == "]" and expect in ("item or ]", ", or ]"):
+                expect = "end"
+                pos += 1
+                continue
+            if expect == ", or ]":
+                if char != ",":
+                    raise _json_stream_error(offset + pos, "Expecting ',' delimiter")
+                expect = "item"
+                pos += 1
+                continue
+            if not final and len(buffer) < retry_at:
+                break
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError as e:
+                if final:
+                    raise _json_stream_error(offset + e.pos, e.msg) from e
+                # Most likely the item hasn't been fully received yet, wait until
+                # the buffer doubles to avoid decoding large items over and over
+                retry_at = pos + 2 * (len(buffer) - pos)
+                break
+            if end == len(buffer) and not final:
+                # A number at the end of the buffer could continue in the next chunk
+                break
+            value, errors_ = field.validate(item, {}, loc=("body", index))
+            if errors_:
+                errors = errors_ if isinstance(errors_, list) else [errors_]
+                raise RequestValidationError(_normalize_errors(errors), body=item)
+            yield value
+            index += 1
+            pos = end
+            expect = ", or ]"
+        if len(buffer) - pos > max_item_size:
+            raise HTTPException(
+                status_code=413, detail="Request body item too large"
+            )
+    if expect != "end":
+        raise _json_stream_error(offset + len(buffer), "Unexpected end of data")
+
+
 def get_body_field(
     *, flat_dependant: Dependant, name: str, embed_body_fields: bool
 ) -> Optional[ModelField]:
@@ -3,6 +3,7 @@ import datetime
 from collections import defaultdict, deque
 from decimal import Decimal
 from enum import Enum
+from functools import lru_cache
 from ipaddress import (
     IPv4Address,
     IPv4Interface,
@@ -14,7 +15,7 @@ from ipaddress import (
 from pathlib import Path, PurePath
 from re import Pattern
 from types import GeneratorType
-from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type, Union
 from uuid import UUID
 
 from fastapi.types import IncEx
@@ -99,6 +100,87 @@ def generate_encoders_by_class_tuples(
 encoders_by_class_tuples = generate_encoders_by_class_tuples(ENCODERS_BY_TYPE)
 
 
+# How jsonable_encoder() handles an object, decided by its type. Each kind maps to
+# one of the branches of the encoder, in the order they are checked.
+_KIND_MODEL = 0
+_KIND_DATACLASS = 1
+_KIND_ENUM = 2
+_KIND_PATH = 3
+_KIND_NATIVE = 4
+_KIND_UNDEFINED = 5
+_KIND_DICT = 6
+_KIND_SEQUENCE = 7
+_KIND_OTHER = 8
+
+# Exact types returned as they are (when there's no custom encoder), checked inline
+# for the items of dicts and sequences to avoid a call per leaf value.
+_NATIVE_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
+def _get_encoder_kind(obj: Any) -> Tuple[int, Optional[Callable[[Any], Any]]]:
+    if isinstance(obj, BaseModel):
+        return _KIND_MODEL, None
+    if dataclasses.is_dataclass(obj):
+        return _KIND_DATACLASS, None
+    if isinstance(obj, Enum):
+        return _KIND_ENUM, None
+    if isinstance(obj, PurePath):
+        return _KIND_PATH, None
+    if isinstance(obj, (str, int, float, type(None))):
+        return _KIND_NATIVE, None
+    if isinstance(obj, UndefinedType):
+        return _KIND_UNDEFINED, None
+    if isinstance(obj, dict):
+        return _KIND_DICT, None
+    if isinstance(obj, (list, set, frozenset, GeneratorType, tuple, deque)):
+        return _KIND_SEQUENCE, None
+    for encoder, classes_tuple in encoders_by_class_tuples.items():
+        if isinstance(obj, classes_tuple):
+            return _KIND_OTHER, encoder
+    return _KIND_OTHER, None
+
+
+# Kind of the instances of a type, and for _KIND_OTHER, the encoder found in
+# encoders_by_class_tuples (if any). The same checks as _get_encoder_kind(), on the
+# type instead of an instance, cached for the most recently seen types so that
+# classes created at runtime don't accumulate. Like encoders_by_class_tuples itself,
+# this is not updated if ENCODERS_BY_TYPE changes, ENCODERS_BY_TYPE is checked on
+# each call.
+@lru_cache(maxsize=1024)
+def _get_type_encoder_kind(
+    obj_type: Type[Any],
+) -> Tuple[int, Optional[Callable[[Any], Any]]]:
+    if issubclass(obj_type, BaseModel):
+        return _KIND_MODEL, None
+    if dataclasses.is_dataclass(obj_type):
+        return _KIND_DATACLASS, None
+    if issubclass(obj_type, Enum):
+        return _KIND_ENUM, None
+    if issubclass(obj_type, PurePath):
+        return _KIND_PATH, None
+    if issubclass(obj_type, (str, int, float, type(None))):
+        return _KIND_NATIVE, None
+    if issubclass(obj_type, UndefinedType):
+        return _KIND_UNDEFINED, None
+    if issubclass(obj_type, dict):
+        return _KIND_DICT, None
+    if issubclass(obj_type, (list, set, frozenset, GeneratorType, tuple, deque)):
+        return _KIND_SEQUENCE, None
+    for encoder, classes_tuple in encoders_by_class_tuples.items():
+        if issubclass(obj_type, classes_tuple):
+            return _KIND_OTHER, encoder
+    return _KIND_OTHER, None
+
+
+def _encoder_kind(obj: Any) -> Tuple[int, Optional[Callable[[Any], Any]]]:
+    obj_type = type(obj)
+    # isinstance() also looks at __class__, which proxies can override, and
+    # is_dataclass() of a class depends on the class itself, those aren't cached
+    if obj.__class__ is not obj_type or isinstance(obj, type):
+        return _get_encoder_kind(obj)
+    return _get_type_encoder_kind(obj_type)
+
+
 def jsonable_encoder(
     obj: Annotated[
         Any,
@@ -201,7 +283,32 @@ def jsonable_encoder(
     Read more about it in the
     [FastAPI docs for JSON Compatible Encoder](https://fastapi.tiangolo.com/tutorial/encoder/).
     """
-    custom_encoder = custom_encoder or {}
+    return _jsonable_encoder(
+        obj,
+        include,
+        exclude,
+        by_alias,
+        exclude_unset,
+        exclude_defaults,
+        exclude_none,
+        custom_encoder or {},
+        sqlalchemy_safe,
+    )
+
+
+def _jsonable_encoder(
+    obj: Any,
+    include: Optional[IncEx],
+    exclude: Optional[IncEx],
+    by_alias: bool,
+    exclude_unset: bool,
+    exclude_defaults: bool,
+    exclude_none: bool,
+    custom_encoder: Dict[Any, Callable[[Any], Any]],
+    sqlalchemy_safe: bool,
+) -> Any:
+    # Same checks as always, in the same order, but dispatched on the cached kind of
+    # type(obj) instead of going through each isinstance() check for every value.
     if custom_encoder:
         if type(obj) in custom_encoder:
             return custom_encoder[type(obj)](obj)
@@ -213,7 +320,81 @@ def jsonable_encoder(
         include = set(include)
     if exclude is not None and not isinstance(exclude, (set, dict)):
         exclude = set(exclude)
-    if isinstance(obj, BaseModel):
+    if not custom_encoder and type(obj) in _NATIVE_TYPES:
+        return obj
+    kind, class_encoder = _encoder_kind(obj)
+    if kind == _KIND_DICT:
+        encoded_dict = {}
+        allowed_keys: Optional[Set[Any]] = None
+        if include is not None or exclude is not None or type(obj) is not dict:
+            allowed_keys = set(obj.keys())
+            if include is not None:
+                allowed_keys &= set(include)
+            if exclude is not None:
+                allowed_keys -= set(exclude)
+        inline_natives = not custom_encoder
+        for key, value in obj.items():
+            if (
+                (
+                    not sqlalchemy_safe
+                    or (not isinstance(key, str))
+                    or (not key.startswith("_sa"))
+                )
+                and (value is not None or not exclude_none)
+                and (allowed_keys is None or key in allowed_keys)
+            ):
+                if inline_natives and type(key) in _NATIVE_TYPES:
+                    encoded_key = key
+                else:
+                    encoded_key = _jsonable_encoder(
+                        key,
+                        None,
+                        None,
+                        by_alias,
+                        exclude_unset,
+                        False,
+                        exclude_none,
+                        custom_encoder,
+                        sqlalchemy_safe,
+                    )
+                if inline_natives and type(value) in _NATIVE_TYPES:
+                    encoded_value = value
+                else:
+                    encoded_value = _jsonable_encoder(
+                        value,
+                        None,
+                        None,
+                        by_alias,
+                        exclude_unset,
+                        False,
+                        exclude_none,
+                        custom_encoder,
+                        sqlalchemy_safe,
+                    )
+                encoded_dict[encoded_key] = encoded_value
+        return encoded_dict
+    if kind == _KIND_SEQUENCE:
+        encoded_list = []
+        inline_natives = not custom_encoder
+        for item in obj:
+            if inline_natives and type(item) in _NATIVE_TYPES:
+                encoded_list.append(item)
+            else:
+                encoded_list.append(
+                    _jsonable_encoder(
+                        item,
+                        include,
+                        exclude,
+                        by_alias,
+                        exclude_unset,
+                        exclude_defaults,
+                        exclude_none,
+                        custom_encoder,
+                        sqlalchemy_safe,
+                    )
+                )
+        return encoded_list
+    if kind == _KIND_MODEL:
         # TODO: remove when deprecating Pydantic v1
         encoders: Dict[Any, Any] = {}
         if not PYDANTIC_V2:
@@ -232,93 +413,44 @@ def jsonable_encoder(
         )
         if "__root__" in obj_dict:
             obj_dict = obj_dict["__root__"]
-        return jsonable_encoder(
+        return _jsonable_encoder(
             obj_dict,
-            exclude_none=exclude_none,
-            exclude_defaults=exclude_defaults,
+            None,
+            None,
+            True,
+            False,
+            exclude_defaults,
+            exclude_none,
             # TODO: remove when deprecating Pydantic v1
-            custom_encoder=encoders,
-            sqlalchemy_safe=sqlalchemy_safe,
+            encoders or {},
+            sqlalchemy_safe,
         )
-    if dataclasses.is_dataclass(obj):
-        obj_dict = dataclasses.asdict(obj)
-        return jsonable_encoder(
+    if kind == _KIND_DATACLASS:
+        obj_dict = dataclasses.asdict(obj)  # type: ignore[call-overload]
+        return _jsonable_encoder(
             obj_dict,
-            include=include,
-            exclude=exclude,
-            by_alias=by_alias,
-            exclude_unset=exclude_unset,
-            exclude_defaults=exclude_defaults,
-            exclude_none=exclude_none,
-            custom_encoder=custom_encoder,
-            sqlalchemy_safe=sqlalchemy_safe,
+            include,
+            exclude,
+            by_alias,
+            exclude_unset,
+            exclude_defaults,
+            exclude_none,
+            custom_encoder,
+            sqlalchemy_safe,
         )
-    if isinstance(obj, Enum):
+    if kind == _KIND_ENUM:
         return obj.value
-    if isinstance(obj, PurePath):
+    if kind == _KIND_PATH:
         return str(obj)
-    if isinstance(obj, (str, int, float, type(None))):
+    if kind == _KIND_NATIVE:
         return obj
-    if isinstance(obj, UndefinedType):
+    if kind == _KIND_UNDEFINED:
         return None
-    if isinstance(obj, dict):
-        encoded_dict = {}
-        allowed_keys = set(obj.keys())
-        if include is not None:
-            allowed_keys &= set(include)
-        if exclude is not None:
-            allowed_keys -= set(exclude)
-        for key, value in obj.items():
-            if (
-                (
-                    not sqlalchemy_safe
-                    or (not isinstance(key, str))
-                    or (not key.startswith("_sa"))
-                )
-                and (value is not None or not exclude_none)
-                and key in allowed_keys
-            ):
-                encoded_key = jsonable_encoder(
-                    key,
-                    by_alias=by_alias,
-                    exclude_unset=exclude_unset,
-                    exclude_none=exclude_none,
-                    custom_encoder=custom_encoder,
-                    sqlalchemy_safe=sqlalchemy_safe,
-                )
-                encoded_value = jsonable_encoder(
-                    value,
-                    by_alias=by_alias,
-                    exclude_unset=exclude_unset,
-                    exclude_none=exclude_none,
-                    custom_encoder=custom_encoder,
-                    sqlalchemy_safe=sqlalchemy_safe,
-                )
-                encoded_dict[encoded_key] = encoded_value
-        return encoded_dict
-    if isinstance(obj, (list, set, frozenset, GeneratorType, tuple, deque)):
-        encoded_list = []
-        for item in obj:
-            encoded_list.append(
-                jsonable_encoder(
-                    item,
-                    include=include,
-                    exclude=exclude,
-                    by_alias=by_alias,
-                    exclude_unset=exclude_unset,
-                    exclude_defaults=exclude_defaults,
-                    exclude_none=exclude_none,
-                    custom_encoder=custom_encoder,
-                    sqlalchemy_safe=sqlalchemy_safe,
-                )
-            )
-        return encoded_list
 
     if type(obj) in ENCODERS_BY_TYPE:
         return ENCODERS_BY_TYPE[type(obj)](obj)
-    for encoder, classes_tuple in encoders_by_class_tuples.items():
-        if isinstance(obj, classes_tuple):
-            return encoder(obj)
+    if class_encoder is not None:
+        return class_encoder(obj)
 
     try:
         data = dict(obj)
@@ -330,14 +462,14 @@ def jsonable_encoder(
         except Exception as e:
             errors.append(e)
             raise ValueError(errors) from e
-    return jsonable_encoder(
+    return _jsonable_encoder(
         data,
-        include=include,
-        exclude=exclude,
-        by_alias=by_alias,
-        exclude_unset=exclude_unset,
-        exclude_defaults=exclude_defaults,
-        exclude_none=exclude_none,
-        custom_encoder=custom_encoder,
-        sqlalchemy_safe=sqlalchemy_safe,
+        include,
+        exclude,
+        by_alias,
+        exclude_unset,
+        exclude_defaults,
+        exclude_none,
+        custom_encoder,
+        sqlalchemy_safe,
     )
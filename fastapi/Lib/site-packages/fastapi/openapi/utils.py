@@ -1,6 +1,11 @@
+import hashlib
 import http.client
 import inspect
+import json
+import re
+import sys
 import warnings
+from enum import Enum
 from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Type, Union, cast
 
 from fastapi import routing
@@ -8,6 +13,7 @@ from fastapi._compat import (
     GenerateJsonSchema,
     JsonSchemaValue,
     ModelField,
+    PYDANTIC_V2,
     Undefined,
     get_compat_model_name_map,
     get_definitions,
@@ -36,7 +42,7 @@ from pydantic import BaseModel
 from starlette.responses import JSONResponse
 from starlette.routing import BaseRoute
 from starlette.status import HTTP_422_UNPROCESSABLE_ENTITY
-from typing_extensions import Literal
+from typing_extensions import Literal, get_args
 
 validation_error_definition = {
     "title": "ValidationError",
@@ -567,3 +573,130 @@ def get_openapi(
     if tags:
         output["tags"] = tags
     return jsonable_encoder(OpenAPI(**output), by_alias=True, exclude_none=True)  # type: ignore
+
+
+_MEMORY_ADDRESS_RE = re.compile(r" at 0x[0-9a-fA-F]+")
+
+
+def _stable_repr(value: Any) -> str:
+    # A repr that is the same in every process, without memory addresses
+    if isinstance(value, DefaultPlaceholder):
+        value = value.value
+    if inspect.isclass(value) or inspect.isroutine(value):
+        return f"{getattr(value, '__module__', '')}.{value.__qualname__}"
+    return _MEMORY_ADDRESS_RE.sub("", repr(value))
+
+
+def get_openapi_cache_key(
+    *,
+    routes: Sequence[BaseRoute],
+    webhooks: Optional[Sequence[BaseRoute]] = None,
+    **settings: Any,
+) -> str:
+    """
+    Hash what the OpenAPI schema is generated from: the `get_openapi()` settings,
+    the routes, their parameters and models with the values of their fields (as
+    defaults, aliases or examples, that can come from the environment), their
+    security schemes, and the source files of the modules that define all of them,
+    to key a copy of the schema cached on disk.
+    """
+    from fastapi import __version__ as fastapi_version
+    from pydantic import VERSION as pydantic_version
+
+    hasher = hashlib.sha256()
+    modules: Set[str] = set()
+    seen: Set[int] = set()
+
+    def add(value: Any) -> None:
+        hasher.update(value.encode("utf-8"))
+        hasher.update(b"\0")
+
+    def collect_type(annotation: Any) -> None:
+        if id(annotation) in seen:
+            return
+        seen.add(id(annotation))
+        for arg in get_args(annotation):
+            collect_type(arg)
+        if inspect.isclass(annotation):
+            modules.add(annotation.__module__)
+        if lenient_issubclass(annotation, Enum):
+            add(_stable_repr([(member.name, member.value) for member in annotation]))
+        if lenient_issubclass(annotation, BaseModel):
+            add(_stable_repr(annotation))
+            add(annotation.__doc__ or "")
+            if PYDANTIC_V2:
+                add(_stable_repr(annotation.model_config))
+                for name, field_info in annotation.model_fields.items():
+                    add(_stable_repr((name, field_info)))
+                    collect_type(field_info.annotation)
+            else:
+                for model_field in annotation.__fields__.values():  # type: ignore[attr-defined]
+                    add(_stable_repr((model_field.name, model_field.field_info)))
+                    collect_type(model_field.outer_type_)
+
+    def add_field(field: ModelField) -> None:
+        add(_stable_repr((field.name, field.alias, field.field_info)))
+        collect_type(field.type_)
+
+    def collect_dependant(dependant: Dependant) -> None:
+        if dependant.call is not None:
+            modules.add(getattr(dependant.call, "__module__", None) or "")
+        for requirement in dependant.security_requirements:
+            security_scheme = requirement.security_scheme
+            modules.add(type(security_scheme).__module__)
+            add(
+                _stable_repr(
+                    (
+                        security_scheme.scheme_name,
+                        security_scheme.model,
+                        requirement.scopes,
+                    )
+                )
+            )
+        for sub_dependant in dependant.dependencies:
+            collect_dependant(sub_dependant)
+
+    def add_routes(routes: Sequence[BaseRoute]) -> None:
+        for route in routes:
+            if not isinstance(route, routing.APIRoute):
+                add(_stable_repr(route))
+                continue
+            for value in (
+                route.path_format,
+                sorted(route.methods),
+                route.name,
+                route.unique_id,
+                route.include_in_schema,
+                route.tags,
+                route.summary,
+                route.description,
+                route.response_description,
+                route.deprecated,
+                route.operation_id,
+                route.status_code,
+                route.responses,
+                route.response_class,
+                route.openapi_extra,
+                route.endpoint,
+            ):
+                add(_stable_repr(value))
+            collect_dependant(route.dependant)
+            if route.callbacks:
+                add_routes(route.callbacks)
+
+    add(f"{fastapi_version} {pydantic_version}")
+    add(json.dumps(settings, sort_keys=True, default=_stable_repr))
+    all_routes = list(routes or []) + list(webhooks or [])
+    add_routes(all_routes)
+    for field in get_fields_from_routes(all_routes):
+        add_field(field)
+    for module_name in sorted(modules):
+        add(module_name)
+        path = getattr(sys.modules.get(module_name), "__file__", None)
+        if path:
+            try:
+                with open(path, "rb") as module_file:
+                    hasher.update(hashlib.sha256(module_file.read()).digest())
+            except OSError:
+                pass
+    return hasher.hexdigest()
@@ -2244,6 +2244,24 @@ def Depends(  # noqa: N802
             """
         ),
     ] = True,
+    concurrent: Annotated[
+        bool,
+        Doc(
+            """
+            Allow this dependency to be resolved concurrently with its sibling
+            dependencies.
+
+            When it's an `async def` function (or an async generator) and it doesn't
+            share any sub-dependencies with the sibling dependencies next to it that
+            are also concurrent, they are run together in an AnyIO task group
+            instead of one after another.
+
+            Each of them then runs in its own task, with a copy of the context, so
+            context variables they set are not seen by the path operation function
+            or by other dependencies.
+            """
+        ),
+    ] = False,
 ) -> Any:
     """
     Declare a FastAPI dependency.
@@ -2274,7 +2292,9 @@ def Depends(  # noqa: N802
         return commons
     ```
     """
-    return params.Depends(dependency=dependency, use_cache=use_cache)
+    return params.Depends(
+        dependency=dependency, use_cache=use_cache, concurrent=concurrent
+    )
 
 
 def Security(  # noqa: N802
@@ -2321,6 +2341,24 @@ def Security(  # noqa: N802
             """
         ),
     ] = True,
+    concurrent: Annotated[
+        bool,
+        Doc(
+            """
+            Allow this dependency to be resolved concurrently with its sibling
+            dependencies.
+
+            When it's an `async def` function (or an async generator) and it doesn't
+            share any sub-dependencies with the sibling dependencies next to it that
+            are also concurrent, they are run together in an AnyIO task group
+            instead of one after another.
+
+            Each of them then runs in its own task, with a copy of the context, so
+            context variables they set are not seen by the path operation function
+            or by other dependencies.
+            """
+        ),
+    ] = False,
 ) -> Any:
     """
     Declare a FastAPI Security dependency.
@@ -2357,4 +2395,9 @@ def Security(  # noqa: N802
         return [{"item_id": "Foo", "owner": current_user.username}]
     ```
     """
-    return params.Security(dependency=dependency, scopes=scopes, use_cache=use_cache)
+    return params.Security(
+        dependency=dependency,
+        scopes=scopes,
+        use_cache=use_cache,
+        concurrent=concurrent,
+    )
@@ -20,6 +20,12 @@ except ImportError:  # pragma: nocover
     orjson = None  # type: ignore
 
 
+try:
+    import pydantic_core
+except ImportError:  # pragma: nocover
+    pydantic_core = None  # type: ignore
+
+
 class UJSONResponse(JSONResponse):
     """
     JSON response using the high-performance ujson library to serialize data to JSON.
@@ -46,3 +52,50 @@ class ORJSONResponse(JSONResponse):
         return orjson.dumps(
             content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
         )
+
+
+class _RenderedJSON:
+    """
+    JSON bytes already rendered by FastAPI from a `response_model`, that
+    `PydanticJSONResponse` sends as they are.
+    """
+
+    __slots__ = ("body",)
+
+    def __init__(self, body: bytes) -> None:
+        self.body = body
+
+
+class PydanticJSONResponse(JSONResponse):
+    """
+    JSON response serialized with pydantic-core (Pydantic v2).
+
+    When used as the `response_class` of a *path operation* with a `response_model`
+    (or as the app's `default_response_class`), the validated return value is
+    serialized straight to JSON bytes with the model's `TypeAdapter.dump_json()`,
+    skipping the intermediate `dict` and the second encoding pass of
+    `JSONResponse`.
+
+    Other content, `bytes` included, is serialized with `pydantic_core.to_json()`,
+    and like with `JSONResponse`, `NaN` and infinite floats in it raise a
+    `ValueError`.
+
+    The one difference with `JSONResponse` is that `NaN` and infinite floats in
+    a `response_model` are rendered following the model's `ser_json_inf_nan`
+    config, `null` by default, instead of raising a `ValueError`, as
+    `TypeAdapter.dump_json()` has no option to reject them.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, _RenderedJSON):
+            return content.body
+        assert pydantic_core is not None, (
+            "pydantic-core must be installed to use PydanticJSONResponse"
+        )
+        body = pydantic_core.to_json(content)
+        if (b"NaN" in body or b"Infinity" in body) and body != pydantic_core.to_json(
+            content, inf_nan_mode="null"
+        ):
+            # Same error as json.dumps(..., allow_nan=False) in JSONResponse
+            raise ValueError("Out of range float values are not JSON compliant")
+        return body
@@ -1,10 +1,10 @@
 import asyncio
 import dataclasses
-import email.message
 import inspect
 import json
 from contextlib import AsyncExitStack, asynccontextmanager
 from enum import Enum, IntEnum
+from functools import lru_cache
 from typing import (
     Any,
     AsyncIterator,
@@ -30,12 +30,15 @@ from fastapi._compat import (
     _normalize_errors,
     lenient_issubclass,
 )
+from fastapi.concurrency import ThreadpoolLimiter, run_in_limited_threadpool
 from fastapi.datastructures import Default, DefaultPlaceholder
 from fastapi.dependencies.models import Dependant
 from fastapi.dependencies.utils import (
     _should_embed_body_fields,
     get_body_field,
+    get_body_stream_field,
     get_dependant,
+    get_dependency_plan,
     get_flat_dependant,
     get_parameterless_sub_dependant,
     get_typed_return_annotation,
@@ -48,6 +51,7 @@ from fastapi.exceptions import (
     ResponseValidationError,
     WebSocketRequestValidationError,
 )
+from fastapi.responses import PydanticJSONResponse, _RenderedJSON
 from fastapi.types import DecoratedCallable, IncEx
 from fastapi.utils import (
     create_cloned_field,
@@ -58,7 +62,6 @@ from fastapi.utils import (
 )
 from pydantic import BaseModel
 from starlette import routing
-from starlette.concurrency import run_in_threadpool
 from starlette.exceptions import HTTPException
 from starlette.requests import Request
 from starlette.responses import JSONResponse, Response
@@ -73,7 +76,7 @@ from starlette.routing import (
 from starlette.routing import Mount as Mount  # noqa
 from starlette.types import AppType, ASGIApp, Lifespan, Scope
 from starlette.websockets import WebSocket
-from typing_extensions import Annotated, Doc, deprecated
+from typing_extensions import Annotated, Doc, Literal, deprecated, get_args, get_origin
 
 
 def _prepare_response_content(
@@ -140,6 +143,44 @@ def _merge_lifespan_context(
     return merged_lifespan  # type: ignore[return-value]
 
 
+@lru_cache(maxsize=128)
+def _is_json_content_type(content_type: bytes) -> bool:
+    # Same decision as email.message.Message().get_content_maintype() and
+    # get_content_subtype() for this Content-Type, without building a Message for
+    # each request. Cached on the raw header value, which rarely varies.
+    value = content_type.decode("latin-1")
+    ctype = value.partition(";")[0].strip().lower()
+    if ctype.count("/") != 1:
+        # Invalid, email.message falls back to text/plain
+        return False
+    maintype, subtype = ctype.split("/")
+    return maintype == "application" and (
+        subtype == "json" or subtype.endswith("+json")
+    )
+
+
+def _is_response_model_instance(field: ModelField, response_content: Any) -> bool:
+    # Whether the content is already an instance of the response model (or a list
+    # of them), so that skipping validation can't leak fields that the model
+    # would filter out, like those of a dict, an ORM object or another model
+    annotation = field.type_
+    if isinstance(annotation, type):
+        return isinstance(response_content, annotation)
+    if get_origin(annotation) is list and isinstance(response_content, list):
+        item_type = next(iter(get_args(annotation)), None)
+        return isinstance(item_type, type) and all(
+            isinstance(item, item_type) for item in response_content
+        )
+    return False
+
+
+def _get_content_type(request: Request) -> Optional[bytes]:
+    for key, value in request.headers.raw:
+        if key == b"content-type":
+            return value
+    return None
+
+
 async def serialize_response(
     *,
     field: Optional[ModelField] = None,
@@ -151,6 +192,9 @@ async def serialize_response(
     exclude_defaults: bool = False,
     exclude_none: bool = False,
     is_coroutine: bool = True,
+    dump_json: bool = False,
+    validate: bool = True,
+    threadpool_limiter: Optional[ThreadpoolLimiter] = None,
 ) -> Any:
     if field:
         errors = []
@@ -162,11 +206,18 @@ async def serialize_response(
                 exclude_defaults=exclude_defaults,
                 exclude_none=exclude_none,
             )
-        if is_coroutine:
+        if not validate and _is_response_model_instance(field, response_content):
+            # The path operation returned the response model already
+            value, errors_ = response_content, None
+        elif is_coroutine:
             value, errors_ = field.validate(response_content, {}, loc=("response",))
         else:
-            value, errors_ = await run_in_threadpool(
-                field.validate, response_content, {}, loc=("response",)
+            value, errors_ = await run_in_limited_threadpool(
+                threadpool_limiter,
+                field.validate,
+                response_content,
+                {},
+                loc=("response",),
             )
         if isinstance(errors_, list):
             errors.extend(errors_)
@@ -177,6 +228,19 @@ async def serialize_response(
                 errors=_normalize_errors(errors), body=response_content
             )
 
+        if dump_json and hasattr(field, "serialize_json"):
+            return _RenderedJSON(
+                field.serialize_json(
+                    value,
+                    include=include,
+                    exclude=exclude,
+                    by_alias=by_alias,
+                    exclude_unset=exclude_unset,
+                    exclude_defaults=exclude_defaults,
+                    exclude_none=exclude_none,
+                )
+            )
+
         if hasattr(field, "serialize"):
             return field.serialize(
                 value,
@@ -202,7 +266,11 @@ async def serialize_response(
 
 
 async def run_endpoint_function(
-    *, dependant: Dependant, values: Dict[str, Any], is_coroutine: bool
+    *,
+    dependant: Dependant,
+    values: Dict[str, Any],
+    is_coroutine: bool,
+    threadpool_limiter: Optional[ThreadpoolLimiter] = None,
 ) -> Any:
     # Only called by get_request_handler. Has been split into its own function to
     # facilitate profiling endpoints, since inner functions are harder to profile.
@@ -211,7 +279,9 @@ async def run_endpoint_function(
     if is_coroutine:
         return await dependant.call(**values)
     else:
-        return await run_in_threadpool(dependant.call, **values)
+        return await run_in_limited_threadpool(
+            threadpool_limiter, dependant.call, **values
+        )
 
 
 def get_request_handler(
@@ -228,6 +298,8 @@ def get_request_handler(
     response_model_exclude_none: bool = False,
     dependency_overrides_provider: Optional[Any] = None,
     embed_body_fields: bool = False,
+    response_model_validate: Literal["full", "serialize_only"] = "full",
+    threadpool_limiter: Optional[ThreadpoolLimiter] = None,
 ) -> Callable[[Request], Coroutine[Any, Any, Response]]:
     assert dependant.call is not None, "dependant.call must be a function"
     is_coroutine = asyncio.iscoroutinefunction(dependant.call)
@@ -236,6 +308,8 @@ def get_request_handler(
         actual_response_class: Type[Response] = response_class.value
     else:
         actual_response_class = response_class
+    # Let the response model render itself to JSON bytes directly
+    dump_json = lenient_issubclass(actual_response_class, PydanticJSONResponse)
 
     async def app(request: Request) -> Response:
         response: Union[Response, None] = None
@@ -250,16 +324,11 @@ def get_request_handler(
                         body_bytes = await request.body()
                         if body_bytes:
                             json_body: Any = Undefined
-                            content_type_value = request.headers.get("content-type")
+                            content_type_value = _get_content_type(request)
                             if not content_type_value:
                                 json_body = await request.json()
-                            else:
-                                message = email.message.Message()
-                                message["content-type"] = content_type_value
-                                if message.get_content_maintype() == "application":
-                                    subtype = message.get_content_subtype()
-                                    if subtype == "json" or subtype.endswith("+json"):
-                                        json_body = await request.json()
+                            elif _is_json_content_type(content_type_value):
+                                json_body = await request.json()
                             if json_body != Undefined:
                                 body = json_body
                             else:
@@ -295,6 +364,7 @@ def get_request_handler(
                     dependency_overrides_provider=dependency_overrides_provider,
                     async_exit_stack=async_exit_stack,
                     embed_body_fields=embed_body_fields,
+                    threadpool_limiter=threadpool_limiter,
                 )
                 errors = solved_result.errors
                 if not errors:
@@ -302,6 +372,7 @@ def get_request_handler(
                         dependant=dependant,
                         values=solved_result.values,
                         is_coroutine=is_coroutine,
+                        threadpool_limiter=threadpool_limiter,
                     )
                     if isinstance(raw_response, Response):
                         if raw_response.background is None:
@@ -334,6 +405,9 @@ def get_request_handler(
                             exclude_defaults=response_model_exclude_defaults,
                             exclude_none=response_model_exclude_none,
                             is_coroutine=is_coroutine,
+                            dump_json=dump_json,
+                            validate=response_model_validate == "full",
+                            threadpool_limiter=threadpool_limiter,
                         )
                         response = actual_response_class(content, **response_args)
                         if not is_body_allowed_for_status_code(response.status_code):
@@ -410,6 +484,8 @@ class APIWebSocketRoute(routing.WebSocketRoute):
         self._embed_body_fields = _should_embed_body_fields(
             self._flat_dependant.body_params
         )
+        # Compile the dependency execution plan up front, at route registration
+        get_dependency_plan(self.dependant, dependency_overrides_provider)
         self.app = websocket_session(
             get_websocket_app(
                 dependant=self.dependant,
@@ -459,6 +535,9 @@ class APIRoute(routing.Route):
         generate_unique_id_function: Union[
             Callable[["APIRoute"], str], DefaultPlaceholder
         ] = Default(generate_unique_id),
+        concurrent_dependencies: bool = False,
+        response_model_validate: Literal["full", "serialize_only"] = "full",
+        threadpool_limiter: Optional[ThreadpoolLimiter] = None,
     ) -> None:
         self.path = path
         self.endpoint = endpoint
@@ -485,6 +564,12 @@ class APIRoute(routing.Route):
         self.callbacks = callbacks
         self.openapi_extra = openapi_extra
         self.generate_unique_id_function = generate_unique_id_function
+        self.concurrent_dependencies = concurrent_dependencies
+        assert response_model_validate in ("full", "serialize_only"), (
+            "response_model_validate must be 'full' or 'serialize_only'"
+        )
+        self.response_model_validate = response_model_validate
+        self.threadpool_limiter = threadpool_limiter
         self.tags = tags or []
         self.responses = responses or {}
         self.name = get_name(endpoint) if name is None else name
@@ -551,7 +636,11 @@ class APIRoute(routing.Route):
             self.response_fields = {}
 
         assert callable(endpoint), "An endpoint must be a callable"
-        self.dependant = get_dependant(path=self.path_format, call=self.endpoint)
+        self.dependant = get_dependant(
+            path=self.path_format,
+            call=self.endpoint,
+            concurrent=self.concurrent_dependencies,
+        )
         for depends in self.dependencies[::-1]:
             self.dependant.dependencies.insert(
                 0,
@@ -561,17 +650,35 @@ class APIRoute(routing.Route):
         self._embed_body_fields = _should_embed_body_fields(
             self._flat_dependant.body_params
         )
+        # Compile the dependency execution plan up front, at route registration
+        get_dependency_plan(self.dependant, dependency_overrides_provider)
         self.body_field = get_body_field(
             flat_dependant=self._flat_dependant,
             name=self.unique_id,
             embed_body_fields=self._embed_body_fields,
         )
+        body_stream_field = get_body_stream_field(self.dependant)
+        self._streams_body = body_stream_field is not None
+        if body_stream_field is not None:
+            assert self.body_field is None, (
+                "A path operation that streams the request body can't declare "
+                "other body parameters"
+            )
+            # The body isn't read up front, it's documented as the JSON array the
+            # stream parses
+            item_type = body_stream_field.field_info.annotation
+            self.body_field = create_model_field(
+                name=body_stream_field.name,
+                type_=List[item_type],  # type: ignore[valid-type]
+                required=True,
+                field_info=params.Body(annotation=List[item_type]),  # type: ignore[valid-type]
+            )
         self.app = request_response(self.get_route_handler())
 
     def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
         return get_request_handler(
             dependant=self.dependant,
-            body_field=self.body_field,
+            body_field=None if self._streams_body else self.body_field,
             status_code=self.status_code,
             response_class=self.response_class,
             response_field=self.secure_cloned_response_field,
@@ -583,6 +690,8 @@ class APIRoute(routing.Route):
             response_model_exclude_none=self.response_model_exclude_none,
             dependency_overrides_provider=self.dependency_overrides_provider,
             embed_body_fields=self._embed_body_fields,
+            response_model_validate=self.response_model_validate,
+            threadpool_limiter=self.threadpool_limiter,
         )
 
     def matches(self, scope: Scope) -> Tuple[Match, Scope]:
@@ -833,6 +942,34 @@ class APIRouter(routing.Router):
                 """
             ),
         ] = Default(generate_unique_id),
+        compiled_dispatch: Annotated[
+            bool,
+            Doc(
+                """
+                Dispatch requests through a radix tree of the routes' static path
+                segments instead of trying every route in order.
+
+                Matching behaves the same, it only skips routes that can't match,
+                which makes a difference for apps with many routes. The index is
+                rebuilt automatically when routes are added.
+                """
+            ),
+        ] = False,
+        threadpool_limiter: Annotated[
+            Optional[ThreadpoolLimiter],
+            Doc(
+                """
+                A `ThreadpoolLimiter` to run the *path operation functions* in this
+                router and their dependencies in, when they are not `async`,
+                instead of the threadpool shared with the rest of the app.
+
+                It limits how many of them run in threads at the same time, its
+                statistics show how long they wait for a thread, and it can reject
+                requests with a `503` when too many are already waiting, so that
+                slow sync routes can't starve the rest of the app.
+                """
+            ),
+        ] = None,
     ) -> None:
         super().__init__(
             routes=routes,
@@ -841,6 +978,7 @@ class APIRouter(routing.Router):
             on_startup=on_startup,
             on_shutdown=on_shutdown,
             lifespan=lifespan,
+            compiled_dispatch=compiled_dispatch,
         )
         if prefix:
             assert prefix.startswith("/"), "A path prefix must start with '/'"
@@ -858,6 +996,7 @@ class APIRouter(routing.Router):
         self.route_class = route_class
         self.default_response_class = default_response_class
         self.generate_unique_id_function = generate_unique_id_function
+        self.threadpool_limiter = threadpool_limiter
 
     def route(
         self,
@@ -911,6 +1050,9 @@ class APIRouter(routing.Router):
         generate_unique_id_function: Union[
             Callable[[APIRoute], str], DefaultPlaceholder
         ] = Default(generate_unique_id),
+        concurrent_dependencies: bool = False,
+        response_model_validate: Literal["full", "serialize_only"] = "full",
+        threadpool_limiter: Optional[ThreadpoolLimiter] = None,
     ) -> None:
         route_class = route_class_override or self.route_class
         responses = responses or {}
@@ -957,6 +1099,9 @@ class APIRouter(routing.Router):
             callbacks=current_callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=current_generate_unique_id,
+            concurrent_dependencies=concurrent_dependencies,
+            response_model_validate=response_model_validate,
+            threadpool_limiter=threadpool_limiter or self.threadpool_limiter,
         )
         self.routes.append(route)
 
@@ -989,6 +1134,9 @@ class APIRouter(routing.Router):
         generate_unique_id_function: Callable[[APIRoute], str] = Default(
             generate_unique_id
         ),
+        concurrent_dependencies: bool = False,
+        response_model_validate: Literal["full", "serialize_only"] = "full",
+        threadpool_limiter: Optional[ThreadpoolLimiter] = None,
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         def decorator(func: DecoratedCallable) -> DecoratedCallable:
             self.add_api_route(
@@ -1017,6 +1165,9 @@ class APIRouter(routing.Router):
                 callbacks=callbacks,
                 openapi_extra=openapi_extra,
                 generate_unique_id_function=generate_unique_id_function,
+                concurrent_dependencies=concurrent_dependencies,
+                response_model_validate=response_model_validate,
+                threadpool_limiter=threadpool_limiter,
             )
             return func
 
@@ -1230,6 +1381,17 @@ class APIRouter(routing.Router):
                 """
             ),
         ] = Default(generate_unique_id),
+        threadpool_limiter: Annotated[
+            Optional[ThreadpoolLimiter],
+            Doc(
+                """
+                A `ThreadpoolLimiter` to run the *path operation functions* in this
+                router and their dependencies in, when they are not `async`, for
+                the *path operations* that don't already have one of their own or
+                of the included router.
+                """
+            ),
+        ] = None,
     ) -> None:
         """
         Include another `APIRouter` in the same current `APIRouter`.
@@ -1328,6 +1490,10 @@ class APIRouter(routing.Router):
                     callbacks=current_callbacks,
                     openapi_extra=route.openapi_extra,
                     generate_unique_id_function=current_generate_unique_id,
+                    concurrent_dependencies=route.concurrent_dependencies,
+                    response_model_validate=route.response_model_validate,
+                    threadpool_limiter=route.threadpool_limiter
+                    or threadpool_limiter,
                 )
             elif isinstance(route, routing.Route):
                 methods = list(route.methods or [])
@@ -1694,6 +1860,53 @@ class APIRouter(routing.Router):
                 """
             ),
         ] = Default(generate_unique_id),
+        concurrent_dependencies: Annotated[
+            bool,
+            Doc(
+                """
+                Resolve the independent async dependencies of this *path
+                operation* concurrently instead of one after another.
+
+                Sibling dependencies that are `async def` functions (or async
+                generators) and don't share any sub-dependencies are run together
+                in an AnyIO task group. Cached values, the exit order of
+                dependencies with `yield`, and validation errors are the same as
+                when they run sequentially.
+
+                To opt in a single dependency instead, use
+                `Depends(..., concurrent=True)`.
+                """
+            ),
+        ] = False,
+        response_model_validate: Annotated[
+            Literal["full", "serialize_only"],
+            Doc(
+                """
+                How the returned value is checked against the response model.
+
+                By default (`"full"`), the returned data is validated with the response
+                model before it's serialized, for `def` functions in a threadpool.
+
+                With `"serialize_only"`, a returned value that is already an instance of
+                the response model (or a list of them), for example a Pydantic model built
+                by the *path operation function*, is serialized directly, skipping the
+                validation pass and the threadpool hop. Any other value is validated as
+                with `"full"`.
+                """
+            ),
+        ] = "full",
+        threadpool_limiter: Annotated[
+            Optional[ThreadpoolLimiter],
+            Doc(
+                """
+                A `ThreadpoolLimiter` to run the *path operation function* and its
+                dependencies in, when they are not `async`, instead of the threadpool
+                shared with the rest of the app.
+
+                By default, the one of the router, if any.
+                """
+            ),
+        ] = None,
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP GET operation.
@@ -1738,6 +1951,9 @@ class APIRouter(routing.Router):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            concurrent_dependencies=concurrent_dependencies,
+            response_model_validate=response_model_validate,
+            threadpool_limiter=threadpool_limiter,
         )
 
     def put(
@@ -2071,6 +2287,53 @@ class APIRouter(routing.Router):
                 """
             ),
         ] = Default(generate_unique_id),
+        concurrent_dependencies: Annotated[
+            bool,
+            Doc(
+                """
+                Resolve the independent async dependencies of this *path
+                operation* concurrently instead of one after another.
+
+                Sibling dependencies that are `async def` functions (or async
+                generators) and don't share any sub-dependencies are run together
+                in an AnyIO task group. Cached values, the exit order of
+                dependencies with `yield`, and validation errors are the same as
+                when they run sequentially.
+
+                To opt in a single dependency instead, use
+                `Depends(..., concurrent=True)`.
+                """
+            ),
+        ] = False,
+        response_model_validate: Annotated[
+            Literal["full", "serialize_only"],
+            Doc(
+                """
+                How the returned value is checked against the response model.
+
+                By default (`"full"`), the returned data is validated with the response
+                model before it's serialized, for `def` functions in a threadpool.
+
+                With `"serialize_only"`, a returned value that is already an instance of
+                the response model (or a list of them), for example a Pydantic model built
+                by the *path operation function*, is serialized directly, skipping the
+                validation pass and the threadpool hop. Any other value is validated as
+                with `"full"`.
+                """
+            ),
+        ] = "full",
+        threadpool_limiter: Annotated[
+            Optional[ThreadpoolLimiter],
+            Doc(
+                """
+                A `ThreadpoolLimiter` to run the *path operation function* and its
+                dependencies in, when they are not `async`, instead of the threadpool
+                shared with the rest of the app.
+
+                By default, the one of the router, if any.
+                """
+            ),
+        ] = None,
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP PUT operation.
@@ -2120,6 +2383,9 @@ class APIRouter(routing.Router):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            concurrent_dependencies=concurrent_dependencies,
+            response_model_validate=response_model_validate,
+            threadpool_limiter=threadpool_limiter,
         )
 
     def post(
@@ -2453,6 +2719,53 @@ class APIRouter(routing.Router):
                 """
             ),
         ] = Default(generate_unique_id),
+        concurrent_dependencies: Annotated[
+            bool,
+            Doc(
+                """
+                Resolve the independent async dependencies of this *path
+                operation* concurrently instead of one after another.
+
+                Sibling dependencies that are `async def` functions (or async
+                generators) and don't share any sub-dependencies are run together
+                in an AnyIO task group. Cached values, the exit order of
+                dependencies with `yield`, and validation errors are the same as
+                when they run sequentially.
+
+                To opt in a single dependency instead, use
+                `Depends(..., concurrent=True)`.
+                """
+            ),
+        ] = False,
+        response_model_validate: Annotated[
+            Literal["full", "serialize_only"],
+            Doc(
+                """
+                How the returned value is checked against the response model.
+
+                By default (`"full"`), the returned data is validated with the response
+                model before it's serialized, for `def` functions in a threadpool.
+
+                With `"serialize_only"`, a returned value that is already an instance of
+                the response model (or a list of them), for example a Pydantic model built
+                by the *path operation function*, is serialized directly, skipping the
+                validation pass and the threadpool hop. Any other value is validated as
+                with `"full"`.
+                """
+            ),
+        ] = "full",
+        threadpool_limiter: Annotated[
+            Optional[ThreadpoolLimiter],
+            Doc(
+                """
+                A `ThreadpoolLimiter` to run the *path operation function* and its
+                dependencies in, when they are not `async`, instead of the threadpool
+                shared with the rest of the app.
+
+                By default, the one of the router, if any.
+                """
+            ),
+        ] = None,
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP POST operation.
@@ -2502,6 +2815,9 @@ class APIRouter(routing.Router):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            concurrent_dependencies=concurrent_dependencies,
+            response_model_validate=response_model_validate,
+            threadpool_limiter=threadpool_limiter,
         )
 
     def delete(
@@ -2835,6 +3151,53 @@ class APIRouter(routing.Router):
                 """
             ),
         ] = Default(generate_unique_id),
+        concurrent_dependencies: Annotated[
+            bool,
+            Doc(
+                """
+                Resolve the independent async dependencies of this *path
+                operation* concurrently instead of one after another.
+
+                Sibling dependencies that are `async def` functions (or async
+                generators) and don't share any sub-dependencies are run together
+                in an AnyIO task group. Cached values, the exit order of
+                dependencies with `yield`, and validation errors are the same as
+                when they run sequentially.
+
+                To opt in a single dependency instead, use
+                `Depends(..., concurrent=True)`.
+                """
+            ),
+        ] = False,
+        response_model_validate: Annotated[
+            Literal["full", "serialize_only"],
+            Doc(
+                """
+                How the returned value is checked against the response model.
+
+                By default (`"full"`), the returned data is validated with the response
+                model before it's serialized, for `def` functions in a threadpool.
+
+                With `"serialize_only"`, a returned value that is already an instance of
+                the response model (or a list of them), for example a Pydantic model built
+                by the *path operation function*, is serialized directly, skipping the
+                validation pass and the threadpool hop. Any other value is validated as
+                with `"full"`.
+                """
+            ),
+        ] = "full",
+        threadpool_limiter: Annotated[
+            Optional[ThreadpoolLimiter],
+            Doc(
+                """
+                A `ThreadpoolLimiter` to run the *path operation function* and its
+                dependencies in, when they are not `async`, instead of the threadpool
+                shared with the rest of the app.
+
+                By default, the one of the router, if any.
+                """
+            ),
+        ] = None,
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP DELETE operation.
@@ -2879,6 +3242,9 @@ class APIRouter(routing.Router):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            concurrent_dependencies=concurrent_dependencies,
+            response_model_validate=response_model_validate,
+            threadpool_limiter=threadpool_limiter,
         )
 
     def options(
@@ -3212,6 +3578,53 @@ class APIRouter(routing.Router):
                 """
             ),
         ] = Default(generate_unique_id),
+        concurrent_dependencies: Annotated[
+            bool,
+            Doc(
+                """
+                Resolve the independent async dependencies of this *path
+                operation* concurrently instead of one after another.
+
+                Sibling dependencies that are `async def` functions (or async
+                generators) and don't share any sub-dependencies are run together
+                in an AnyIO task group. Cached values, the exit order of
+                dependencies with `yield`, and validation errors are the same as
+                when they run sequentially.
+
+                To opt in a single dependency instead, use
+                `Depends(..., concurrent=True)`.
+                """
+            ),
+        ] = False,
+        response_model_validate: Annotated[
+            Literal["full", "serialize_only"],
+            Doc(
+                """
+                How the returned value is checked against the response model.
+
+                By default (`"full"`), the returned data is validated with the response
+                model before it's serialized, for `def` functions in a threadpool.
+
+                With `"serialize_only"`, a returned value that is already an instance of
+                the response model (or a list of them), for example a Pydantic model built
+                by the *path operation function*, is serialized directly, skipping the
+                validation pass and the threadpool hop. Any other value is validated as
+                with `"full"`.
+                """
+            ),
+        ] = "full",
+        threadpool_limiter: Annotated[
+            Optional[ThreadpoolLimiter],
+            Doc(
+                """
+                A `ThreadpoolLimiter` to run the *path operation function* and its
+                dependencies in, when they are not `async`, instead of the threadpool
+                shared with the rest of the app.
+
+                By default, the one of the router, if any.
+                """
+            ),
+        ] = None,
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP OPTIONS operation.
@@ -3256,6 +3669,9 @@ class APIRouter(routing.Router):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            concurrent_dependencies=concurrent_dependencies,
+            response_model_validate=response_model_validate,
+            threadpool_limiter=threadpool_limiter,
         )
 
     def head(
@@ -3589,6 +4005,53 @@ class APIRouter(routing.Router):
                 """
             ),
         ] = Default(generate_unique_id),
+        concurrent_dependencies: Annotated[
+            bool,
+            Doc(
+                """
+                Resolve the independent async dependencies of this *path
+                operation* concurrently instead of one after another.
+
+                Sibling dependencies that are `async def` functions (or async
+                generators) and don't share any sub-dependencies are run together
+                in an AnyIO task group. Cached values, the exit order of
+                dependencies with `yield`, and validation errors are the same as
+                when they run sequentially.
+
+                To opt in a single dependency instead, use
+                `Depends(..., concurrent=True)`.
+                """
+            ),
+        ] = False,
+        response_model_validate: Annotated[
+            Literal["full", "serialize_only"],
+            Doc(
+                """
+                How the returned value is checked against the response model.
+
+                By default (`"full"`), the returned data is validated with the response
+                model before it's serialized, for `def` functions in a threadpool.
+
+                With `"serialize_only"`, a returned value that is already an instance of
+                the response model (or a list of them), for example a Pydantic model built
+                by the *path operation function*, is serialized directly, skipping the
+                validation pass and the threadpool hop. Any other value is validated as
+                with `"full"`.
+                """
+            ),
+        ] = "full",
+        threadpool_limiter: Annotated[
+            Optional[ThreadpoolLimiter],
+            Doc(
+                """
+                A `ThreadpoolLimiter` to run the *path operation function* and its
+                dependencies in, when they are not `async`, instead of the threadpool
+                shared with the rest of the app.
+
+                By default, the one of the router, if any.
+                """
+            ),
+        ] = None,
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP HEAD operation.
@@ -3638,6 +4101,9 @@ class APIRouter(routing.Router):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            concurrent_dependencies=concurrent_dependencies,
+            response_model_validate=response_model_validate,
+            threadpool_limiter=threadpool_limiter,
         )
 
     def patch(
@@ -3971,6 +4437,53 @@ class APIRouter(routing.Router):
                 """
             ),
         ] = Default(generate_unique_id),
+        concurrent_dependencies: Annotated[
+            bool,
+            Doc(
+                """
+                Resolve the independent async dependencies of this *path
+                operation* concurrently instead of one after another.
+
+                Sibling dependencies that are `async def` functions (or async
+                generators) and don't share any sub-dependencies are run together
+                in an AnyIO task group. Cached values, the exit order of
+                dependencies with `yield`, and validation errors are the same as
+                when they run sequentially.
+
+                To opt in a single dependency instead, use
+                `Depends(..., concurrent=True)`.
+                """
+            ),
+        ] = False,
+        response_model_validate: Annotated[
+            Literal["full", "serialize_only"],
+            Doc(
+                """
+                How the returned value is checked against the response model.
+
+                By default (`"full"`), the returned data is validated with the response
+                model before it's serialized, for `def` functions in a threadpool.
+
+                With `"serialize_only"`, a returned value that is already an instance of
+                the response model (or a list of them), for example a Pydantic model built
+                by the *path operation function*, is serialized directly, skipping the
+                validation pass and the threadpool hop. Any other value is validated as
+                with `"full"`.
+                """
+            ),
+        ] = "full",
+        threadpool_limiter: Annotated[
+            Optional[ThreadpoolLimiter],
+            Doc(
+                """
+                A `ThreadpoolLimiter` to run the *path operation function* and its
+                dependencies in, when they are not `async`, instead of the threadpool
+                shared with the rest of the app.
+
+                By default, the one of the router, if any.
+                """
+            ),
+        ] = None,
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP PATCH operation.
@@ -4020,6 +4533,9 @@ class APIRouter(routing.Router):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            concurrent_dependencies=concurrent_dependencies,
+            response_model_validate=response_model_validate,
+            threadpool_limiter=threadpool_limiter,
         )
 
     def trace(
@@ -4353,6 +4869,53 @@ class APIRouter(routing.Router):
                 """
             ),
         ] = Default(generate_unique_id),
+        concurrent_dependencies: Annotated[
+            bool,
+            Doc(
+                """
+                Resolve the independent async dependencies of this *path
+                operation* concurrently instead of one after another.
+
+                Sibling dependencies that are `async def` functions (or async
+                generators) and don't share any sub-dependencies are run together
+                in an AnyIO task group. Cached values, the exit order of
+                dependencies with `yield`, and validation errors are the same as
+                when they run sequentially.
+
+                To opt in a single dependency instead, use
+                `Depends(..., concurrent=True)`.
+                """
+            ),
+        ] = False,
+        response_model_validate: Annotated[
+            Literal["full", "serialize_only"],
+            Doc(
+                """
+                How the returned value is checked against the response model.
+
+                By default (`"full"`), the returned data is validated with the response
+                model before it's serialized, for `def` functions in a threadpool.
+
+                With `"serialize_only"`, a returned value that is already an instance of
+                the response model (or a list of them), for example a Pydantic model built
+                by the *path operation function*, is serialized directly, skipping the
+                validation pass and the threadpool hop. Any other value is validated as
+                with `"full"`.
+                """
+            ),
+        ] = "full",
+        threadpool_limiter: Annotated[
+            Optional[ThreadpoolLimiter],
+            Doc(
+                """
+                A `ThreadpoolLimiter` to run the *path operation function* and its
+                dependencies in, when they are not `async`, instead of the threadpool
+                shared with the rest of the app.
+
+                By default, the one of the router, if any.
+                """
+            ),
+        ] = None,
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP TRACE operation.
@@ -4402,6 +4965,9 @@ class APIRouter(routing.Router):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            concurrent_dependencies=concurrent_dependencies,
+            response_model_validate=response_model_validate,
+            threadpool_limiter=threadpool_limiter,
         )
 
     @deprecated(
@@ -98,3 +98,24 @@ def get_route_path(scope: Scope) -> str:
         return path[len(root_path) :]
 
     return path
+
+
+def get_accepted_encodings(accept_encoding: str) -> set[str]:
+    """
+    Return the content codings accepted by an `Accept-Encoding` header value,
+    leaving out those with `q=0`.
+    """
+    encodings = set()
+    for item in accept_encoding.split(","):
+        encoding, _, params = item.partition(";")
+        encoding = encoding.strip().lower()
+        q = params.strip().lower()
+        if q.startswith("q="):
+            try:
+                if float(q[2:]) == 0:
+                    continue
+            except ValueError:
+                continue
+        if encoding:
+            encodings.add(encoding)
+    return encodings
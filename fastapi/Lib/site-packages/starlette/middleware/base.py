@@ -13,6 +13,10 @@ RequestResponseEndpoint = typing.Callable[[Request], typing.Awaitable[Response]]
 DispatchFunction = typing.Callable[[Request, RequestResponseEndpoint], typing.Awaitable[Response]]
 T = typing.TypeVar("T")
 
+# Extensions that let the app hand a file to the server instead of sending body
+# messages, which call_next() can't pass on as the response's body_iterator
+_FILE_SEND_EXTENSIONS = ("http.response.pathsend", "http.response.zerocopysend")
+
 
 class _CachedRequest(Request):
     """
@@ -135,9 +139,20 @@ class BaseHTTPMiddleware:
             async def coro() -> None:
                 nonlocal app_exc
 
+                app_scope = scope
+                extensions = scope.get("extensions") or {}
+                if any(extension in extensions for extension in _FILE_SEND_EXTENSIONS):
+                    # So that file responses are sent as body chunks
+                    app_scope = {
+                        **scope,
+                        "extensions": {
+                            key: value for key, value in extensions.items() if key not in _FILE_SEND_EXTENSIONS
+                        },
+                    }
+
                 with send_stream:
                     try:
-                        await self.app(scope, receive_or_disconnect, send_no_error)
+                        await self.app(app_scope, receive_or_disconnect, send_no_error)
                     except Exception as exc:
                         app_exc = exc
 
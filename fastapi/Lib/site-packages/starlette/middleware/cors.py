@@ -23,6 +23,7 @@ class CORSMiddleware:
         allow_origin_regex: str | None = None,
         expose_headers: typing.Sequence[str] = (),
         max_age: int = 600,
+        preflight_cache_size: int = 1024,
     ) -> None:
         if "*" in allow_methods:
             allow_methods = ALL_METHODS
@@ -62,15 +63,19 @@ class CORSMiddleware:
             preflight_headers["Access-Control-Allow-Credentials"] = "true"
 
         self.app = app
-        self.allow_origins = allow_origins
-        self.allow_methods = allow_methods
-        self.allow_headers = [h.lower() for h in allow_headers]
+        self.allow_origins = frozenset(allow_origins)
+        self.allow_methods = frozenset(allow_methods)
+        self.allow_headers = frozenset(h.lower() for h in allow_headers)
         self.allow_all_origins = allow_all_origins
         self.allow_all_headers = allow_all_headers
         self.preflight_explicit_allow_origin = preflight_explicit_allow_origin
         self.allow_origin_regex = compiled_allow_origin_regex
         self.simple_headers = simple_headers
         self.preflight_headers = preflight_headers
+        # Rendered preflight responses (status, raw headers, body) by origin,
+        # requested method and requested headers, oldest first.
+        self.preflight_cache: dict[tuple[str, str, str | None], tuple[int, list[tuple[bytes, bytes]], bytes]] = {}
+        self.preflight_cache_size = preflight_cache_size
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         if scope["type"] != "http":  # pragma: no cover
@@ -86,8 +91,7 @@ class CORSMiddleware:
             return
 
         if method == "OPTIONS" and "access-control-request-method" in headers:
-            response = self.preflight_response(request_headers=headers)
-            await response(scope, receive, send)
+            await self.send_preflight_response(send, request_headers=headers)
             return
 
         await self.simple_response(scope, receive, send, request_headers=headers)
@@ -101,6 +105,27 @@ class CORSMiddleware:
 
         return origin in self.allow_origins
 
+    async def send_preflight_response(self, send: Send, request_headers: Headers) -> None:
+        key = (
+            request_headers["origin"],
+            request_headers["access-control-request-method"],
+            request_headers.get("access-control-request-headers"),
+        )
+        cached = self.preflight_cache.get(key)
+        if cached is None:
+            response = self.preflight_response(request_headers=request_headers)
+            cached = (response.status_code, response.raw_headers, response.body)
+            if self.preflight_cache_size > 0:
+                if len(self.preflight_cache) >= self.preflight_cache_size:
+                    # Drop the oldest entry, so that arbitrary origins or headers
+                    # can't grow the cache without bound.
+                    del self.preflight_cache[next(iter(self.preflight_cache))]
+                self.preflight_cache[key] = cached
+
+        status_code, raw_headers, body = cached
+        await send({"type": "http.response.start", "status": status_code, "headers": list(raw_headers)})
+        await send({"type": "http.response.body", "body": body})
+
     def preflight_response(self, request_headers: Headers) -> Response:
         requested_origin = request_headers["origin"]
         requested_method = request_headers["access-control-request-method"]
@@ -1,18 +1,66 @@
-import gzip
-import io
+import functools
 import typing
+import zlib
 
+import anyio.to_thread
+
+from starlette._utils import get_accepted_encodings
 from starlette.datastructures import Headers, MutableHeaders
 from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+try:
+    import brotli
+except ModuleNotFoundError:  # pragma: no cover
+    brotli = None
+
+try:
+    from compression import zstd  # type: ignore[import-not-found,unused-ignore]
+except ModuleNotFoundError:  # pragma: no cover
+    try:
+        import zstandard as zstd  # type: ignore[import-not-found,unused-ignore,no-redef]
+    except ModuleNotFoundError:
+        zstd = None
+
 DEFAULT_EXCLUDED_CONTENT_TYPES = ("text/event-stream",)
 
 
+class Compressor(typing.Protocol):
+    def compress(self, data: bytes) -> bytes: ...  # pragma: no cover
+
+    def flush(self) -> bytes: ...  # pragma: no cover
+
+
 class GZipMiddleware:
-    def __init__(self, app: ASGIApp, minimum_size: int = 500, compresslevel: int = 9) -> None:
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 500,
+        compresslevel: int = 9,
+        *,
+        fast_compresslevel: int = 1,
+        large_body_size: int = 64 * 1024,
+        offload_size: int = 16 * 1024,
+        encodings: typing.Sequence[str] = ("gzip",),
+    ) -> None:
         self.app = app
         self.minimum_size = minimum_size
         self.compresslevel = compresslevel
+        # Used instead of `compresslevel` for bodies of at least `large_body_size`
+        # bytes and for streamed bodies of unknown size
+        self.fast_compresslevel = fast_compresslevel
+        self.large_body_size = large_body_size
+        # Bodies of at least `offload_size` bytes are compressed in a worker
+        # thread, so they don't block the event loop
+        self.offload_size = offload_size
+        # Only gzip unless other encodings are enabled, like `encodings=["zstd", "br", "gzip"]`
+        for encoding in encodings:
+            if encoding not in RESPONDERS:
+                raise ValueError(f"Unsupported content encoding {encoding!r}")
+            if not RESPONDERS[encoding].is_available():
+                package = RESPONDERS[encoding].package
+                raise RuntimeError(f"The {encoding!r} content encoding requires the {package!r} package")
+        # In order of preference
+        self.encodings = tuple(encodings)
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         if scope["type"] != "http":  # pragma: no cover
@@ -20,11 +68,23 @@ class GZipMiddleware:
             return
 
         headers = Headers(scope=scope)
-        responder: ASGIApp
-        if "gzip" in headers.get("Accept-Encoding", ""):
-            responder = GZipResponder(self.app, self.minimum_size, compresslevel=self.compresslevel)
-        else:
-            responder = IdentityResponder(self.app, self.minimum_size)
+        accepted = get_accepted_encodings(headers.get("Accept-Encoding", ""))
+        responder: ASGIApp = IdentityResponder(
+            self.app, self.minimum_size, large_body_size=self.large_body_size, offload_size=self.offload_size
+        )
+        for encoding in self.encodings:
+            if encoding in accepted:
+                responder_class = RESPONDERS[encoding]
+                responder = responder_class(
+                    self.app,
+                    self.minimum_size,
+                    # `compresslevel` and `fast_compresslevel` are gzip levels
+                    compresslevel=self.compresslevel if encoding == "gzip" else None,
+                    fast_compresslevel=self.fast_compresslevel if encoding == "gzip" else None,
+                    large_body_size=self.large_body_size,
+                    offload_size=self.offload_size,
+                )
+                break
 
         await responder(scope, receive, send)
 
@@ -32,14 +92,25 @@ class GZipMiddleware:
 class IdentityResponder:
     content_encoding: str
 
-    def __init__(self, app: ASGIApp, minimum_size: int) -> None:
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int,
+        *,
+        large_body_size: int = 64 * 1024,
+        offload_size: int = 16 * 1024,
+    ) -> None:
         self.app = app
         self.minimum_size = minimum_size
+        self.large_body_size = large_body_size
+        self.offload_size = offload_size
         self.send: Send = unattached_send
         self.initial_message: Message = {}
         self.started = False
         self.content_encoding_set = False
         self.content_type_is_excluded = False
+        self.content_length: typing.Optional[int] = None
+        self.compressing = False
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         self.send = send
@@ -54,7 +125,15 @@ class IdentityResponder:
             headers = Headers(raw=self.initial_message["headers"])
             self.content_encoding_set = "content-encoding" in headers
             self.content_type_is_excluded = headers.get("content-type", "").startswith(DEFAULT_EXCLUDED_CONTENT_TYPES)
-        elif message_type == "http.response.body" and (self.content_encoding_set or self.content_type_is_excluded):
+            content_length = headers.get("content-length", "")
+            if content_length.isdigit():
+                self.content_length = int(content_length)
+        elif message_type == "http.response.body" and (
+            self.content_encoding_set
+            or self.content_type_is_excluded
+            # Don't apply compression to small outgoing responses, even streamed.
+            or (self.content_length is not None and self.content_length < self.minimum_size)
+        ):
             if not self.started:
                 self.started = True
                 await self.send(self.initial_message)
@@ -69,11 +148,12 @@ class IdentityResponder:
                 await self.send(message)
             elif not more_body:
                 # Standard response.
-                body = self.apply_compression(body, more_body=False)
+                self.start_compression(large=len(body) >= self.large_body_size)
+                body = await self.compress(body, more_body=False)
 
                 headers = MutableHeaders(raw=self.initial_message["headers"])
                 headers.add_vary_header("Accept-Encoding")
-                if body != message["body"]:
+                if self.compressing:
                     headers["Content-Encoding"] = self.content_encoding
                     headers["Content-Length"] = str(len(body))
                     message["body"] = body
@@ -82,26 +162,47 @@ class IdentityResponder:
                 await self.send(message)
             else:
                 # Initial body in streaming response.
-                body = self.apply_compression(body, more_body=True)
+                self.start_compression(large=self.content_length is None or self.content_length >= self.large_body_size)
+                body = await self.compress(body, more_body=True)
 
                 headers = MutableHeaders(raw=self.initial_message["headers"])
                 headers.add_vary_header("Accept-Encoding")
-                if body != message["body"]:
+                if self.compressing:
                     headers["Content-Encoding"] = self.content_encoding
                     del headers["Content-Length"]
                     message["body"] = body
 
                 await self.send(self.initial_message)
                 await self.send(message)
+        elif message_type in ("http.response.pathsend", "http.response.zerocopysend"):
+            # The server sends the file as is, without compression
+            if not self.started:
+                self.started = True
+                headers = MutableHeaders(raw=self.initial_message["headers"])
+                headers.add_vary_header("Accept-Encoding")
+                await self.send(self.initial_message)
+            await self.send(message)
         elif message_type == "http.response.body":  # pragma: no branch
             # Remaining body in streaming response.
             body = message.get("body", b"")
             more_body = message.get("more_body", False)
 
-            message["body"] = self.apply_compression(body, more_body=more_body)
+            message["body"] = await self.compress(body, more_body=more_body)
 
             await self.send(message)
 
+    async def compress(self, body: bytes, *, more_body: bool) -> bytes:
+        if self.compressing and len(body) >= self.offload_size:
+            return await anyio.to_thread.run_sync(functools.partial(self.apply_compression, body, more_body=more_body))
+        return self.apply_compression(body, more_body=more_body)
+
+    def start_compression(self, *, large: bool) -> None:
+        """Prepare to compress the response body.
+
+        `large` is True when the body is large or streamed with an unknown size,
+        so that a faster compression level can be used.
+        """
+
     def apply_compression(self, body: bytes, *, more_body: bool) -> bytes:
         """Apply compression on the response body.
 
@@ -112,29 +213,108 @@ class IdentityResponder:
         return body
 
 
-class GZipResponder(IdentityResponder):
-    content_encoding = "gzip"
+class CompressionResponder(IdentityResponder):
+    # The package needed for the encoding, if any
+    package: typing.Optional[str] = None
+    compresslevel: int
+    fast_compresslevel: int
 
-    def __init__(self, app: ASGIApp, minimum_size: int, compresslevel: int = 9) -> None:
-        super().__init__(app, minimum_size)
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int,
+        compresslevel: typing.Optional[int] = None,
+        *,
+        fast_compresslevel: typing.Optional[int] = None,
+        large_body_size: int = 64 * 1024,
+        offload_size: int = 16 * 1024,
+    ) -> None:
+        super().__init__(app, minimum_size, large_body_size=large_body_size, offload_size=offload_size)
+        if compresslevel is not None:
+            self.compresslevel = compresslevel
+        if fast_compresslevel is not None:
+            self.fast_compresslevel = fast_compresslevel
+        self.compressor: typing.Optional[Compressor] = None
 
-        self.gzip_buffer = io.BytesIO()
-        self.gzip_file = gzip.GzipFile(mode="wb", fileobj=self.gzip_buffer, compresslevel=compresslevel)
+    @classmethod
+    def is_available(cls) -> bool:
+        return True
 
-    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
-        with self.gzip_buffer, self.gzip_file:
-            await super().__call__(scope, receive, send)
+    def create_compressor(self, level: int) -> Compressor:
+        raise NotImplementedError()  # pragma: no cover
+
+    def start_compression(self, *, large: bool) -> None:
+        self.compressor = self.create_compressor(self.fast_compresslevel if large else self.compresslevel)
+        self.compressing = True
 
     def apply_compression(self, body: bytes, *, more_body: bool) -> bytes:
-        self.gzip_file.write(body)
+        assert self.compressor is not None
+        body = self.compressor.compress(body)
         if not more_body:
-            self.gzip_file.close()
+            body += self.compressor.flush()
+        return body
 
-        body = self.gzip_buffer.getvalue()
-        self.gzip_buffer.seek(0)
-        self.gzip_buffer.truncate()
 
-        return body
+class GZipResponder(CompressionResponder):
+    content_encoding = "gzip"
+    compresslevel = 9
+    fast_compresslevel = 1
+
+    def create_compressor(self, level: int) -> Compressor:
+        # A gzip header and trailer around the deflate stream
+        return zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+
+class _BrotliCompressor:
+    def __init__(self, quality: int) -> None:
+        self.compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return typing.cast(bytes, self.compressor.process(data))
+
+    def flush(self) -> bytes:
+        return typing.cast(bytes, self.compressor.finish())
+
+
+class BrotliResponder(CompressionResponder):
+    content_encoding = "br"
+    package = "brotli"
+    compresslevel = 5
+    fast_compresslevel = 1
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return brotli is not None
+
+    def create_compressor(self, level: int) -> Compressor:
+        return _BrotliCompressor(level)
+
+
+class ZstdResponder(CompressionResponder):
+    content_encoding = "zstd"
+    package = "zstandard"
+    compresslevel = 6
+    fast_compresslevel = 1
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return zstd is not None
+
+    def create_compressor(self, level: int) -> Compressor:
+        compressor = zstd.ZstdCompressor(level=level)
+        if hasattr(compressor, "compressobj"):
+            # zstandard
+            return typing.cast(Compressor, compressor.compressobj())
+        # compression.zstd, flushing a frame by default
+        return typing.cast(Compressor, compressor)
+
+
+# The supported encodings
+RESPONDERS: typing.Dict[str, typing.Type[CompressionResponder]] = {
+    "zstd": ZstdResponder,
+    "br": BrotliResponder,
+    "gzip": GZipResponder,
+}
 
 
 async def unattached_send(message: Message) -> typing.NoReturn:
@@ -338,6 +338,10 @@ class FileResponse(Response):
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         send_header_only: bool = scope["method"].upper() == "HEAD"
+        extensions = scope.get("extensions", {})
+        # Let the server send the file, with sendfile() where it can
+        send_pathsend: bool = "http.response.pathsend" in extensions
+        send_zerocopy: bool = "http.response.zerocopysend" in extensions
         if self.stat_result is None:
             try:
                 stat_result = await anyio.to_thread.run_sync(os.stat, self.path)
@@ -356,7 +360,7 @@ class FileResponse(Response):
         http_if_range = headers.get("if-range")
 
         if http_range is None or (http_if_range is not None and not self._should_use_range(http_if_range)):
-            await self._handle_simple(send, send_header_only)
+            await self._handle_simple(send, send_header_only, send_pathsend, send_zerocopy)
         else:
             try:
                 ranges = self._parse_range_header(http_range, stat_result.st_size)
@@ -368,17 +372,25 @@ class FileResponse(Response):
 
             if len(ranges) == 1:
                 start, end = ranges[0]
-                await self._handle_single_range(send, start, end, stat_result.st_size, send_header_only)
+                await self._handle_single_range(
+                    send, start, end, stat_result.st_size, send_header_only, send_zerocopy
+                )
             else:
                 await self._handle_multiple_ranges(send, ranges, stat_result.st_size, send_header_only)
 
         if self.background is not None:
             await self.background()
 
-    async def _handle_simple(self, send: Send, send_header_only: bool) -> None:
+    async def _handle_simple(
+        self, send: Send, send_header_only: bool, send_pathsend: bool = False, send_zerocopy: bool = False
+    ) -> None:
         await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
         if send_header_only:
             await send({"type": "http.response.body", "body": b"", "more_body": False})
+        elif send_pathsend:
+            await send({"type": "http.response.pathsend", "path": os.path.abspath(self.path)})
+        elif send_zerocopy:
+            await self._send_zerocopy(send, 0, None)
         else:
             async with await anyio.open_file(self.path, mode="rb") as file:
                 more_body = True
@@ -388,13 +400,21 @@ class FileResponse(Response):
                     await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
 
     async def _handle_single_range(
-        self, send: Send, start: int, end: int, file_size: int, send_header_only: bool
+        self,
+        send: Send,
+        start: int,
+        end: int,
+        file_size: int,
+        send_header_only: bool,
+        send_zerocopy: bool = False,
     ) -> None:
         self.headers["content-range"] = f"bytes {start}-{end - 1}/{file_size}"
         self.headers["content-length"] = str(end - start)
         await send({"type": "http.response.start", "status": 206, "headers": self.raw_headers})
         if send_header_only:
             await send({"type": "http.response.body", "body": b"", "more_body": False})
+        elif send_zerocopy:
+            await self._send_zerocopy(send, start, end - start)
         else:
             async with await anyio.open_file(self.path, mode="rb") as file:
                 await file.seek(start)
@@ -405,6 +425,21 @@ class FileResponse(Response):
                     more_body = len(chunk) == self.chunk_size and start < end
                     await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
 
+    async def _send_zerocopy(self, send: Send, offset: int, count: int | None) -> None:
+        file = await anyio.to_thread.run_sync(open, self.path, "rb")
+        try:
+            await send(
+                {
+                    "type": "http.response.zerocopysend",
+                    "file": file,
+                    "offset": offset,
+                    "count": count,
+                    "more_body": False,
+                }
+            )
+        finally:
+            file.close()
+
     async def _handle_multiple_ranges(
         self,
         send: Send,
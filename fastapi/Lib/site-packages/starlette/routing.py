@@ -530,6 +530,85 @@ class Host(BaseRoute):
         return f"{class_name}(host={self.host!r}, name={name!r}, app={self.app!r})"
 
 
+class _RouteIndexNode:
+    __slots__ = ("children", "prefix", "terminal")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _RouteIndexNode] = {}
+        # Indexes of routes that may match any path passing through this node.
+        self.prefix: list[int] = []
+        # Indexes of fully static routes that can only match a path ending at this node.
+        self.terminal: list[int] = []
+
+
+class _RouteIndex:
+    """
+    A radix tree keyed on static path segments, used by `Router(compiled_dispatch=True)`.
+
+    Each route is stored at the node for the static segments that lead its path,
+    up to the first segment containing a path parameter. Looking up a request path
+    walks the tree one segment at a time and yields only the routes that could
+    possibly match, in their original order. Those candidates are still checked
+    with `route.matches()`, so matching semantics, including `Match.PARTIAL`
+    for "405 Method Not Allowed", are unchanged.
+
+    `Host` routes and custom `BaseRoute` subclasses don't have a static path to
+    index on, and are always treated as candidates.
+    """
+
+    def __init__(self, routes: typing.Sequence[BaseRoute], version: int = 0) -> None:
+        # The list the index was built from, its length and the router's
+        # `_routes_version` at that time, to tell cheaply when it's outdated
+        self.source = routes
+        self.size = len(routes)
+        self.version = version
+        self.routes = list(routes)
+        self.root = _RouteIndexNode()
+        for index, route in enumerate(self.routes):
+            self._insert(index, route)
+
+    def _insert(self, index: int, route: BaseRoute) -> None:
+        if isinstance(route, (Route, WebSocketRoute)):
+            segments = route.path.split("/")[1:]
+            is_mount = False
+        elif isinstance(route, Mount):
+            segments = route.path.split("/")[1:] if route.path else []
+            is_mount = True
+        else:
+            self.root.prefix.append(index)
+            return
+
+        node = self.root
+        for segment in segments:
+            if "{" in segment:
+                node.prefix.append(index)
+                return
+            node = node.children.setdefault(segment, _RouteIndexNode())
+        if is_mount:
+            node.prefix.append(index)
+        else:
+            node.terminal.append(index)
+
+    def candidates(self, route_path: str) -> list[BaseRoute]:
+        if route_path.endswith("\n"):
+            # The compiled path regexes end with "$", which also matches before a
+            # trailing newline. Keep the exact behaviour by checking every route.
+            return self.routes
+
+        node = self.root
+        indexes = list(node.prefix)
+        for segment in route_path.split("/")[1:]:
+            child = node.children.get(segment)
+            if child is None:
+                break
+            node = child
+            indexes.extend(node.prefix)
+        else:
+            indexes.extend(node.terminal)
+        indexes.sort()
+        return [self.routes[index] for index in indexes]
+
+
 _T = typing.TypeVar("_T")
 
 
@@ -588,9 +667,17 @@ class Router:
         lifespan: Lifespan[typing.Any] | None = None,
         *,
         middleware: typing.Sequence[Middleware] | None = None,
+        compiled_dispatch: bool = False,
     ) -> None:
         self.routes = [] if routes is None else list(routes)
         self.redirect_slashes = redirect_slashes
+        # When enabled, only routes whose static path prefix matches the request
+        # path are tried, instead of every route in order. See `_RouteIndex`.
+        self.compiled_dispatch = compiled_dispatch
+        self._route_index: _RouteIndex | None = None
+        # Bumped by the methods that add routes. Routes appended to `self.routes`
+        # directly are noticed by the length check in `_candidate_routes()`.
+        self._routes_version = 0
         self.default = self.not_found if default is None else default
         self.on_startup = [] if on_startup is None else list(on_startup)
         self.on_shutdown = [] if on_shutdown is None else list(on_shutdown)
@@ -660,6 +747,22 @@ class Router:
                 pass
         raise NoMatchFound(name, path_params)
 
+    def _candidate_routes(self, route_path: str) -> list[BaseRoute]:
+        if not self.compiled_dispatch:
+            return self.routes
+        # `self.routes` is a public list that gets appended to directly, or
+        # replaced, so rebuild the index whenever it no longer reflects it.
+        # Only constant time checks here, as this runs for every request.
+        index = self._route_index
+        if (
+            index is None
+            or index.source is not self.routes
+            or index.size != len(self.routes)
+            or index.version != self._routes_version
+        ):
+            index = self._route_index = _RouteIndex(self.routes, self._routes_version)
+        return index.candidates(route_path)
+
     async def startup(self) -> None:
         """
         Run any `.on_startup` event handlers.
@@ -724,8 +827,9 @@ class Router:
             return
 
         partial = None
+        route_path = get_route_path(scope)
 
-        for route in self.routes:
+        for route in self._candidate_routes(route_path):
             # Determine if any route matches the incoming scope,
             # and hand over to the matching route if found.
             match, child_scope = route.matches(scope)
@@ -745,7 +849,6 @@ class Router:
             await partial.handle(scope, receive, send)
             return
 
-        route_path = get_route_path(scope)
         if scope["type"] == "http" and self.redirect_slashes and route_path != "/":
             redirect_scope = dict(scope)
             if route_path.endswith("/"):
@@ -753,7 +856,7 @@ class Router:
             else:
                 redirect_scope["path"] = redirect_scope["path"] + "/"
 
-            for route in self.routes:
+            for route in self._candidate_routes(get_route_path(redirect_scope)):
                 match, child_scope = route.matches(redirect_scope)
                 if match != Match.NONE:
                     redirect_url = URL(scope=redirect_scope)
@@ -769,10 +872,12 @@ class Router:
     def mount(self, path: str, app: ASGIApp, name: str | None = None) -> None:  # pragma: no cover
         route = Mount(path, app=app, name=name)
         self.routes.append(route)
+        self._routes_version += 1
 
     def host(self, host: str, app: ASGIApp, name: str | None = None) -> None:  # pragma: no cover
         route = Host(host, app=app, name=name)
         self.routes.append(route)
+        self._routes_version += 1
 
     def add_route(
         self,
@@ -790,6 +895,7 @@ class Router:
             include_in_schema=include_in_schema,
         )
         self.routes.append(route)
+        self._routes_version += 1
 
     def add_websocket_route(
         self,
@@ -799,6 +905,7 @@ class Router:
     ) -> None:  # pragma: no cover
         route = WebSocketRoute(path, endpoint=endpoint, name=name)
         self.routes.append(route)
+        self._routes_version += 1
 
     def route(
         self,
@@ -1,23 +1,127 @@
 from __future__ import annotations
 
 import errno
+import gzip
 import importlib.util
 import os
 import stat
+import time
 import typing
+from collections import OrderedDict
 from email.utils import parsedate
+from mimetypes import guess_type
 
 import anyio
 import anyio.to_thread
 
-from starlette._utils import get_route_path
+from starlette._utils import get_accepted_encodings, get_route_path
 from starlette.datastructures import URL, Headers
 from starlette.exceptions import HTTPException
 from starlette.responses import FileResponse, RedirectResponse, Response
 from starlette.types import Receive, Scope, Send
 
+try:
+    import brotli
+except ModuleNotFoundError:  # pragma: no cover
+    brotli = None
+
 PathLike = typing.Union[str, "os.PathLike[str]"]
 
+# Media types worth keeping a compressed copy of
+COMPRESSIBLE_MEDIA_TYPES = (
+    "text/",
+    "application/javascript",
+    "application/json",
+    "application/xml",
+    "image/svg+xml",
+)
+
+# The file name suffix of the precompressed copy of a file for each encoding, in
+# order of preference
+PRECOMPRESSED_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+
+def is_compressible(path: PathLike) -> bool:
+    media_type = guess_type(path)[0] or ""
+    return media_type.startswith(COMPRESSIBLE_MEDIA_TYPES)
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        assert brotli is not None, "The brotli package must be installed to use 'br'"
+        return typing.cast(bytes, brotli.compress(body))
+    return gzip.compress(body, compresslevel=9, mtime=0)
+
+
+def find_precompressed(full_path: str, stat_result: os.stat_result) -> dict[str, tuple[str, os.stat_result]]:
+    """
+    Return the precompressed copies of a file next to it (`file.js.br`,
+    `file.js.gz`), by encoding, ignoring those older than the file.
+    """
+    found = {}
+    for encoding, suffix in PRECOMPRESSED_SUFFIXES.items():
+        try:
+            sidecar_stat = os.stat(full_path + suffix)
+        except OSError:
+            continue
+        if stat.S_ISREG(sidecar_stat.st_mode) and sidecar_stat.st_mtime_ns >= stat_result.st_mtime_ns:
+            found[encoding] = (full_path + suffix, sidecar_stat)
+    return found
+
+
+def precompress_directory(
+    directory: PathLike,
+    encodings: typing.Sequence[str] = ("br", "gzip"),
+    min_size: int = 256,
+) -> list[str]:
+    """
+    Write the precompressed copies served by `StaticFiles(precompressed=True)`
+    next to each compressible file in `directory`, skipping those that are up to
+    date and those that wouldn't be meaningfully smaller. Return the paths of the
+    files written.
+    """
+    written = []
+    suffixes = tuple(PRECOMPRESSED_SUFFIXES.values())
+    for root, _, files in os.walk(directory):
+        for name in sorted(files):
+            full_path = os.path.join(root, name)
+            if name.endswith(suffixes) or not is_compressible(full_path):
+                continue
+            stat_result = os.stat(full_path)
+            if stat_result.st_size < min_size:
+                continue
+            existing = find_precompressed(full_path, stat_result)
+            body: bytes | None = None
+            for encoding in encodings:
+                sidecar_path = full_path + PRECOMPRESSED_SUFFIXES[encoding]
+                if encoding in existing or (encoding == "br" and brotli is None):
+                    continue
+                if body is None:
+                    with open(full_path, "rb") as file:
+                        body = file.read()
+                data = compress(body, encoding)
+                if len(data) >= len(body) * 0.9:
+                    if os.path.exists(sidecar_path):
+                        os.remove(sidecar_path)
+                    continue
+                # Written aside and renamed, so a partial file is never served
+                tmp_path = sidecar_path + ".tmp"
+                with open(tmp_path, "wb") as file:
+                    file.write(data)
+                # Same modification time as the file, to tell when it's outdated
+                os.utime(tmp_path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns))
+                os.replace(tmp_path, sidecar_path)
+                written.append(sidecar_path)
+    return written
+
+
+def variant_etag(etag: str, encoding: str) -> str:
+    """
+    The ETag of a compressed variant of a file, from the ETag of the file, the
+    same whether the variant is served from disk or from the cache.
+    """
+    return f'{etag[:-1]}-{encoding}"'
+
 
 class NotModifiedResponse(Response):
     NOT_MODIFIED_HEADERS = (
@@ -36,6 +140,135 @@ class NotModifiedResponse(Response):
         )
 
 
+class CachedFile:
+    """
+    The contents of a static file, with its response headers and compressed
+    variants, as held by `StaticFilesCache`.
+    """
+
+    def __init__(
+        self,
+        full_path: str,
+        stat_result: os.stat_result,
+        body: bytes,
+        raw_headers: list[tuple[bytes, bytes]],
+        variants: dict[str, bytes],
+        is_index: bool = False,
+    ) -> None:
+        self.full_path = full_path
+        self.stat_key = (stat_result.st_mtime_ns, stat_result.st_size)
+        self.body = body
+        self.headers = Headers(raw=raw_headers)
+        self.variants = variants
+        self.is_index = is_index
+        self.checked_at = time.monotonic()
+        self.size = len(body) + sum(len(variant) for variant in variants.values())
+        if variants:
+            raw_headers = raw_headers + [(b"vary", b"Accept-Encoding")]
+        self.raw_headers = raw_headers
+        # The headers of each compressed variant, with its own ETag
+        self.variant_raw_headers: dict[str, list[tuple[bytes, bytes]]] = {}
+        etag = self.headers.get("etag", "")
+        for encoding, variant in variants.items():
+            variant_headers = [
+                (key, value) for key, value in raw_headers if key not in (b"content-length", b"etag", b"accept-ranges")
+            ]
+            variant_headers.append((b"content-encoding", encoding.encode("latin-1")))
+            variant_headers.append((b"content-length", str(len(variant)).encode("latin-1")))
+            if etag:
+                variant_headers.append((b"etag", variant_etag(etag, encoding).encode("latin-1")))
+            self.variant_raw_headers[encoding] = variant_headers
+
+
+class StaticFilesCache:
+    """
+    A least recently used cache of static files contents, capped to `max_bytes`,
+    that revalidates each file by its modification time and size at most every
+    `check_interval` seconds.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        max_file_size: int,
+        check_interval: float,
+        compress: bool,
+        precompressed: bool = False,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.max_file_size = max_file_size
+        self.check_interval = check_interval
+        self.compress = compress
+        self.precompressed = precompressed
+        self.size = 0
+        self.files: OrderedDict[str, CachedFile] = OrderedDict()
+
+    def get(self, path: str) -> CachedFile | None:
+        cached = self.files.get(path)
+        if cached is not None:
+            self.files.move_to_end(path)
+        return cached
+
+    def needs_check(self, cached: CachedFile) -> bool:
+        return time.monotonic() - cached.checked_at >= self.check_interval
+
+    def is_current(self, cached: CachedFile, stat_result: os.stat_result | None) -> bool:
+        if stat_result is None or (stat_result.st_mtime_ns, stat_result.st_size) != cached.stat_key:
+            return False
+        cached.checked_at = time.monotonic()
+        return True
+
+    def put(self, path: str, cached: CachedFile) -> None:
+        self.discard(path)
+        if cached.size > self.max_bytes:
+            return
+        self.files[path] = cached
+        self.size += cached.size
+        while self.size > self.max_bytes:
+            _, evicted = self.files.popitem(last=False)
+            self.size -= evicted.size
+
+    def discard(self, path: str) -> None:
+        cached = self.files.pop(path, None)
+        if cached is not None:
+            self.size -= cached.size
+
+    def load(self, full_path: str, stat_result: os.stat_result, is_index: bool = False) -> CachedFile | None:
+        """
+        Read a file to cache, in a thread. Return `None` if it's too big or it
+        changed while it was read.
+        """
+        if stat_result.st_size > self.max_file_size:
+            return None
+        with open(full_path, "rb") as file:
+            body = file.read(self.max_file_size + 1)
+            if os.fstat(file.fileno()).st_mtime_ns != stat_result.st_mtime_ns or len(body) != stat_result.st_size:
+                return None
+        raw_headers = FileResponse(full_path, stat_result=stat_result).raw_headers
+        variants: dict[str, bytes] = {}
+        if self.precompressed:
+            for encoding, (sidecar_path, _) in find_precompressed(full_path, stat_result).items():
+                with open(sidecar_path, "rb") as file:
+                    variants[encoding] = file.read()
+        if self.compress and is_compressible(full_path):
+            for encoding in PRECOMPRESSED_SUFFIXES:
+                if encoding in variants or (encoding == "br" and brotli is None):
+                    continue
+                data = compress(body, encoding)
+                # Only keep variants that are meaningfully smaller
+                if len(data) < len(body) * 0.9:
+                    variants[encoding] = data
+        return CachedFile(full_path, stat_result, body, raw_headers, variants, is_index=is_index)
+
+
+class CachedFileResponse(Response):
+    def __init__(self, body: bytes, raw_headers: list[tuple[bytes, bytes]], status_code: int = 200) -> None:
+        self.status_code = status_code
+        self.body = body
+        self.raw_headers = list(raw_headers)
+        self.background = None
+
+
 class StaticFiles:
     def __init__(
         self,
@@ -45,6 +278,11 @@ class StaticFiles:
         html: bool = False,
         check_dir: bool = True,
         follow_symlink: bool = False,
+        cache_max_bytes: int = 0,
+        cache_max_file_size: int = 1024 * 1024,
+        cache_check_interval: float = 1.0,
+        cache_compress: bool = False,
+        precompressed: bool = False,
     ) -> None:
         self.directory = directory
         self.packages = packages
@@ -52,6 +290,21 @@ class StaticFiles:
         self.html = html
         self.config_checked = False
         self.follow_symlink = follow_symlink
+        # Serve `file.js.br` / `file.js.gz` next to `file.js` to clients that
+        # accept them, see `precompress_directory()`
+        self.precompressed = precompressed
+        # With `cache_max_bytes`, files up to `cache_max_file_size` are kept in
+        # memory and served without touching the disk, re-checking their
+        # modification time at most every `cache_check_interval` seconds.
+        self.cache: StaticFilesCache | None = None
+        if cache_max_bytes > 0:
+            self.cache = StaticFilesCache(
+                max_bytes=cache_max_bytes,
+                max_file_size=cache_max_file_size,
+                check_interval=cache_check_interval,
+                compress=cache_compress,
+                precompressed=precompressed,
+            )
         if check_dir and directory is not None and not os.path.isdir(directory):
             raise RuntimeError(f"Directory '{directory}' does not exist")
 
@@ -113,6 +366,13 @@ class StaticFiles:
         if scope["method"] not in ("GET", "HEAD"):
             raise HTTPException(status_code=405)
 
+        # Range requests are served from the file
+        use_cache = self.cache is not None and "range" not in Headers(scope=scope)
+        if use_cache:
+            response = await self.get_cached_response(path, scope)
+            if response is not None:
+                return response
+
         try:
             full_path, stat_result = await anyio.to_thread.run_sync(self.lookup_path, path)
         except PermissionError:
@@ -126,6 +386,12 @@ class StaticFiles:
 
         if stat_result and stat.S_ISREG(stat_result.st_mode):
             # We have a static file to serve.
+            if use_cache:
+                response = await self.cache_file(path, full_path, stat_result, scope)
+                if response is not None:
+                    return response
+            if self.precompressed:
+                return await self.precompressed_file_response(full_path, stat_result, scope)
             return self.file_response(full_path, stat_result, scope)
 
         elif stat_result and stat.S_ISDIR(stat_result.st_mode) and self.html:
@@ -139,6 +405,12 @@ class StaticFiles:
                     url = URL(scope=scope)
                     url = url.replace(path=url.path + "/")
                     return RedirectResponse(url=url)
+                if use_cache:
+                    response = await self.cache_file(path, full_path, stat_result, scope, is_index=True)
+                    if response is not None:
+                        return response
+                if self.precompressed:
+                    return await self.precompressed_file_response(full_path, stat_result, scope)
                 return self.file_response(full_path, stat_result, scope)
 
         if self.html:
@@ -180,6 +452,90 @@ class StaticFiles:
             return NotModifiedResponse(response.headers)
         return response
 
+    async def precompressed_file_response(
+        self, full_path: str, stat_result: os.stat_result, scope: Scope
+    ) -> Response:
+        request_headers = Headers(scope=scope)
+        if "range" in request_headers:
+            return self.file_response(full_path, stat_result, scope)
+        found = await anyio.to_thread.run_sync(find_precompressed, full_path, stat_result)
+        if not found:
+            return self.file_response(full_path, stat_result, scope)
+        accepted = get_accepted_encodings(request_headers.get("accept-encoding", ""))
+        response: Response = FileResponse(full_path, stat_result=stat_result, headers={"vary": "Accept-Encoding"})
+        for encoding, (sidecar_path, sidecar_stat) in found.items():
+            if encoding in accepted:
+                # Tagged from the file itself, like the variants in the cache
+                response = FileResponse(
+                    sidecar_path,
+                    stat_result=sidecar_stat,
+                    media_type=guess_type(full_path)[0] or "text/plain",
+                    headers={
+                        "content-encoding": encoding,
+                        "vary": "Accept-Encoding",
+                        "etag": variant_etag(response.headers["etag"], encoding),
+                    },
+                )
+                break
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+    async def get_cached_response(self, path: str, scope: Scope) -> Response | None:
+        """
+        Return the response for a file in the cache, or `None` if it isn't
+        cached (or changed) and has to be looked up on disk.
+        """
+        assert self.cache is not None
+        cached = self.cache.get(path)
+        if cached is None:
+            return None
+        if cached.is_index and not scope["path"].endswith("/"):
+            # Let the lookup redirect to the directory URL
+            return None
+        if self.cache.needs_check(cached):
+            try:
+                stat_result: os.stat_result | None = await anyio.to_thread.run_sync(os.stat, cached.full_path)
+            except OSError:
+                stat_result = None
+            if not self.cache.is_current(cached, stat_result):
+                self.cache.discard(path)
+                return None
+        return self.cached_response(cached, scope)
+
+    async def cache_file(
+        self,
+        path: str,
+        full_path: str,
+        stat_result: os.stat_result,
+        scope: Scope,
+        is_index: bool = False,
+    ) -> Response | None:
+        assert self.cache is not None
+        if stat_result.st_size > self.cache.max_file_size:
+            return None
+        try:
+            cached = await anyio.to_thread.run_sync(self.cache.load, full_path, stat_result, is_index)
+        except OSError:
+            return None
+        if cached is None:
+            return None
+        self.cache.put(path, cached)
+        return self.cached_response(cached, scope)
+
+    def cached_response(self, cached: CachedFile, scope: Scope) -> Response:
+        request_headers = Headers(scope=scope)
+        body, raw_headers = cached.body, cached.raw_headers
+        accepted = get_accepted_encodings(request_headers.get("accept-encoding", ""))
+        for encoding in PRECOMPRESSED_SUFFIXES:
+            if encoding in cached.variants and encoding in accepted:
+                body, raw_headers = cached.variants[encoding], cached.variant_raw_headers[encoding]
+                break
+        headers = Headers(raw=raw_headers)
+        if self.is_not_modified(headers, request_headers):
+            return NotModifiedResponse(headers)
+        return CachedFileResponse(body, raw_headers)
+
     async def check_config(self) -> None:
         """
         Perform a one-off configuration check that StaticFiles is actually
@@ -15,13 +15,24 @@ from uvicorn._types import (
     ASGISendEvent,
     HTTPRequestEvent,
     HTTPResponseBodyEvent,
+    HTTPResponsePathsendEvent,
     HTTPResponseStartEvent,
+    HTTPResponseZerocopysendEvent,
     HTTPScope,
 )
 from uvicorn.config import Config
 from uvicorn.logging import TRACE_LOG_LEVEL
 from uvicorn.protocols.http.flow_control import CLOSE_HEADER, HIGH_WATER_LIMIT, FlowControl, service_unavailable
-from uvicorn.protocols.utils import get_client_addr, get_local_addr, get_path_with_query_string, get_remote_addr, is_ssl
+from uvicorn.protocols.utils import (
+    get_client_addr,
+    get_file_send_extensions,
+    get_local_addr,
+    get_path_with_query_string,
+    get_remote_addr,
+    is_ssl,
+    open_file_message,
+    sendfile,
+)
 from uvicorn.server import ServerState
 
 
@@ -35,6 +46,15 @@ def _get_status_phrase(status_code: int) -> bytes:
 STATUS_PHRASES = {status_code: _get_status_phrase(status_code) for status_code in range(100, 600)}
 
 
+class _FileData:
+    # Stands for the bytes of a file in h11.Data, h11 only needs their length to frame them
+    def __init__(self, count: int) -> None:
+        self.count = count
+
+    def __len__(self) -> int:
+        return self.count
+
+
 class H11Protocol(asyncio.Protocol):
     def __init__(
         self,
@@ -212,6 +232,7 @@ class H11Protocol(asyncio.Protocol):
                     "query_string": query_string,
                     "headers": self.headers,
                     "state": self.app_state.copy(),
+                    "extensions": get_file_send_extensions(),
                 }
                 if self._should_upgrade():
                     self.handle_websocket_upgrade(event)
@@ -487,18 +508,23 @@ class RequestResponseCycle:
 
         elif not self.response_complete:
             # Sending response body
-            if message_type != "http.response.body":
+            if message_type in ("http.response.pathsend", "http.response.zerocopysend"):
+                more_body = await self.send_file(
+                    cast("HTTPResponsePathsendEvent | HTTPResponseZerocopysendEvent", message)
+                )
+            elif message_type != "http.response.body":
                 msg = "Expected ASGI message 'http.response.body', but got '%s'."
                 raise RuntimeError(msg % message_type)
-            message = cast("HTTPResponseBodyEvent", message)
+            else:
+                message = cast("HTTPResponseBodyEvent", message)
 
-            body = message.get("body", b"")
-            more_body = message.get("more_body", False)
+                body = message.get("body", b"")
+                more_body = message.get("more_body", False)
 
-            # Write response body
-            data = b"" if self.scope["method"] == "HEAD" else body
-            output = self.conn.send(event=h11.Data(data=data))
-            self.transport.write(output)
+                # Write response body
+                data = b"" if self.scope["method"] == "HEAD" else body
+                output = self.conn.send(event=h11.Data(data=data))
+                self.transport.write(output)
 
             # Handle response completion
             if not more_body:
@@ -518,6 +544,23 @@ class RequestResponseCycle:
                 self.transport.close()
             self.on_response()
 
+    async def send_file(self, message: HTTPResponsePathsendEvent | HTTPResponseZerocopysendEvent) -> bool:
+        file, offset, count, opened = await open_file_message(message)
+        try:
+            if self.scope["method"] != "HEAD" and count:
+                # h11 frames the body (chunk headers for chunked encoding) and
+                # passes the file through, which is then sent without copying
+                file_data = _FileData(count)
+                for data in self.conn.send_with_data_passthrough(h11.Data(data=file_data)):  # type: ignore[arg-type]
+                    if data is file_data:
+                        await sendfile(self.transport, self.flow, file, offset, count)
+                    else:
+                        self.transport.write(data)
+        finally:
+            if opened:
+                file.close()
+        return message["type"] == "http.response.zerocopysend" and message.get("more_body", False)
+
     async def receive(self) -> ASGIReceiveEvent:
         if self.waiting_for_100_continue and not self.transport.is_closing():
             headers: list[tuple[str, str]] = []
@@ -16,13 +16,24 @@ from uvicorn._types import (
     ASGIReceiveEvent,
     ASGISendEvent,
     HTTPRequestEvent,
+    HTTPResponsePathsendEvent,
     HTTPResponseStartEvent,
+    HTTPResponseZerocopysendEvent,
     HTTPScope,
 )
 from uvicorn.config import Config
 from uvicorn.logging import TRACE_LOG_LEVEL
 from uvicorn.protocols.http.flow_control import CLOSE_HEADER, HIGH_WATER_LIMIT, FlowControl, service_unavailable
-from uvicorn.protocols.utils import get_client_addr, get_local_addr, get_path_with_query_string, get_remote_addr, is_ssl
+from uvicorn.protocols.utils import (
+    get_client_addr,
+    get_file_send_extensions,
+    get_local_addr,
+    get_path_with_query_string,
+    get_remote_addr,
+    is_ssl,
+    open_file_message,
+    sendfile,
+)
 from uvicorn.server import ServerState
 
 HEADER_RE = re.compile(b'[\x00-\x1f\x7f()<>@,;:[]={} \t\\"]')
@@ -230,6 +241,7 @@ class HttpToolsProtocol(asyncio.Protocol):
             "root_path": self.root_path,
             "headers": self.headers,
             "state": self.app_state.copy(),
+            "extensions": get_file_send_extensions(),
         }
 
     # Parser callbacks
@@ -512,31 +524,35 @@ class RequestResponseCycle:
 
         elif not self.response_complete:
             # Sending response body
-            if message_type != "http.response.body":
+            if message_type in ("http.response.pathsend", "http.response.zerocopysend"):
+                more_body = await self.send_file(
+                    cast("HTTPResponsePathsendEvent | HTTPResponseZerocopysendEvent", message)
+                )
+            elif message_type != "http.response.body":
                 msg = "Expected ASGI message 'http.response.body', but got '%s'."
                 raise RuntimeError(msg % message_type)
-
-            body = cast(bytes, message.get("body", b""))
-            more_body = message.get("more_body", False)
-
-            # Write response body
-            if self.scope["method"] == "HEAD":
-                self.expected_content_length = 0
-            elif self.chunked_encoding:
-                if body:
-                    content = [b"%x\r\n" % len(body), body, b"\r\n"]
-                else:
-                    content = []
-                if not more_body:
-                    content.append(b"0\r\n\r\n")
-                self.transport.write(b"".join(content))
             else:
-                num_bytes = len(body)
-                if num_bytes > self.expected_content_length:
-                    raise RuntimeError("Response content longer than Content-Length")
+                body = cast(bytes, message.get("body", b""))
+                more_body = message.get("more_body", False)
+
+                # Write response body
+                if self.scope["method"] == "HEAD":
+                    self.expected_content_length = 0
+                elif self.chunked_encoding:
+                    if body:
+                        content = [b"%x\r\n" % len(body), body, b"\r\n"]
+                    else:
+                        content = []
+                    if not more_body:
+                        content.append(b"0\r\n\r\n")
+                    self.transport.write(b"".join(content))
                 else:
-                    self.expected_content_length -= num_bytes
-                self.transport.write(body)
+                    num_bytes = len(body)
+                    if num_bytes > self.expected_content_length:
+                        raise RuntimeError("Response content longer than Content-Length")
+                    else:
+                        self.expected_content_length -= num_bytes
+                    self.transport.write(body)
 
             # Handle response completion
             if not more_body:
@@ -553,6 +569,29 @@ class RequestResponseCycle:
             msg = "Unexpected ASGI message '%s' sent, after response already completed."
             raise RuntimeError(msg % message_type)
 
+    async def send_file(self, message: HTTPResponsePathsendEvent | HTTPResponseZerocopysendEvent) -> bool:
+        more_body = message["type"] == "http.response.zerocopysend" and message.get("more_body", False)
+        file, offset, count, opened = await open_file_message(message)
+        try:
+            if self.scope["method"] == "HEAD":
+                self.expected_content_length = 0
+            elif self.chunked_encoding:
+                if count:
+                    self.transport.write(b"%x\r\n" % count)
+                    await sendfile(self.transport, self.flow, file, offset, count)
+                    self.transport.write(b"\r\n")
+                if not more_body:
+                    self.transport.write(b"0\r\n\r\n")
+            else:
+                if count > self.expected_content_length:
+                    raise RuntimeError("Response content longer than Content-Length")
+                self.expected_content_length -= count
+                await sendfile(self.transport, self.flow, file, offset, count)
+        finally:
+            if opened:
+                file.close()
+        return more_body
+
     async def receive(self) -> ASGIReceiveEvent:
         if self.waiting_for_100_continue and not self.transport.is_closing():
             self.transport.write(b"HTTP/1.1 100 Continue\r\n\r\n")
@@ -1,9 +1,16 @@
 from __future__ import annotations
 
 import asyncio
+import os
 import urllib.parse
+from typing import TYPE_CHECKING, BinaryIO
 
-from uvicorn._types import WWWScope
+from uvicorn._types import HTTPResponsePathsendEvent, HTTPResponseZerocopysendEvent, WWWScope
+
+if TYPE_CHECKING:
+    from uvicorn.protocols.http.flow_control import FlowControl
+
+FILE_CHUNK_SIZE = 64 * 1024
 
 
 class ClientDisconnected(OSError): ...
@@ -54,3 +61,75 @@ def get_path_with_query_string(scope: WWWScope) -> str:
     if scope["query_string"]:
         path_with_query_string = "{}?{}".format(path_with_query_string, scope["query_string"].decode("ascii"))
     return path_with_query_string
+
+
+def get_file_send_extensions() -> dict[str, dict[object, object]]:
+    # The ASGI extensions that let the app hand a file to the server instead of its bytes
+    return {"http.response.pathsend": {}, "http.response.zerocopysend": {}}
+
+
+async def open_file_message(
+    message: HTTPResponsePathsendEvent | HTTPResponseZerocopysendEvent,
+) -> tuple[BinaryIO, int, int, bool]:
+    """
+    Return the file of a `http.response.pathsend` or `http.response.zerocopysend`
+    message, the offset and the number of bytes to send, and whether the server
+    opened the file (and has to close it).
+    """
+    loop = asyncio.get_running_loop()
+    if message["type"] == "http.response.pathsend":
+        path = message["path"]
+        if not os.path.isabs(path):
+            raise RuntimeError("The path of 'http.response.pathsend' must be absolute.")
+        file: BinaryIO = await loop.run_in_executor(None, open, path, "rb")
+        try:
+            size = os.fstat(file.fileno()).st_size
+        except BaseException:
+            file.close()
+            raise
+        return file, 0, size, True
+    file = message["file"]
+    offset = message.get("offset")
+    if offset is None:
+        offset = file.tell()
+    count = message.get("count")
+    if count is None:
+        count = os.fstat(file.fileno()).st_size - offset
+    return file, offset, count, False
+
+
+async def sendfile(transport: asyncio.Transport, flow: FlowControl, file: BinaryIO, offset: int, count: int) -> None:
+    """
+    Write `count` bytes of `file` from `offset` to the transport, with the OS'
+    sendfile() when it's a plain socket. TLS transports, and event loops without
+    sendfile support, fall back to reading the file in chunks in a thread.
+    """
+    loop = asyncio.get_running_loop()
+    if transport.is_closing():
+        return
+    if not is_ssl(transport):
+        try:
+            await loop.sendfile(transport, file, offset, count, fallback=False)
+            return
+        except (NotImplementedError, asyncio.SendfileNotAvailableError):
+            pass
+        except ConnectionError:
+            # The client disconnected, like writes to a closed transport this isn't an app error
+            transport.close()
+            return
+
+    def read_chunk(offset: int, size: int) -> bytes:
+        file.seek(offset)
+        return file.read(size)
+
+    end = offset + count
+    while offset < end:
+        chunk = await loop.run_in_executor(None, read_chunk, offset, min(FILE_CHUNK_SIZE, end - offset))
+        if not chunk:
+            raise RuntimeError("File ended before the number of bytes to send.")
+        offset += len(chunk)
+        transport.write(chunk)
+        if transport.is_closing():
+            return
+        if flow.write_paused:
+            await flow.drain()
@@ -0,0 +1,60 @@
+# 요청 본문의 Content-Type 판별 비용 마이크로 벤치마크
+#
+# FastAPI는 본문이 있는 요청마다 Content-Type이 JSON인지(application/json, application/*+json) 판별합니다.
+# 이전 방식(요청마다 email.message.Message를 만들어 파싱)과 현재 방식(원시 헤더 바이트를 키로 하는 LRU 캐시)의
+# 호출당 시간을 비교하고, 두 방식의 판별 결과가 같은지도 확인합니다. (결과가 다르면 AssertionError)
+#
+# 실행 예 (fastapi 디렉터리에서):
+#   python -m backend.bench_content_type
+
+import argparse
+import email.message
+import time
+
+from fastapi.routing import _is_json_content_type
+
+CONTENT_TYPES = [
+    b"application/json",
+    b"application/json; charset=utf-8",
+    b"Application/JSON",
+    b"application/merge-patch+json",
+    b"application/vnd.api+json; charset=UTF-8",
+    b"application/x-www-form-urlencoded",
+    b"multipart/form-data; boundary=----abc",
+    b"text/plain",
+    b"text/json",
+    b"application/json/extra",
+    b"json",
+    b"  application/json  ;",
+]
+
+
+def classify_with_message(content_type: bytes) -> bool:
+    # 이전 get_request_handler의 판별 방식
+    message = email.message.Message()
+    message["content-type"] = content_type.decode("latin-1")
+    if message.get_content_maintype() == "application":
+        subtype = message.get_content_subtype()
+        return subtype == "json" or subtype.endswith("+json")
+    return False
+
+
+def bench(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for content_type in CONTENT_TYPES:
+            fn(content_type)
+    return (time.perf_counter() - start) / (repeat * len(CONTENT_TYPES)) * 1_000_000
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Content-Type 판별 방식별 호출당 시간 비교")
+    parser.add_argument("--repeat", type=int, default=20000, help="측정 반복 횟수")
+    args = parser.parse_args()
+
+    for content_type in CONTENT_TYPES:
+        assert classify_with_message(content_type) == _is_json_content_type(content_type), content_type
+
+    print(f"Content-Type {len(CONTENT_TYPES)}종, 각 {args.repeat}회")
+    print(f"  email.message.Message  {bench(classify_with_message, args.repeat):7.3f} us/호출")
+    print(f"  _is_json_content_type  {bench(_is_json_content_type, args.repeat):7.3f} us/호출")
@@ -0,0 +1,115 @@
+# 응답 압축(GZipMiddleware) 설정별 처리량과 이벤트 루프 블로킹 시간 비교 벤치마크
+#
+# 이전 방식(항상 compresslevel=9, 이벤트 루프 스레드에서 압축)과
+# 현재 방식(큰 본문과 크기를 모르는 스트리밍 본문은 빠른 레벨로, offload_size 이상인 본문은 작업 스레드에서 압축)을
+# 한 번에 보내는 JSON 응답과 64KB씩 나눠 보내는 스트리밍 응답에 대해 비교합니다.
+# 요청을 처리하는 동안 1ms마다 깨어나는 태스크를 함께 돌려, 깨어나는 시각이 늦어진 최대값을 루프 블로킹 시간으로 보고합니다.
+# brotli, zstandard 패키지가 설치되어 있으면 br, zstd도 함께 측정합니다.
+# 서버 없이 ASGI 앱을 직접 호출하므로 네트워크 비용은 포함되지 않습니다.
+#
+# 실행 예 (fastapi 디렉터리에서):
+#   python -m backend.bench_gzip --size 4000000
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+
+from starlette.middleware.gzip import RESPONDERS, GZipMiddleware
+
+CHUNK_SIZE = 64 * 1024
+
+
+def build_body(size: int) -> bytes:
+    users = []
+    length = 0
+    i = 0
+    while length < size:
+        user = {"id": i, "username": f"user{i}", "email": f"user{i}@example.com", "created_at": "2024-01-01T12:00:00"}
+        users.append(user)
+        length += len(json.dumps(user)) + 2
+        i += 1
+    return json.dumps(users).encode()
+
+
+def build_app(body: bytes, streaming: bool):
+    async def app(scope, receive, send):
+        headers = [(b"content-type", b"application/json")]
+        if not streaming:
+            headers.append((b"content-length", str(len(body)).encode()))
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        if not streaming:
+            await send({"type": "http.response.body", "body": body})
+            return
+        for start in range(0, len(body), CHUNK_SIZE):
+            await send({"type": "http.response.body", "body": body[start : start + CHUNK_SIZE], "more_body": True})
+        await send({"type": "http.response.body", "body": b""})
+
+    return app
+
+
+async def call(app, encoding: str) -> int:
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": "/", "raw_path": b"/", "root_path": "", "query_string": b"",
+        "headers": [(b"accept-encoding", encoding.encode())], "client": ("127.0.0.1", 1234), "server": ("testserver", 80),
+    }
+    size = 0
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal size
+        if message["type"] == "http.response.body":
+            size += len(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return size
+
+
+async def monitor(lags: list) -> None:
+    while True:
+        start = time.perf_counter()
+        await asyncio.sleep(0.001)
+        lags.append(time.perf_counter() - start - 0.001)
+
+
+async def bench(app, encoding: str, body_size: int, repeat: int) -> str:
+    compressed = await call(app, encoding)  # 워밍업
+    lags: list = []
+    task = asyncio.create_task(monitor(lags))
+    await asyncio.sleep(0.01)
+    lags.clear()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        await call(app, encoding)
+    elapsed = time.perf_counter() - start
+    await asyncio.sleep(0.01)  # 마지막 요청 동안 늦어진 깨어남도 기록되도록
+    task.cancel()
+    mb_per_s = body_size * repeat / elapsed / 1e6
+    return f"{mb_per_s:8.1f} MB/s  압축률 {compressed / body_size:6.1%}  루프 블로킹 최대 {max(lags) * 1000:7.2f} ms"
+
+
+async def main(size: int, repeat: int) -> None:
+    body = build_body(size)
+    encodings = [encoding for encoding, responder in RESPONDERS.items() if responder.is_available()]
+    print(f"JSON 본문 {len(body):,} bytes, {repeat}회")
+    for streaming in (False, True):
+        app = build_app(body, streaming)
+        print("스트리밍 응답 (64KB씩)" if streaming else "한 번에 보내는 응답")
+        # 이전 방식: 항상 레벨 9, 루프 스레드에서 압축
+        legacy = GZipMiddleware(app, compresslevel=9, fast_compresslevel=9, offload_size=sys.maxsize, encodings=["gzip"])
+        print(f"  {'gzip (이전 방식)':<18} {await bench(legacy, 'gzip', len(body), repeat)}")
+        for encoding in encodings:
+            adaptive = GZipMiddleware(app, encodings=[encoding])
+            print(f"  {encoding:<18} {await bench(adaptive, encoding, len(body), repeat)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="응답 압축 설정별 처리량과 루프 블로킹 시간 비교")
+    parser.add_argument("--size", type=int, default=4_000_000, help="응답 본문 크기(바이트)")
+    parser.add_argument("--repeat", type=int, default=5, help="측정 반복 횟수")
+    args = parser.parse_args()
+    asyncio.run(main(args.size, args.repeat))
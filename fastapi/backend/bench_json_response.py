@@ -0,0 +1,88 @@
+# 응답 직렬화 방식별 비교 벤치마크
+#
+# response_model=list[UserResponse]인 엔드포인트가 모델 10,000개를 반환할 때
+# 기본 JSONResponse(검증 → dict로 직렬화 → json.dumps)와
+# PydanticJSONResponse(검증 → TypeAdapter.dump_json으로 바로 JSON 바이트)의 요청당 처리 시간을 비교합니다.
+# 서버 없이 ASGI 앱을 직접 호출하므로 네트워크 비용은 포함되지 않습니다.
+#
+# 실행 예 (fastapi 디렉터리에서):
+#   python -m backend.bench_json_response --items 10000
+
+import argparse
+import asyncio
+import json
+import time
+from datetime import datetime
+from typing import List
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, PydanticJSONResponse
+from pydantic import BaseModel
+
+
+# backend.main의 UserResponse와 같은 형태 (main을 import하면 DB 설정이 필요하므로 따로 정의)
+class UserResponse(BaseModel):
+    id: int
+    username: str
+    email: str
+    created_at: datetime
+
+
+def build_app(items: int, response_class) -> FastAPI:
+    app = FastAPI(default_response_class=response_class, openapi_url=None)
+    users = [
+        {"id": i, "username": f"user{i}", "email": f"user{i}@example.com", "created_at": datetime(2024, 1, 1, 12, 0, i % 60)}
+        for i in range(items)
+    ]
+
+    @app.get("/users", response_model=List[UserResponse])
+    async def list_users():
+        return users
+
+    return app
+
+
+async def call(app) -> bytes:
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": "/users", "raw_path": b"/users", "root_path": "", "query_string": b"",
+        "headers": [(b"host", b"testserver")], "client": ("127.0.0.1", 1234), "server": ("testserver", 80),
+    }
+    body = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.body":
+            body.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return b"".join(body)
+
+
+async def bench(app, repeat: int) -> float:
+    await call(app)  # 워밍업
+    start = time.perf_counter()
+    for _ in range(repeat):
+        await call(app)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+async def main(items: int, repeat: int) -> None:
+    default_app = build_app(items, JSONResponse)
+    fast_app = build_app(items, PydanticJSONResponse)
+    # 두 방식의 응답 내용이 같은지 먼저 확인
+    assert json.loads(await call(default_app)) == json.loads(await call(fast_app))
+
+    print(f"모델 {items}개 목록 응답, {repeat}회 평균")
+    for label, app in (("JSONResponse", default_app), ("PydanticJSONResponse", fast_app)):
+        print(f"  {label:<22} {await bench(app, repeat):8.1f} ms/요청")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="응답 직렬화 방식별 처리 시간 비교")
+    parser.add_argument("--items", type=int, default=10000, help="응답에 담을 모델 개수")
+    parser.add_argument("--repeat", type=int, default=20, help="측정 반복 횟수")
+    args = parser.parse_args()
+    asyncio.run(main(args.items, args.repeat))
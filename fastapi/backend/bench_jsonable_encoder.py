@@ -0,0 +1,60 @@
+# jsonable_encoder 처리 시간 벤치마크
+#
+# response_model 없이 큰 중첩 dict/list를 반환하는 엔드포인트는 응답마다 jsonable_encoder가 전체 구조를 한 번 훑습니다.
+# 직렬화하면 약 1MB(--size)가 되는 중첩 페이로드를 만들어 jsonable_encoder 1회 호출에 걸리는 시간을 측정하고,
+# 참고용으로 같은 결과를 json.dumps로 인코딩하는 시간도 함께 출력합니다.
+#
+# 실행 예 (fastapi 디렉터리에서):
+#   python -m backend.bench_jsonable_encoder --size 1000000
+
+import argparse
+import json
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from fastapi.encoders import jsonable_encoder
+
+
+def build_payload(size: int) -> dict:
+    # 대부분 JSON 기본 타입이고 일부 datetime/UUID가 섞인, 주문 목록 형태의 응답
+    base = datetime(2024, 1, 1)
+    orders = []
+    payload = {"total": 0, "orders": orders}
+    i = 0
+    while len(json.dumps(jsonable_encoder(payload), separators=(",", ":"))) < size:
+        for j in range(100):
+            n = i * 100 + j
+            orders.append({
+                "id": n,
+                "uuid": uuid.UUID(int=n),
+                "customer": {"name": f"customer{n}", "email": f"c{n}@example.com", "vip": n % 7 == 0},
+                "created_at": base + timedelta(minutes=n),
+                "items": [{"sku": f"SKU-{n}-{k}", "qty": k + 1, "price": 9.99 * (k + 1), "tags": ["a", "b"]} for k in range(3)],
+                "note": None,
+            })
+        i += 1
+    payload["total"] = len(orders)
+    return payload
+
+
+def bench(fn, repeat: int) -> float:
+    fn()  # 워밍업
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="jsonable_encoder 처리 시간 측정")
+    parser.add_argument("--size", type=int, default=1_000_000, help="JSON으로 직렬화했을 때의 페이로드 크기(바이트)")
+    parser.add_argument("--repeat", type=int, default=20, help="측정 반복 횟수")
+    args = parser.parse_args()
+
+    payload = build_payload(args.size)
+    encoded = jsonable_encoder(payload)
+    size = len(json.dumps(encoded, separators=(",", ":")))
+    print(f"주문 {payload['total']}건, JSON {size / 1_000_000:.2f}MB, {args.repeat}회 평균")
+    print(f"  jsonable_encoder      {bench(lambda: jsonable_encoder(payload), args.repeat):8.1f} ms")
+    print(f"  json.dumps (참고)     {bench(lambda: json.dumps(encoded, separators=(',', ':')), args.repeat):8.1f} ms")
@@ -0,0 +1,85 @@
+# 로그인 사용자 조회 방식별 지연 시간 비교 벤치마크
+#
+# 기존 OR 조회((username == x) | (email == x))와 login_lookup_statement의 "auto"/"union" 방식을
+# 대량의 사용자가 들어 있는 users 테이블에서 비교합니다.
+# 기본값은 SQLite 파일을 stand-in으로 사용하며, --url로 로컬 MySQL/MariaDB를 지정할 수 있습니다.
+#
+# 실행 예 (fastapi 디렉터리에서):
+#   python -m backend.bench_login_lookup --rows 10000000
+#   python -m backend.bench_login_lookup --url "mysql+mysqlconnector://user:pw@localhost/bench" --rows 10000000
+
+import argparse
+import os
+import random
+import statistics
+import time
+
+# main.py의 Settings는 DB 접속 정보를 필수로 요구하므로, 벤치마크 단독 실행을 위해 기본값을 채워 둡니다.
+for name in ("DB_USER", "DB_PASSWORD", "DB_HOST", "DB_NAME"):
+    os.environ.setdefault(name, "bench")
+
+from sqlalchemy import create_engine, func, insert, select
+from sqlalchemy.orm import Session
+
+from backend.main import Base, User, login_lookup_statement
+
+
+def seed(engine, rows: int, chunk: int = 50000) -> None:
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as db:
+        existing = db.scalar(select(func.count()).select_from(User))
+        if existing >= rows:
+            return
+        print(f"seeding {rows - existing} rows...")
+        for start in range(existing, rows, chunk):
+            stop = min(start + chunk, rows)
+            db.execute(
+                insert(User),
+                [{"username": f"user{i}", "email": f"user{i}@example.com", "password": "x"} for i in range(start, stop)],
+            )
+            db.commit()
+
+
+def measure(engine, make_statement, login_ids) -> list[float]:
+    timings = []
+    with Session(engine) as db:
+        for login_id in login_ids:
+            started = time.perf_counter()
+            db.scalars(make_statement(login_id)).first()
+            timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def report(name: str, timings: list[float]) -> None:
+    timings = sorted(timings)
+    p50 = statistics.median(timings)
+    p99 = timings[min(len(timings) - 1, int(len(timings) * 0.99))]
+    print(f"{name:<8} p50={p50:8.3f}ms  p99={p99:8.3f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", default="sqlite:///bench_users.db")
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--lookups", type=int, default=2000)
+    args = parser.parse_args()
+
+    engine = create_engine(args.url)
+    seed(engine, args.rows)
+
+    # 존재하는 username/email과 존재하지 않는 아이디를 섞어 조회
+    login_ids = []
+    for _ in range(args.lookups):
+        i = random.randrange(args.rows * 2)
+        login_ids.append(random.choice([f"user{i}", f"user{i}@example.com"]))
+
+    def or_lookup(login_id):
+        return select(User).where((User.username == login_id) | (User.email == login_id)).limit(1)
+
+    report("or", measure(engine, or_lookup, login_ids))
+    report("auto", measure(engine, lambda x: login_lookup_statement(x, "auto"), login_ids))
+    report("union", measure(engine, lambda x: login_lookup_statement(x, "union"), login_ids))
+
+
+if __name__ == "__main__":
+    main()
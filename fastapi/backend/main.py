@@ -1,12 +1,37 @@
-from fastapi import FastAPI, Depends, HTTPException, status
-from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy import create_engine, Column, Integer, String, DateTime
+from fastapi import FastAPI, Depends, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.dependencies.utils import create_body_stream_field, iter_body_stream
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import PlainTextResponse, PydanticJSONResponse
+from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
+from fastapi.staticfiles import StaticFiles
+from sqlalchemy import create_engine, event, insert, select, union_all, update, Column, Integer, String, DateTime
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.orm import sessionmaker, Session
+from concurrent.futures import ProcessPoolExecutor
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from datetime import datetime
-from pydantic import BaseModel
+from functools import lru_cache
+from multiprocessing import shared_memory
+from pydantic import BaseModel, ValidationError
+import asyncio
+import base64
 import bcrypt
+import codecs
+import hashlib
+import hmac
+import json
+import os
+import secrets
+import struct
+import threading
+import time
+from typing import Any, AsyncIterator
 # 환경 변수 로드를 위해 BaseSettings 또는 python-dotenv 임포트
 # Pydantic의 BaseSettings를 사용하는 것이 일반적입니다.
 from pydantic_settings import BaseSettings # pydantic v2 이상에서는 pydantic_settings에서 임포트
@@ -29,6 +54,89 @@ class Settings(BaseSettings):
     DB_HOST: str
     DB_NAME: str
 
+    # 비밀번호 해싱 전용 프로세스 풀 설정
+    # HASH_POOL_WORKERS가 0이면 CPU 코어 수만큼 프로세스를 띄웁니다.
+    HASH_POOL_WORKERS: int = 0
+    # 실행 중인 작업 외에 대기열에 쌓일 수 있는 최대 해싱 요청 수
+    HASH_QUEUE_SIZE: int = 64
+    # 대기열이 가득 찼을 때 503 응답에 실어 보낼 Retry-After(초)
+    HASH_RETRY_AFTER: int = 1
+
+    # 존재하지 않는 사용자 조회 결과(negative lookup) 캐시 설정
+    # 한 번 "없는 사용자"로 확인된 아이디는 TTL(초) 동안 DB를 다시 조회하지 않습니다.
+    NEGATIVE_CACHE_TTL: float = 60.0
+    # 캐시에 보관할 최대 항목 수 (넘치면 가장 오래 사용되지 않은 항목부터 제거)
+    NEGATIVE_CACHE_SIZE: int = 10000
+
+    # 로그인 시 사용자 조회 방식
+    # "auto": 입력값에 '@'가 있으면 email 컬럼을, 없으면 username 컬럼을 먼저 조회 (인덱스 하나만 사용)
+    #         찾지 못하면 나머지 컬럼을 한 번 더 조회합니다. ('@'가 들어간 username, '@' 없는 email도 로그인 가능)
+    # "union": username/email 두 번의 포인트 조회를 UNION ALL로 묶어 실행
+    #          ('@'가 들어간 username이 이미 저장돼 있는 등 기존 데이터가 규칙을 따르지 않는 경우 사용)
+    LOGIN_LOOKUP_STRATEGY: str = "auto"
+
+    # True이면 비동기 엔진(mysql.connector.aio 드라이버)과 AsyncSession을 사용합니다.
+    # 엔드포인트가 DB 응답을 기다리는 동안 스레드를 차지하지 않으므로, anyio 스레드 제한(40개)보다 많은 요청을 동시에 처리할 수 있습니다.
+    DB_ASYNC: bool = False
+
+    # 커넥션 풀 설정 (동기/비동기 엔진 공통)
+    # 기본 풀 크기와 초과 허용 개수 (동시에 최대 DB_POOL_SIZE + DB_MAX_OVERFLOW개의 연결 사용)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    # 풀에서 연결을 얻기 위해 기다리는 최대 시간(초). 넘으면 "QueuePool limit" TimeoutError
+    DB_POOL_TIMEOUT: float = 30.0
+    # 이 시간(초)보다 오래된 연결은 재생성 (MySQL wait_timeout으로 끊긴 연결 재사용 방지, -1이면 사용 안 함)
+    DB_POOL_RECYCLE: int = 1800
+    # 연결을 꺼낼 때마다 가벼운 ping으로 살아 있는지 확인
+    DB_POOL_PRE_PING: bool = True
+
+    # 액세스 토큰 서명 키 (HMAC-SHA256)
+    # 비워 두면 프로세스마다 임의의 키를 만들므로, 재시작하거나 워커가 여러 개일 때 토큰이 서로 호환되지 않습니다.
+    # 운영 환경에서는 반드시 .env에 지정하세요.
+    SECRET_KEY: str = ""
+    # 액세스 토큰 유효 시간(분)
+    ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    # 검증을 마친 토큰의 디코딩 결과를 보관할 LRU 캐시 크기
+    TOKEN_CACHE_SIZE: int = 10000
+
+    # bcrypt 비용(cost factor) 설정
+    # BCRYPT_ROUNDS를 0으로 두면 서버 시작 시 해시 1회가 BCRYPT_TARGET_MS(밀리초)에 가장 가깝게(넘지 않게) 걸리는 값을 측정해 사용합니다.
+    # 측정은 워커 프로세스마다 따로 하므로 워커끼리 값이 1 정도 다를 수 있습니다. 그래서 측정값을 쓸 때는 저장된 해시의 비용이 1보다 더 차이 날 때만 다시 해싱합니다.
+    # 비용을 정확히 맞추고 싶다면(예: 1만 올리거나 내리기) 값을 지정하세요.
+    BCRYPT_ROUNDS: int = 0
+    BCRYPT_TARGET_MS: float = 50.0
+    # 자동 측정 시에도 이 값 미만으로는 내려가지 않습니다. (보안 하한)
+    BCRYPT_MIN_ROUNDS: int = 10
+
+    # /signup/batch에서 한 번에 중복 확인 + INSERT 하는 행 수
+    BATCH_SIGNUP_CHUNK_SIZE: int = 1000
+
+    # /login/ 시도 횟수 제한 (토큰 버킷)
+    # 클라이언트 IP별로 LOGIN_IP_PERIOD초 동안 LOGIN_IP_LIMIT회, 로그인 아이디별로 LOGIN_USER_PERIOD초 동안 LOGIN_USER_LIMIT회까지 허용
+    LOGIN_IP_LIMIT: int = 20
+    LOGIN_IP_PERIOD: float = 60.0
+    LOGIN_USER_LIMIT: int = 5
+    LOGIN_USER_PERIOD: float = 60.0
+    # "memory": 프로세스(워커)마다 따로 계산, "shared": 공유 메모리로 모든 uvicorn --workers 프로세스가 같은 카운터 사용
+    LOGIN_RATE_LIMIT_BACKEND: str = "memory"
+    LOGIN_RATE_LIMIT_SHM_NAME: str = "fastapi_login_rate_limit"
+    LOGIN_RATE_LIMIT_SHM_SLOTS: int = 65536
+
+    # /metrics 접근 토큰 (Authorization: Bearer <토큰>으로 보내야 응답합니다)
+    # 비워 두면 /metrics는 404를 반환합니다. (풀 상태가 외부에 공개되지 않도록)
+    METRICS_TOKEN: str = ""
+    # /signup/batch 관리자 토큰 (Authorization: Bearer <토큰>으로 보내야 처리합니다)
+    # 비워 두면 /signup/batch는 404를 반환합니다. (익명 사용자가 계정을 대량으로 만들거나 해싱 워커를 모두 차지하지 않도록)
+    BATCH_SIGNUP_TOKEN: str = ""
+
+    # 생성한 OpenAPI 스키마(/openapi.json)를 저장해 둘 디렉터리
+    # 지정하면 라우트와 모델이 바뀌지 않은 동안 워커마다 스키마를 다시 만들지 않고 파일에서 읽어 옵니다. (비워 두면 사용 안 함)
+    OPENAPI_CACHE_DIR: str = ""
+
+    # 프론트엔드 정적 파일 메모리 캐시 크기(바이트, 0이면 사용 안 함)와 파일 변경 확인 주기(초)
+    STATIC_CACHE_MAX_BYTES: int = 8 * 1024 * 1024
+    STATIC_CACHE_CHECK_INTERVAL: float = 1.0
+
     # Pydantic BaseSettings의 내부 클래스 (설정 관리)
     class Config:
         # .env 파일 경로 지정
@@ -48,8 +156,102 @@ DATABASE_URL = f"mysql+mysqlconnector://{settings.DB_USER}:{settings.DB_PASSWORD
 # DATABASE_URL = f"mysql+mysqlconnector://{os.getenv('DB_USER')}:{os.getenv('DB_PASSWORD')}@{os.getenv('DB_HOST')}/{os.getenv('DB_NAME')}"
 
 
-# SQLAlchemy 엔진 생성
-engine = create_engine(DATABASE_URL)
+# 비동기 모드용 URL (backend/mysqlconnector_async.py에서 등록한 mysql.connector.aio 기반 dialect)
+ASYNC_DATABASE_URL = f"mysql+mysqlconnector_async://{settings.DB_USER}:{settings.DB_PASSWORD}@{settings.DB_HOST}/{settings.DB_NAME}"
+
+
+# ----<커넥션 풀 메트릭>----
+# 풀에서 연결을 얻기까지 기다린 시간(wait)과 연결을 사용한 시간(hold)을 히스토그램으로 모아 /metrics에서 보여줍니다.
+
+class Histogram:
+    # Prometheus 히스토그램과 같은 누적 버킷 (단위: 초)
+    BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+    def __init__(self):
+        self.counts = [0] * len(self.BUCKETS)
+        self.count = 0
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        with self._lock:
+            self.count += 1
+            self.sum += value
+            for i, bound in enumerate(self.BUCKETS):
+                if value <= bound:
+                    self.counts[i] += 1
+
+    def render(self, name: str, labels: str) -> list[str]:
+        with self._lock:
+            lines = [f'{name}_bucket{{{labels},le="{bound}"}} {count}' for bound, count in zip(self.BUCKETS, self.counts)]
+            lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {self.count}')
+            lines.append(f"{name}_sum{{{labels}}} {self.sum}")
+            lines.append(f"{name}_count{{{labels}}} {self.count}")
+        return lines
+
+
+class PoolMetrics:
+    def __init__(self):
+        self.wait = Histogram()
+        self.hold = Histogram()
+
+
+class _WaitTimeMixin:
+    # 풀 이벤트에는 "연결 요청 시작" 시점이 없으므로 연결을 꺼내는 _do_get을 감싸 대기 시간을 잽니다.
+    # (TimeoutError로 끝난 대기도 포함)
+    metrics: PoolMetrics
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            self.metrics.wait.observe(time.perf_counter() - started)
+
+
+# dispose() 등으로 풀이 다시 만들어져도 메트릭이 유지되도록 클래스 속성으로 둡니다.
+class MeteredQueuePool(_WaitTimeMixin, QueuePool):
+    metrics = PoolMetrics()
+
+
+class MeteredAsyncAdaptedQueuePool(_WaitTimeMixin, AsyncAdaptedQueuePool):
+    metrics = PoolMetrics()
+
+
+def track_connection_hold_time(target, metrics: PoolMetrics) -> None:
+    # checkout ~ checkin 사이의 시간을 기록
+    @event.listens_for(target, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        connection_record.info["checked_out_at"] = time.perf_counter()
+
+    @event.listens_for(target, "checkin")
+    def on_checkin(dbapi_connection, connection_record):
+        started = connection_record.info.pop("checked_out_at", None)
+        if started is not None:
+            metrics.hold.observe(time.perf_counter() - started)
+
+
+POOL_OPTIONS = dict(
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+)
+
+
+# SQLAlchemy 엔진 생성 (풀 설정을 명시적으로 지정)
+engine = create_engine(DATABASE_URL, poolclass=MeteredQueuePool, **POOL_OPTIONS)
+track_connection_hold_time(engine, MeteredQueuePool.metrics)
+
+# 비동기 엔진 생성 (DB_ASYNC=True일 때만)
+if settings.DB_ASYNC:
+    import backend.mysqlconnector_async  # noqa: F401  "mysql+mysqlconnector_async" dialect 등록
+
+    async_engine = create_async_engine(ASYNC_DATABASE_URL, poolclass=MeteredAsyncAdaptedQueuePool, **POOL_OPTIONS)
+    track_connection_hold_time(async_engine.sync_engine, MeteredAsyncAdaptedQueuePool.metrics)
+else:
+    async_engine = None
 
 # SQLAlchemy 선언적 베이스 생성
 Base = declarative_base()
@@ -69,6 +271,76 @@ class User(Base):
 
 # 데이터베이스 세션 생성
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# 비동기 세션 생성 (commit 후에도 객체 속성을 다시 SELECT하지 않도록 expire_on_commit=False)
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+
+# 로그인 아이디(username 또는 email)로 사용자를 찾는 쿼리 생성
+# (User.username == x) | (User.email == x) 처럼 OR로 묶으면 MySQL이 index_merge나 풀 스캔을 하게 되므로,
+# 입력값 형태를 보고 UNIQUE 인덱스 하나만 조회하거나, 두 포인트 조회를 UNION ALL로 합칩니다.
+def login_lookup_statement(login_id: str, strategy: str | None = None):
+    strategy = strategy or settings.LOGIN_LOOKUP_STRATEGY
+    if strategy == "union":
+        both = union_all(
+            select(User).where(User.username == login_id),
+            select(User).where(User.email == login_id),
+        ).limit(1)
+        return select(User).from_statement(both)
+    # 대부분의 입력은 '@' 유무로 어느 컬럼인지 알 수 있으므로 그 컬럼을 먼저 조회합니다.
+    column = User.email if "@" in login_id else User.username
+    return select(User).where(column == login_id).limit(1)
+
+
+def login_lookup_fallback_statement(login_id: str):
+    # "auto" 방식에서 먼저 조회한 컬럼에 없을 때 나머지 컬럼을 조회하는 쿼리
+    column = User.username if "@" in login_id else User.email
+    return select(User).where(column == login_id).limit(1)
+
+
+def find_user_for_login(db: Session, login_id: str) -> User | None:
+    user = db.scalars(login_lookup_statement(login_id)).first()
+    if user is None and settings.LOGIN_LOOKUP_STRATEGY != "union":
+        # 회원가입 시 형식을 제한하지 않으므로 '@'가 들어간 username이나 '@' 없는 email일 수도 있습니다.
+        # (없는 아이디는 unknown_user_cache에 남으므로 이 추가 조회는 TTL마다 한 번만 일어납니다.)
+        user = db.scalars(login_lookup_fallback_statement(login_id)).first()
+    return user
+
+
+def find_registered_login_ids(db: Session, usernames: list[str], emails: list[str]) -> set[str]:
+    # 이미 가입된 username/email을 한 번의 쿼리로 찾습니다. (비교는 MySQL 콜레이션처럼 대소문자 무시)
+    # OR 대신 UNION ALL을 사용해 각 UNIQUE 인덱스를 따로 조회합니다. (login_lookup_statement 참고)
+    statement = union_all(
+        select(User.username).where(User.username.in_(usernames)),
+        select(User.email).where(User.email.in_(emails)),
+    )
+    return {value.casefold() for value in db.scalars(statement)}
+
+
+def insert_users(db: Session, rows: list[dict]) -> list[bool]:
+    # 여러 행을 한 번의 다중 행 INSERT(insert().values([...]))로 저장합니다.
+    # 중복 확인 이후 다른 요청이 같은 username/email로 먼저 가입해 INSERT 전체가 실패하면,
+    # 해당 청크만 한 행씩 다시 INSERT 해서 어느 행이 중복인지 가려냅니다.
+    try:
+        db.execute(insert(User).values(rows))
+        db.commit()
+        return [True] * len(rows)
+    except IntegrityError:
+        db.rollback()
+    inserted = []
+    for row in rows:
+        try:
+            db.execute(insert(User).values(row))
+            db.commit()
+            inserted.append(True)
+        except IntegrityError:
+            db.rollback()
+            inserted.append(False)
+    return inserted
+
+
+def update_password_hash(db: Session, user_id: int, hashed_password: str) -> None:
+    db.execute(update(User).where(User.id == user_id).values(password=hashed_password))
+    db.commit()
 
 # 데이터베이스 세션 의존성 주입 함수
 def get_db():
@@ -78,14 +350,62 @@ def get_db():
     finally:
         db.close()
 
+# 비동기 데이터베이스 세션 의존성 주입 함수
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+# 엔드포인트에서 사용하는 세션 의존성 (DB_ASYNC 설정에 따라 선택)
+get_session = get_async_db if settings.DB_ASYNC else get_db
+
+
+# 동기 Session을 받는 DB 작업 함수 fn을 세션 종류에 맞게 실행합니다.
+# - AsyncSession: run_sync로 이벤트 루프에서 실행 (I/O는 비동기 드라이버가 처리하므로 스레드를 쓰지 않음)
+# - Session: run_in_threadpool로 스레드풀에서 실행
+async def run_db(db: Session | AsyncSession, fn, *args):
+    if isinstance(db, AsyncSession):
+        return await db.run_sync(fn, *args)
+    return await run_in_threadpool(fn, db, *args)
+
 
 # ----<비밀번호 해싱 및 검증 함수>----
 
 
+# bcrypt 비용은 rounds가 1 늘 때마다 해싱 시간이 2배가 되므로,
+# 낮은 rounds에서 몇 번 측정한 뒤 목표 시간 안에 들어오는 가장 큰 rounds를 계산합니다.
+def calibrate_bcrypt_rounds(target_ms: float, min_rounds: int, probe_rounds: int = 8) -> int:
+    salt = bcrypt.gensalt(rounds=probe_rounds)
+    probe_ms = float("inf")
+    for _ in range(3):
+        started = time.perf_counter()
+        bcrypt.hashpw(b"calibration", salt)
+        probe_ms = min(probe_ms, (time.perf_counter() - started) * 1000)
+    rounds = probe_rounds
+    while rounds < 31 and probe_ms * 2 ** (rounds + 1 - probe_rounds) <= target_ms:
+        rounds += 1
+    return max(rounds, min_rounds)
+
+
+BCRYPT_ROUNDS = settings.BCRYPT_ROUNDS or calibrate_bcrypt_rounds(settings.BCRYPT_TARGET_MS, settings.BCRYPT_MIN_ROUNDS)
+# 저장된 해시의 비용이 현재 값과 이만큼까지 차이 나는 것은 그대로 둡니다.
+# 측정값은 워커마다 1 정도 다를 수 있으므로, 로그인할 때마다 워커끼리 해시를 번갈아 다시 쓰지 않도록 1을 허용합니다.
+BCRYPT_REHASH_TOLERANCE = 0 if settings.BCRYPT_ROUNDS else 1
+
+
+def bcrypt_rounds_of(hashed_password: str) -> int:
+    # "$2b$12$..." 형식의 해시에서 비용(rounds) 값을 읽습니다.
+    return int(hashed_password.split("$")[2])
+
+
+def needs_rehash(hashed_password: str) -> bool:
+    # 저장된 해시의 비용이 현재 설정과 다르면(측정값을 쓸 때는 1보다 더 차이 나면) 다음 로그인 때 새 비용으로 다시 해싱합니다.
+    return abs(bcrypt_rounds_of(hashed_password) - BCRYPT_ROUNDS) > BCRYPT_REHASH_TOLERANCE
+
+
 def hash_password(password: str) -> str:
     # 비밀번호를 바이트로 인코딩하고 해싱합니다.
     # bcrypt.gensalt()는 솔트(Salt)를 생성하여 동일한 비밀번호라도 매번 다른 해시 값을 갖도록 합니다.
-    hashed_bytes = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt())
+    hashed_bytes = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds=BCRYPT_ROUNDS))
     # 해시된 바이트를 문자열로 디코딩하여 반환합니다.
     return hashed_bytes.decode('utf-8')
 
@@ -95,6 +415,144 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
 
 
+# ----<비밀번호 해싱 전용 프로세스 풀>----
+# bcrypt는 CPU를 많이 쓰는 작업이라 스레드풀에서 직접 돌리면 anyio 스레드 제한(40개)을 모두 차지해
+# 다른 요청까지 막아버립니다. 그래서 코어 수만큼의 프로세스 풀에 작업을 넘기고,
+# 실행 중 + 대기 중인 작업 수를 세마포어로 제한해 가득 차면 즉시 503을 돌려줍니다(back-pressure).
+
+HASH_POOL_WORKERS = settings.HASH_POOL_WORKERS or os.cpu_count() or 1
+
+_hash_executor: ProcessPoolExecutor | None = None
+_hash_executor_lock = threading.Lock()
+# 실행 중인 작업(워커 수) + 대기열 크기만큼만 동시에 받아들입니다.
+# (이벤트 루프에서만 acquire하고, 작업이 끝나면 loop.call_soon_threadsafe로 반납합니다.)
+_hash_slots = asyncio.BoundedSemaphore(HASH_POOL_WORKERS + settings.HASH_QUEUE_SIZE)
+
+
+def get_hash_executor() -> ProcessPoolExecutor:
+    # 프로세스 풀은 처음 사용할 때 생성합니다. (모듈 import 시점에 프로세스를 띄우지 않기 위함)
+    global _hash_executor
+    if _hash_executor is None:
+        with _hash_executor_lock:
+            if _hash_executor is None:
+                _hash_executor = ProcessPoolExecutor(max_workers=HASH_POOL_WORKERS)
+    return _hash_executor
+
+
+def shutdown_hash_executor() -> None:
+    global _hash_executor
+    with _hash_executor_lock:
+        if _hash_executor is not None:
+            _hash_executor.shutdown(wait=True, cancel_futures=True)
+            _hash_executor = None
+
+
+def check_hash_queue() -> None:
+    # 대기열이 가득 차 있으면 기다리지 않고 바로 503 + Retry-After 응답
+    if _hash_slots.locked():
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Password hashing service is busy, please retry later",
+            headers={"Retry-After": str(settings.HASH_RETRY_AFTER)},
+        )
+
+
+async def _run_in_hash_pool(func, *args):
+    check_hash_queue()
+    # 자리가 있으므로 기다리지 않고 바로 얻습니다.
+    await _hash_slots.acquire()
+    try:
+        # bcrypt 함수 자체를 넘기므로 워커 프로세스가 이 모듈(main.py)을 다시 import하지 않습니다.
+        future = get_hash_executor().submit(func, *args)
+    except BaseException:
+        _hash_slots.release()
+        raise
+    # 작업이 끝나면(성공/실패/취소 무관) 슬롯을 반납합니다.
+    # 완료 콜백은 프로세스 풀의 관리 스레드에서 호출되므로 이벤트 루프로 넘겨서 반납합니다.
+    loop = asyncio.get_running_loop()
+    future.add_done_callback(lambda _: loop.call_soon_threadsafe(_hash_slots.release))
+    return await asyncio.wrap_future(future)
+
+
+async def hash_password_async(password: str) -> str:
+    # hash_password와 같은 결과를 내지만, 해싱은 프로세스 풀에서 실행됩니다.
+    # 솔트 생성은 가벼운 작업이므로 현재 프로세스에서 처리합니다.
+    hashed_bytes = await _run_in_hash_pool(bcrypt.hashpw, password.encode('utf-8'), bcrypt.gensalt(rounds=BCRYPT_ROUNDS))
+    return hashed_bytes.decode('utf-8')
+
+
+async def hash_passwords_batch(passwords: list[str]) -> list[str]:
+    # 여러 비밀번호를 프로세스 풀의 모든 코어에서 병렬로 해싱합니다.
+    # 동시에 넘기는 작업은 워커 수만큼으로 제한해, 대기열의 나머지 자리는 일반 회원가입/로그인 요청이 쓸 수 있게 남겨 둡니다.
+    # 대기열이 가득 차면 일반 회원가입과 같이 기다리지 않고 503으로 실패합니다.
+    limiter = asyncio.Semaphore(HASH_POOL_WORKERS)
+
+    async def hash_one(password: str) -> str:
+        async with limiter:
+            hashed_bytes = await _run_in_hash_pool(
+                bcrypt.hashpw, password.encode('utf-8'), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
+            )
+        return hashed_bytes.decode('utf-8')
+
+    return await asyncio.gather(*(hash_one(password) for password in passwords))
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    # verify_password의 비동기 버전 (프로세스 풀에서 bcrypt.checkpw 실행)
+    return await _run_in_hash_pool(bcrypt.checkpw, plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
+
+
+# ----<존재하지 않는 사용자 조회 캐시 (negative lookup cache)>----
+# 크리덴셜 스터핑처럼 없는 계정으로 반복되는 로그인 시도가 매번 DB를 조회하지 않도록,
+# "해당 username/email의 사용자가 없다"는 결과를 TTL + LRU 방식으로 프로세스 메모리에 보관합니다.
+# 회원가입 시 해당 username/email 항목을 지워 새로 가입한 사용자가 바로 로그인할 수 있게 합니다.
+# (uvicorn 워커가 여러 개라면 다른 워커의 캐시는 TTL이 지나야 갱신됩니다.)
+
+class NegativeLookupCache:
+    def __init__(self, ttl: float, maxsize: int):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, float]" = OrderedDict()  # 키 -> 만료 시각
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(login_id: str) -> str:
+        # MySQL 기본 콜레이션은 대소문자를 구분하지 않으므로 캐시 키도 대소문자를 구분하지 않습니다.
+        return login_id.casefold()
+
+    def __contains__(self, login_id: str) -> bool:
+        key = self._key(login_id)
+        with self._lock:
+            expires_at = self._entries.get(key)
+            if expires_at is None:
+                return False
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return False
+            self._entries.move_to_end(key)
+            return True
+
+    def add(self, login_id: str) -> None:
+        key = self._key(login_id)
+        with self._lock:
+            self._entries[key] = time.monotonic() + self.ttl
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def discard(self, *login_ids: str) -> None:
+        with self._lock:
+            for login_id in login_ids:
+                self._entries.pop(self._key(login_id), None)
+
+
+unknown_user_cache = NegativeLookupCache(ttl=settings.NEGATIVE_CACHE_TTL, maxsize=settings.NEGATIVE_CACHE_SIZE)
+
+# 없는 사용자에 대해서도 실제 사용자와 같은 비용의 bcrypt.checkpw를 실행해
+# 응답 시간만으로 계정 존재 여부를 알아낼 수 없게(timing oracle 방지) 하기 위한 더미 해시
+DUMMY_PASSWORD_HASH = hash_password("dummy-password-for-timing-equalization")
+
+
 # ----<Pydantic 모델 (스키마 정의)>----
 
 
@@ -115,42 +573,490 @@ class UserResponse(BaseModel):
         orm_mode = True # SQLAlchemy 모델 객체를 Pydantic 모델로 변환 가능하게 함
 
 
+# 대량 회원가입의 행별 처리 결과
+class BatchSignupRowResult(BaseModel):
+    index: int # 요청 본문에서의 순서 (0부터)
+    username: str | None = None
+    status: str # "created", "duplicate", "invalid"
+    detail: str | None = None
+
+# 대량 회원가입 응답 스키마
+class BatchSignupResponse(BaseModel):
+    created: int
+    duplicates: int
+    invalid: int
+    results: list[BatchSignupRowResult]
+
+
+# 액세스 토큰에 담기는 사용자 정보
+class TokenClaims(BaseModel, frozen=True):
+    id: int
+    username: str
+    exp: int
+
+
+# ----<액세스 토큰 (HMAC 서명)>----
+# /login/에서 HS256으로 서명한 JWT 형식의 토큰을 발급합니다.
+# 이후 요청은 get_current_user가 서명과 만료 시각만 확인하므로 DB 조회나 bcrypt 검증이 필요 없습니다.
+
+SECRET_KEY = (settings.SECRET_KEY or secrets.token_urlsafe(32)).encode('utf-8')
+_TOKEN_HEADER = base64.urlsafe_b64encode(b'{"alg":"HS256","typ":"JWT"}').rstrip(b"=")
+
+# /login/에서 발급한 토큰을 Authorization: Bearer 헤더로 받습니다.
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="login/")
+
+
+def _b64encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def _sign(signing_input: bytes) -> bytes:
+    return hmac.new(SECRET_KEY, signing_input, hashlib.sha256).digest()
+
+
+def create_access_token(user_id: int, username: str) -> str:
+    now = int(time.time())
+    claims = {"sub": str(user_id), "username": username, "iat": now, "exp": now + settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60}
+    signing_input = _TOKEN_HEADER + b"." + _b64encode(json.dumps(claims, separators=(",", ":")).encode('utf-8'))
+    return (signing_input + b"." + _b64encode(_sign(signing_input))).decode('ascii')
+
+
+# 같은 토큰은 보통 만료될 때까지 여러 번 사용되므로 서명 검증과 디코딩 결과를 캐시합니다.
+# 유효하지 않은 토큰은 예외가 발생하므로 캐시에 남지 않습니다. (만료 여부는 매번 따로 확인)
+@lru_cache(maxsize=settings.TOKEN_CACHE_SIZE)
+def decode_access_token(token: str) -> TokenClaims:
+    try:
+        header, payload, signature = token.split(".")
+        signing_input = f"{header}.{payload}".encode('ascii')
+        if header.encode('ascii') != _TOKEN_HEADER or not hmac.compare_digest(_b64decode(signature), _sign(signing_input)):
+            raise ValueError("invalid signature")
+        claims = json.loads(_b64decode(payload))
+        return TokenClaims(id=int(claims["sub"]), username=claims["username"], exp=claims["exp"])
+    except (ValueError, KeyError, TypeError, UnicodeError) as exc:
+        raise ValueError("invalid token") from exc
+
+
+# 인증이 필요한 엔드포인트에서 사용하는 의존성 (DB 접근 없음)
+async def get_current_user(token: str = Depends(oauth2_scheme)) -> TokenClaims:
+    try:
+        claims = decode_access_token(token)
+    except ValueError:
+        claims = None
+    if claims is None or claims.exp <= time.time():
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return claims
+
+
+# ----<로그인 시도 횟수 제한 (rate limit)>----
+# 무차별 대입 공격이 그대로 bcrypt CPU 사용과 DB 조회로 이어지지 않도록, 클라이언트 IP와 로그인 아이디별 토큰 버킷으로 시도 횟수를 제한합니다.
+# 제한에 걸린 요청은 login 엔드포인트의 DB 세션 의존성이나 해싱이 실행되기 전에 429로 거절됩니다.
+# 버킷은 limit개의 토큰으로 시작해 period초에 limit개씩 다시 채워지고, 시도할 때마다 토큰 1개를 사용합니다.
+
+class MemoryRateLimiter:
+    # 프로세스 메모리에 키별 (남은 토큰, 마지막 갱신 시각, 버킷의 period)를 보관합니다.
+    # 오래 사용되지 않아 토큰이 다 찬 버킷은 주기적으로 지워 메모리가 계속 늘어나지 않게 합니다.
+    SWEEP_INTERVAL = 60.0
+
+    def __init__(self):
+        self._buckets: dict[str, tuple[float, float, float]] = {}
+        self._lock = threading.Lock()
+        self._next_sweep = time.monotonic() + self.SWEEP_INTERVAL
+
+    def hit(self, key: str, limit: int, period: float) -> float:
+        # 허용되면 0, 거절되면 다시 시도할 수 있을 때까지 남은 시간(초)을 돌려줍니다.
+        rate = limit / period
+        now = time.monotonic()
+        with self._lock:
+            if now >= self._next_sweep:
+                self._sweep(now)
+            tokens, updated_at, _ = self._buckets.get(key, (limit, now, period))
+            tokens = min(limit, tokens + (now - updated_at) * rate)
+            if tokens < 1:
+                self._buckets[key] = (tokens, now, period)
+                return (1 - tokens) / rate
+            self._buckets[key] = (tokens - 1, now, period)
+            return 0.0
+
+    def _sweep(self, now: float) -> None:
+        # 자기 period초 이상 갱신되지 않은 버킷은 이미 가득 찼으므로 지워도 결과가 같습니다.
+        # (제한마다 period가 다르므로 각 버킷에 저장된 period로 판단합니다.)
+        self._buckets = {key: bucket for key, bucket in self._buckets.items() if now - bucket[1] < bucket[2]}
+        self._next_sweep = now + self.SWEEP_INTERVAL
+
+
+class SharedMemoryRateLimiter:
+    # 이름 있는 공유 메모리에 고정 크기 해시 테이블을 만들어 모든 워커 프로세스가 같은 버킷을 보도록 합니다.
+    # 슬롯 하나는 (키 해시, 남은 토큰, 마지막 갱신 시각) 24바이트이며, 빈 슬롯이 없으면 가장 오래된 슬롯을 재사용합니다.
+    # 프로세스 간 잠금 없이 갱신하므로 동시에 같은 키를 갱신하면 카운트가 조금 어긋날 수 있습니다. (제한 용도로는 충분한 근사치)
+    # 맨 앞의 헤더(매직, 슬롯 수, 슬롯 크기)로 이미 있는 공유 메모리가 같은 배치인지 확인합니다.
+    # 공유 메모리는 어느 워커가 종료돼도 지워지지 않고 서버를 다시 시작해도 남아 있습니다.
+    # (슬롯 수를 바꾸려면 LOGIN_RATE_LIMIT_SHM_NAME을 바꾸거나 /dev/shm의 파일을 지우세요.)
+    SLOT = struct.Struct("<Qdd")
+    HEADER = struct.Struct("<8sQQ")
+    MAGIC = b"LOGINRL1"
+    PROBES = 8
+    ATTACH_TIMEOUT = 5.0
+
+    def __init__(self, name: str, slots: int):
+        self.slots = slots
+        size = self.HEADER.size + self.SLOT.size * slots
+        try:
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            # 먼저 뜬 워커가 만든 공유 메모리에 연결합니다.
+            self._shm = self._attach(name)
+        else:
+            # 매직은 마지막에 써서, 연결하는 워커가 초기화가 끝난 헤더만 보게 합니다.
+            self.HEADER.pack_into(self._shm.buf, 0, b"\0" * 8, slots, self.SLOT.size)
+            self._shm.buf[:8] = self.MAGIC
+        if os.name == "posix":
+            # 만든 워커든 연결만 한 워커든, 종료될 때 resource_tracker가 공유 메모리를 지워
+            # 다른 워커들이 쓰던 카운터가 사라지지 않도록 추적 대상에서 제외합니다.
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(self._shm._name, "shared_memory")
+        self._buf = self._shm.buf
+        self._lock = threading.Lock()
+
+    def _attach(self, name: str) -> shared_memory.SharedMemory:
+        # 만든 워커가 크기를 정하고 헤더를 쓰기 전일 수 있으므로 잠시 기다리며 다시 확인합니다.
+        deadline = time.monotonic() + self.ATTACH_TIMEOUT
+        while True:
+            try:
+                shm = shared_memory.SharedMemory(name=name)
+            except ValueError:
+                # 아직 크기가 0인 공유 메모리 (mmap 불가)
+                shm = None
+            if shm is not None and shm.size >= self.HEADER.size:
+                magic, slots, slot_size = self.HEADER.unpack_from(shm.buf, 0)
+                if magic == self.MAGIC:
+                    if slots != self.slots or slot_size != self.SLOT.size or shm.size < self.HEADER.size + slots * slot_size:
+                        shm.close()
+                        raise RuntimeError(
+                            f"Shared memory {name!r} has {slots} slots of {slot_size} bytes, "
+                            f"expected {self.slots} slots of {self.SLOT.size} bytes"
+                        )
+                    return shm
+            if shm is not None:
+                shm.close()
+            if time.monotonic() >= deadline:
+                raise RuntimeError(f"Shared memory {name!r} is not a login rate limit table")
+            time.sleep(0.01)
+
+    def _find_slot(self, key_hash: int) -> int:
+        start = key_hash % self.slots
+        oldest_offset, oldest_time = None, float("inf")
+        for probe in range(self.PROBES):
+            offset = self.HEADER.size + ((start + probe) % self.slots) * self.SLOT.size
+            slot_hash, _, updated_at = self.SLOT.unpack_from(self._buf, offset)
+            if slot_hash == key_hash or slot_hash == 0:
+                return offset
+            if updated_at < oldest_time:
+                oldest_offset, oldest_time = offset, updated_at
+        return oldest_offset
+
+    def hit(self, key: str, limit: int, period: float) -> float:
+        rate = limit / period
+        now = time.monotonic()
+        # 0은 빈 슬롯 표시로 쓰므로 키 해시는 0이 되지 않게 합니다.
+        key_hash = int.from_bytes(hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest(), "little") or 1
+        with self._lock:
+            offset = self._find_slot(key_hash)
+            slot_hash, tokens, updated_at = self.SLOT.unpack_from(self._buf, offset)
+            if slot_hash != key_hash:
+                tokens, updated_at = limit, now
+            tokens = min(limit, tokens + (now - updated_at) * rate)
+            if tokens < 1:
+                self.SLOT.pack_into(self._buf, offset, key_hash, tokens, now)
+                return (1 - tokens) / rate
+            self.SLOT.pack_into(self._buf, offset, key_hash, tokens - 1, now)
+            return 0.0
+
+
+if settings.LOGIN_RATE_LIMIT_BACKEND == "shared":
+    login_rate_limiter = SharedMemoryRateLimiter(settings.LOGIN_RATE_LIMIT_SHM_NAME, settings.LOGIN_RATE_LIMIT_SHM_SLOTS)
+else:
+    login_rate_limiter = MemoryRateLimiter()
+
+
+# /login/ 라우트 의존성으로 등록해 다른 의존성(DB 세션 등)보다 먼저 실행합니다.
+# async 함수이므로 스레드풀을 사용하지 않으며, 폼 데이터는 login 엔드포인트와 같은 객체를 공유합니다(의존성 캐시).
+async def login_rate_limit(request: Request, form_data: OAuth2PasswordRequestForm = Depends()):
+    client_ip = request.client.host if request.client else "unknown"
+    retry_after = max(
+        login_rate_limiter.hit(f"ip:{client_ip}", settings.LOGIN_IP_LIMIT, settings.LOGIN_IP_PERIOD),
+        login_rate_limiter.hit(f"user:{form_data.username.casefold()}", settings.LOGIN_USER_LIMIT, settings.LOGIN_USER_PERIOD),
+    )
+    if retry_after > 0:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many login attempts, please retry later",
+            headers={"Retry-After": str(int(retry_after) + 1)},
+        )
+
+
+# ----<대량 회원가입 요청 본문 파싱>----
+# 수만 건의 요청 본문을 한 번에 메모리에 올리지 않도록 request.stream()에서 받은 청크를 바로 파싱해
+# 레코드를 하나씩 넘겨줍니다. JSON 배열, NDJSON(한 줄에 JSON 객체 하나), JSON Text Sequence(RFC 7464, 레코드마다 RS 문자로 시작)를 지원합니다.
+# JSON 배열은 FastAPI의 스트리밍 본문 파서(iter_body_stream)를 그대로 사용하고,
+# 레코드 검증은 행별 결과를 돌려주기 위해 엔드포인트에서 따로 합니다.
+
+# 레코드 하나가 이 크기(문자 수)를 넘도록 끝나지 않으면 잘못된 본문으로 봅니다.
+MAX_BATCH_RECORD_CHARS = 64 * 1024
+
+
+class MalformedBatchBody(Exception):
+    pass
+
+
+async def _iter_text_chunks(request: Request):
+    # 청크 경계에서 UTF-8 문자가 잘려도 올바르게 디코딩되도록 incremental decoder 사용
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    async for chunk in request.stream():
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+# JSON Text Sequence의 레코드 구분 문자 (Record Separator)
+JSON_SEQ_RS = "\x1e"
+
+
+async def iter_ndjson_records(request: Request, separator: str = "\n"):
+    # separator로 나뉜 레코드를 하나씩 돌려줍니다. (JSON Text Sequence는 JSON_SEQ_RS, 레코드 끝의 줄바꿈은 공백으로 무시)
+    buffer = ""
+    async for text in _iter_text_chunks(request):
+        buffer += text
+        *lines, buffer = buffer.split(separator)
+        for line in lines:
+            if line.strip():
+                yield line
+        if len(buffer) > MAX_BATCH_RECORD_CHARS:
+            raise MalformedBatchBody("Record too large")
+    if buffer.strip():
+        yield buffer
+
+
+# 배열의 각 항목을 검증 없이 그대로 받는 필드
+BATCH_RECORD_FIELD = create_body_stream_field(param_name="records", annotation=AsyncIterator[Any])
+
+
+async def iter_json_array_records(request: Request):
+    # 본문 오류(깨진 JSON, 너무 큰 레코드)는 MalformedBatchBody로 바꿔, 그때까지 읽은 행의 결과는 돌려줄 수 있게 합니다.
+    try:
+        async for record in iter_body_stream(request, BATCH_RECORD_FIELD, max_item_size=MAX_BATCH_RECORD_CHARS):
+            yield record
+    except RequestValidationError:
+        raise MalformedBatchBody("Malformed JSON array") from None
+    except HTTPException as exc:
+        raise MalformedBatchBody(exc.detail) from None
+
+
+# 관리용 엔드포인트 접근 확인: expected 토큰이 설정되어 있고 Bearer 토큰이 일치할 때만 허용합니다.
+# 설정되어 있지 않으면 엔드포인트가 없는 것처럼 404를 반환합니다.
+def check_bearer_token(request: Request, expected: str, detail: str) -> None:
+    if not expected:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not hmac.compare_digest(token.encode(), expected.encode()):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=detail,
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+# /signup/batch 접근 확인: 로그인 사용자 토큰이 아닌 별도의 관리자 토큰(BATCH_SIGNUP_TOKEN)이 필요합니다.
+async def require_batch_signup_token(request: Request) -> None:
+    check_bearer_token(request, settings.BATCH_SIGNUP_TOKEN, "Invalid batch signup token")
+
+
 # -----<FastAPI 애플리케이션 및 엔드포인트>----
 
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # 서버 종료 시 해싱 프로세스 풀과 비동기 엔진의 커넥션 풀 정리
+    shutdown_hash_executor()
+    if async_engine is not None:
+        await async_engine.dispose()
+
+
+# response_model이 있는 응답은 dict를 거치지 않고 pydantic-core로 바로 JSON 바이트로 직렬화
+app = FastAPI(
+    lifespan=lifespan,
+    default_response_class=PydanticJSONResponse,
+    openapi_cache_dir=settings.OPENAPI_CACHE_DIR or None,
+)
 
 # 회원가입 엔드포인트
-@app.post("/signup/", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-def signup(user: UserCreate, db: Session = Depends(get_db)):
-    # 사용자 이름 또는 이메일이 이미 존재하는지 확인
-    db_user = db.query(User).filter((User.username == user.username) | (User.email == user.email)).first()
-    if db_user:
-        # 이미 존재하는 경우 에러 응답
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Username or email already registered")
-
-    # 비밀번호 해싱
-    hashed_pw = hash_password(user.password)
-
-    # 새로운 사용자 객체 생성 및 데이터베이스에 추가
-    new_user = User(username=user.username, email=user.email, password=hashed_pw)
-    db.add(new_user)
-    db.commit()
-    db.refresh(new_user) # 데이터베이스에서 자동 생성된 id 등을 가져옴
+# 해싱을 기다리는 동안 스레드풀 슬롯을 잡고 있지 않도록 async 엔드포인트로 정의하고,
+# DB 작업은 run_db로 실행합니다. (동기 모드에서는 스레드풀, DB_ASYNC 모드에서는 비동기 I/O)
+# 응답은 엔드포인트가 직접 만든 UserResponse이므로 response_model로 다시 검증하지 않고 바로 직렬화합니다.
+@app.post(
+    "/signup/",
+    response_model=UserResponse,
+    status_code=status.HTTP_201_CREATED,
+    response_model_validate="serialize_only",
+)
+async def signup(user: UserCreate, db: Session | AsyncSession = Depends(get_session)):
+    # 비밀번호 해싱 (프로세스 풀에서 실행)
+    hashed_pw = await hash_password_async(user.password)
+
+    # 중복 확인용 SELECT 없이 바로 INSERT 합니다.
+    # users.username / users.email의 UNIQUE 인덱스가 중복을 막아주므로, 동시에 들어온 가입 요청끼리도 경쟁 상태가 생기지 않습니다.
+    # created_at은 애플리케이션에서 채우고 id는 INSERT 결과(lastrowid)에서 받아오므로 db.refresh()용 SELECT도 필요 없습니다.
+    # (MySQL DATETIME 컬럼은 초 단위까지만 저장하므로 응답 값과 저장 값이 같도록 마이크로초를 버립니다.)
+    created_at = datetime.utcnow().replace(microsecond=0)
+
+    def insert_user(db: Session) -> int:
+        try:
+            result = db.execute(
+                insert(User).values(
+                    username=user.username, email=user.email, password=hashed_pw, created_at=created_at
+                )
+            )
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            # 사용자 이름 또는 이메일이 이미 존재하는 경우 에러 응답
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Username or email already registered")
+        return result.inserted_primary_key[0]
+
+    new_id = await run_db(db, insert_user)
+
+    # 새로 가입한 username/email은 더 이상 "없는 사용자"가 아니므로 캐시에서 제거
+    unknown_user_cache.discard(user.username, user.email)
 
     # 회원가입 성공 응답 (비밀번호는 제외하고 응답)
-    return new_user
+    return UserResponse(id=new_id, username=user.username, email=user.email, created_at=created_at)
+
+# 대량 회원가입 엔드포인트 (기업 고객 계정 일괄 등록용)
+# 본문은 UserCreate 형식 레코드의 JSON 배열 또는 NDJSON(Content-Type: application/x-ndjson)입니다.
+# BATCH_SIGNUP_CHUNK_SIZE개씩 묶어 비밀번호를 병렬로 해싱하고, 중복 확인 1회 + 다중 행 INSERT 1회로 저장한 뒤
+# 행별 처리 결과를 돌려줍니다. (청크 단위로 커밋되므로 중간에 본문 오류나 503이 나도 앞선 청크는 저장된 상태로 남습니다.)
+# 관리자 토큰(BATCH_SIGNUP_TOKEN)이 있어야 하고, 해싱 대기열이 가득 차 있으면 일반 회원가입과 같이 바로 503을 반환합니다.
+# 응답도 엔드포인트가 직접 만든 BatchSignupResponse이므로 재검증 없이 직렬화합니다.
+@app.post(
+    "/signup/batch",
+    response_model=BatchSignupResponse,
+    response_model_validate="serialize_only",
+    dependencies=[Depends(require_batch_signup_token)],
+)
+async def signup_batch(request: Request, db: Session | AsyncSession = Depends(get_session)):
+    # 본문을 읽기 전에 대기열부터 확인합니다.
+    check_hash_queue()
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    if content_type in ("application/x-ndjson", "application/jsonl"):
+        records = iter_ndjson_records(request)
+    elif content_type == "application/json-seq":
+        records = iter_ndjson_records(request, separator=JSON_SEQ_RS)
+    else:
+        records = iter_json_array_records(request)
+
+    results: list[BatchSignupRowResult] = []
+    pending: list[tuple[int, UserCreate]] = []
+
+    async def flush() -> None:
+        # 같은 요청 안에서 중복된 username/email은 처음 나온 행만 가입시킵니다.
+        seen: set[str] = set()
+        candidates = []
+        for index, user in pending:
+            keys = (user.username.casefold(), user.email.casefold())
+            if seen.intersection(keys):
+                results.append(BatchSignupRowResult(index=index, username=user.username, status="duplicate", detail="Username or email already registered"))
+                continue
+            seen.update(keys)
+            candidates.append((index, user))
+        pending.clear()
+        if not candidates:
+            return
+
+        registered = await run_db(
+            db, find_registered_login_ids, [user.username for _, user in candidates], [user.email for _, user in candidates]
+        )
+        new_users = []
+        for index, user in candidates:
+            if user.username.casefold() in registered or user.email.casefold() in registered:
+                results.append(BatchSignupRowResult(index=index, username=user.username, status="duplicate", detail="Username or email already registered"))
+            else:
+                new_users.append((index, user))
+        if not new_users:
+            return
+
+        hashed_passwords = await hash_passwords_batch([user.password for _, user in new_users])
+        created_at = datetime.utcnow().replace(microsecond=0)
+        rows = [
+            {"username": user.username, "email": user.email, "password": hashed_pw, "created_at": created_at}
+            for (_, user), hashed_pw in zip(new_users, hashed_passwords)
+        ]
+        inserted = await run_db(db, insert_users, rows)
+        for (index, user), ok in zip(new_users, inserted):
+            if ok:
+                unknown_user_cache.discard(user.username, user.email)
+                results.append(BatchSignupRowResult(index=index, username=user.username, status="created"))
+            else:
+                results.append(BatchSignupRowResult(index=index, username=user.username, status="duplicate", detail="Username or email already registered"))
+
+    index = 0
+    try:
+        async for record in records:
+            try:
+                if isinstance(record, str):
+                    user = UserCreate.model_validate_json(record)
+                else:
+                    user = UserCreate.model_validate(record)
+            except ValidationError as exc:
+                results.append(BatchSignupRowResult(index=index, status="invalid", detail=str(exc)))
+            else:
+                pending.append((index, user))
+                if len(pending) >= settings.BATCH_SIGNUP_CHUNK_SIZE:
+                    await flush()
+            index += 1
+    except MalformedBatchBody as exc:
+        # 본문이 깨진 지점 이후는 처리하지 않고, 그때까지 읽은 행까지만 처리 결과를 돌려줍니다.
+        results.append(BatchSignupRowResult(index=index, status="invalid", detail=str(exc)))
+    await flush()
+
+    results.sort(key=lambda result: result.index)
+    return BatchSignupResponse(
+        created=sum(result.status == "created" for result in results),
+        duplicates=sum(result.status == "duplicate" for result in results),
+        invalid=sum(result.status == "invalid" for result in results),
+        results=results,
+    )
 
 # 로그인 엔드포인트 (OAuth2PasswordRequestForm 사용)
-@app.post("/login/")
-def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
+# login_rate_limit에 걸린 요청은 DB 세션을 만들기 전에 429로 거절됩니다.
+@app.post("/login/", dependencies=[Depends(login_rate_limit)])
+async def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session | AsyncSession = Depends(get_session)):
     # username 또는 email로 사용자를 찾음 (form_data의 username 필드를 사용)
-    # 실제로는 username/email 중 하나로 로그인 가능하도록 구현하는 것이 일반적
     # 여기서는 OAuth2PasswordRequestForm의 username 필드를 사용하며, 사용자가 username이나 email을 입력한다고 가정
-    user = db.query(User).filter((User.username == form_data.username) | (User.email == form_data.username)).first()
+    # (어느 컬럼을 조회할지는 find_user_for_login이 입력값 형태를 보고 결정)
+    # 최근에 없는 사용자로 확인된 아이디라면 DB를 조회하지 않습니다.
+    if form_data.username in unknown_user_cache:
+        user = None
+    else:
+        user = await run_db(db, find_user_for_login, form_data.username)
+        if user is None:
+            unknown_user_cache.add(form_data.username)
+
+    # 사용자가 없는 경우에도 더미 해시로 같은 비용의 검증을 수행합니다. (timing oracle 방지)
+    password_ok = await verify_password_async(form_data.password, user.password if user else DUMMY_PASSWORD_HASH)
 
     # 사용자가 없거나 비밀번호가 일치하지 않는 경우
-    if not user or not verify_password(form_data.password, user.password):
+    if not user or not password_ok:
         # 인증 실패 에러 응답
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -158,8 +1064,74 @@ def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depend
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    # 저장된 해시의 bcrypt 비용이 현재 설정과 다르면 평문 비밀번호를 알고 있는 지금 새 비용으로 다시 해싱해 저장합니다.
+    # (마이그레이션 없이 비용을 올리거나 내릴 수 있도록 하기 위함이며, 실패해도 로그인 자체는 성공 처리)
+    # BCRYPT_ROUNDS를 자동 측정할 때는 워커 간 측정 오차(1)를 넘는 차이만 다시 해싱합니다. (needs_rehash 참고)
+    if needs_rehash(user.password):
+        try:
+            await run_db(db, update_password_hash, user.id, await hash_password_async(form_data.password))
+        except HTTPException:
+            # 해싱 대기열이 가득 찬 경우(503)에는 다음 로그인 때 다시 시도합니다.
+            pass
+
+    # 이후 요청에서 비밀번호를 다시 검증하지 않도록 서명된 액세스 토큰을 발급합니다.
+    return {
+        "message": "Login successful!",
+        "access_token": create_access_token(user.id, user.username),
+        "token_type": "bearer",
+    }
 
-    return {"message": "Login successful!"}
+# 현재 로그인한 사용자 정보 (토큰만으로 확인, DB 조회 없음)
+@app.get("/users/me")
+async def read_current_user(current_user: TokenClaims = Depends(get_current_user)):
+    return {"id": current_user.id, "username": current_user.username}
+
+# /metrics 접근 확인: METRICS_TOKEN이 설정되어 있고 Bearer 토큰이 일치할 때만 허용합니다.
+# 로그인 사용자 토큰이 아닌 별도 토큰을 쓰므로, 누구나 가입해서 메트릭을 볼 수는 없습니다.
+async def require_metrics_token(request: Request) -> None:
+    check_bearer_token(request, settings.METRICS_TOKEN, "Invalid metrics token")
+
+
+# 커넥션 풀 메트릭 엔드포인트 (Prometheus 텍스트 형식)
+# Prometheus 설정 예: authorization: { credentials: <METRICS_TOKEN> }
+@app.get(
+    "/metrics",
+    response_class=PlainTextResponse,
+    dependencies=[Depends(require_metrics_token)],
+    include_in_schema=False,
+)
+async def metrics():
+    lines = []
+    engines = [("sync", engine.pool, MeteredQueuePool.metrics)]
+    if async_engine is not None:
+        engines.append(("async", async_engine.sync_engine.pool, MeteredAsyncAdaptedQueuePool.metrics))
+    for name, pool, pool_metrics in engines:
+        labels = f'engine="{name}"'
+        lines.append(f"db_pool_size{{{labels}}} {pool.size()}")
+        lines.append(f"db_pool_checkedout{{{labels}}} {pool.checkedout()}")
+        lines.append(f"db_pool_checkedin{{{labels}}} {pool.checkedin()}")
+        lines.append(f"db_pool_overflow{{{labels}}} {pool.overflow()}")
+        lines.extend(pool_metrics.wait.render("db_pool_wait_seconds", labels))
+        lines.extend(pool_metrics.hold.render("db_pool_hold_seconds", labels))
+    return "\n".join(lines) + "\n"
+
+# 프론트엔드 정적 파일 (login.html, signup.html, script.js, style.css)
+# 거의 바뀌지 않는 작은 파일들이므로 메모리에 캐시해 두고, 요청마다 스레드에서 stat과 파일 읽기를 하지 않고 바로 응답합니다.
+# 파일이 수정되면 최대 STATIC_CACHE_CHECK_INTERVAL초 안에 수정 시각을 다시 확인해 새 내용으로 교체합니다.
+# precompress_static.py로 미리 만들어 둔 .br/.gz 파일이 있으면 서버에서 압축하지 않고 그 파일을 그대로 보냅니다.
+FRONTEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "frontend")
+app.mount(
+    "/frontend",
+    StaticFiles(
+        directory=FRONTEND_DIR,
+        html=True,
+        cache_max_bytes=settings.STATIC_CACHE_MAX_BYTES,
+        cache_check_interval=settings.STATIC_CACHE_CHECK_INTERVAL,
+        cache_compress=True,
+        precompressed=True,
+    ),
+    name="frontend",
+)
 
 origins = [
     "http://localhost",
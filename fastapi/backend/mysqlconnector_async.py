@@ -0,0 +1,137 @@
+# mysql-connector-python의 asyncio 드라이버(mysql.connector.aio)용 SQLAlchemy 비동기 dialect
+#
+# 설치된 SQLAlchemy 2.0에는 mysql.connector.aio용 dialect가 없으므로,
+# SQLAlchemy의 aiomysql dialect와 같은 방식(connectors/asyncio.py의 어댑터 클래스)으로
+# 비동기 드라이버를 동기 DBAPI처럼 감싸 create_async_engine에서 사용할 수 있게 합니다.
+#
+# 이 모듈을 import하면 "mysql+mysqlconnector_async://..." URL이 등록됩니다.
+
+from sqlalchemy import pool
+from sqlalchemy import util
+from sqlalchemy.connectors.asyncio import AsyncAdapt_dbapi_connection
+from sqlalchemy.connectors.asyncio import AsyncAdapt_dbapi_cursor
+from sqlalchemy.dialects import registry
+from sqlalchemy.dialects.mysql.mysqlconnector import MySQLDialect_mysqlconnector
+from sqlalchemy.dialects.mysql.mysqlconnector import MySQLExecutionContext_mysqlconnector
+from sqlalchemy.util.concurrency import await_fallback
+from sqlalchemy.util.concurrency import await_only
+
+
+class AsyncAdapt_mysqlconnector_cursor(AsyncAdapt_dbapi_cursor):
+    __slots__ = ()
+
+    def _aenter_cursor(self, cursor):
+        # mysql.connector.aio의 connection.cursor()는 코루틴이므로 await해서 커서를 받습니다.
+        # (연결 시 buffered=True로 설정하므로 결과는 모두 클라이언트에 버퍼링됩니다.)
+        return self.await_(cursor)
+
+
+class AsyncAdapt_mysqlconnector_connection(AsyncAdapt_dbapi_connection):
+    _cursor_cls = AsyncAdapt_mysqlconnector_cursor
+
+    __slots__ = ()
+
+    def cursor(self, server_side=False, **kw):
+        # 동기 mysqlconnector dialect는 cursor(buffered=True)를 호출하지만,
+        # 비동기 연결은 연결 단위 buffered 설정을 따르므로 인자는 무시합니다.
+        return self._cursor_cls(self)
+
+    @property
+    def charset(self):
+        return self._connection.charset
+
+    @property
+    def autocommit(self):
+        return self.await_(self._connection.get_autocommit())
+
+    @autocommit.setter
+    def autocommit(self, value):
+        self.await_(self._connection.set_autocommit(value))
+
+    def ping(self, reconnect):
+        return self.await_(self._connection.ping(reconnect))
+
+
+class AsyncAdaptFallback_mysqlconnector_connection(AsyncAdapt_mysqlconnector_connection):
+    __slots__ = ()
+
+    await_ = staticmethod(await_fallback)
+
+
+class AsyncAdapt_mysqlconnector_dbapi:
+    def __init__(self, connector, aio):
+        self.connector = connector
+        self.aio = aio
+        self.paramstyle = "format"
+        self.__version__ = connector.__version__
+        for name in (
+            "Warning",
+            "Error",
+            "InterfaceError",
+            "DataError",
+            "DatabaseError",
+            "OperationalError",
+            "IntegrityError",
+            "ProgrammingError",
+            "InternalError",
+            "NotSupportedError",
+            "NUMBER",
+            "STRING",
+            "DATETIME",
+            "BINARY",
+            "Binary",
+        ):
+            setattr(self, name, getattr(connector, name))
+
+    def connect(self, *arg, **kw):
+        async_fallback = kw.pop("async_fallback", False)
+        creator_fn = kw.pop("async_creator_fn", self.aio.connect)
+
+        if util.asbool(async_fallback):
+            return AsyncAdaptFallback_mysqlconnector_connection(
+                self,
+                await_fallback(creator_fn(*arg, **kw)),
+            )
+        else:
+            return AsyncAdapt_mysqlconnector_connection(
+                self,
+                await_only(creator_fn(*arg, **kw)),
+            )
+
+
+class MySQLExecutionContext_mysqlconnector_async(MySQLExecutionContext_mysqlconnector):
+    def create_default_cursor(self):
+        return self._dbapi_connection.cursor()
+
+
+class MySQLDialect_mysqlconnector_async(MySQLDialect_mysqlconnector):
+    driver = "mysqlconnector_async"
+    supports_statement_cache = True
+
+    is_async = True
+
+    execution_ctx_cls = MySQLExecutionContext_mysqlconnector_async
+
+    @classmethod
+    def import_dbapi(cls):
+        from mysql import connector
+        from mysql.connector import aio
+
+        return AsyncAdapt_mysqlconnector_dbapi(connector, aio)
+
+    @classmethod
+    def get_pool_class(cls, url):
+        async_fallback = url.query.get("async_fallback", False)
+
+        if util.asbool(async_fallback):
+            return pool.FallbackAsyncAdaptedQueuePool
+        else:
+            return pool.AsyncAdaptedQueuePool
+
+    def get_driver_connection(self, connection):
+        return connection._connection
+
+
+dialect = MySQLDialect_mysqlconnector_async
+
+registry.register("mysql.mysqlconnector_async", __name__, "MySQLDialect_mysqlconnector_async")
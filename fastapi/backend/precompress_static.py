@@ -0,0 +1,41 @@
+# 정적 파일의 사전 압축본(.br/.gz) 생성 스크립트
+#
+# StaticFiles(precompressed=True)는 script.js 옆에 script.js.br, script.js.gz가 있으면
+# 클라이언트의 Accept-Encoding에 맞춰 그 파일을 Content-Encoding, Vary 헤더와 함께 그대로 보냅니다.
+# 배포 전에 이 스크립트로 압축본을 만들어 두면 서버는 요청마다 압축할 필요가 없습니다.
+# 원본보다 오래된 압축본은 서버가 무시하고, 이 스크립트를 다시 실행하면 새로 만들어집니다.
+# (br은 brotli 패키지가 설치되어 있을 때만 만듭니다.)
+#
+# 실행 예 (fastapi 디렉터리에서):
+#   python -m backend.precompress_static
+#   python -m backend.precompress_static --directory frontend --encodings gzip
+
+import argparse
+import os
+
+from starlette.staticfiles import PRECOMPRESSED_SUFFIXES, precompress_directory
+
+FRONTEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "frontend")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="정적 파일의 .br/.gz 사전 압축본 생성")
+    parser.add_argument("--directory", default=FRONTEND_DIR, help="압축할 정적 파일 디렉터리")
+    parser.add_argument(
+        "--encodings",
+        nargs="+",
+        choices=list(PRECOMPRESSED_SUFFIXES),
+        default=list(PRECOMPRESSED_SUFFIXES),
+        help="만들 압축 형식",
+    )
+    parser.add_argument("--min-size", type=int, default=256, help="이보다 작은 파일(바이트)은 압축하지 않음")
+    args = parser.parse_args()
+
+    written = precompress_directory(args.directory, encodings=args.encodings, min_size=args.min_size)
+    for path in written:
+        print(f"{os.path.relpath(path, args.directory)}  {os.path.getsize(path)} bytes")
+    print(f"{len(written)}개 파일 생성")
+
+
+if __name__ == "__main__":
+    main()